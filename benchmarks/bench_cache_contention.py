@@ -0,0 +1,96 @@
+"""
+Cache contention microbenchmark.
+
+Measures borsapy.cache.Cache (an OrderedDict guarded by one lock) under a
+read-heavy mixed workload at 1, 8 and 32 threads, reporting throughput and
+its ratio to the single-thread run. ``--frame-rows`` sets the size of the
+DataFrames written alongside the reads (sizing them runs outside the lock).
+Each configuration runs ``--rounds`` times and the median is reported.
+
+Usage:
+    python benchmarks/bench_cache_contention.py [--seconds 2] [--write-ratio 0.05]
+        [--rounds 5] [--frame-rows 250]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pandas as pd  # noqa: E402
+
+from borsapy.cache import Cache  # noqa: E402
+
+THREAD_COUNTS = (1, 8, 32)
+KEYS = 2000
+
+
+def make_values(frame_rows: int = 250) -> list:
+    """A mix of small dicts (quotes) and DataFrames (history) like real traffic."""
+    frame = pd.DataFrame(
+        {col: range(frame_rows) for col in ("Open", "High", "Low", "Close", "Volume")},
+        index=pd.date_range("2024-01-01", periods=frame_rows, freq="min", name="Date"),
+    )
+    quote = {"symbol": "THYAO", "last": 300.5, "change": 1.2, "volume": 1_000_000}
+    return [quote, quote, quote, frame]
+
+
+def run(cache, threads: int, seconds: float, write_ratio: float, frame_rows: int) -> float:
+    """Return total operations per second across all threads."""
+    values = make_values(frame_rows)
+    for i in range(KEYS):
+        cache.set(f"bench:{i}", values[i % len(values)], 3600)
+
+    stop = threading.Event()
+    counts = [0] * threads
+
+    def worker(idx: int) -> None:
+        rng = random.Random(idx)
+        ops = 0
+        while not stop.is_set():
+            for _ in range(100):
+                key = f"bench:{rng.randrange(KEYS)}"
+                if rng.random() < write_ratio:
+                    cache.set(key, values[rng.randrange(len(values))], 3600)
+                else:
+                    cache.get(key)
+            ops += 100
+        counts[idx] = ops
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in workers:
+        t.join()
+    return sum(counts) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--write-ratio", type=float, default=0.05)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--frame-rows", type=int, default=250)
+    args = parser.parse_args()
+
+    limits = {"max_entries": KEYS // 2, "max_bytes": 512 * 1024 * 1024}
+    print(f"{'threads':>8} {'ops/s':>14} {'vs 1 thread':>12}")
+    single = None
+    for threads in THREAD_COUNTS:
+        ops = statistics.median(
+            run(Cache(**limits), threads, args.seconds, args.write_ratio, args.frame_rows)
+            for _ in range(args.rounds)
+        )
+        single = single or ops
+        print(f"{threads:>8} {ops:>14,.0f} {ops / single:>11.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Company search benchmark.
+
+Times the previous KAPProvider.search (iterrows over the whole list,
+normalizing every name per query) against the indexed search on a synthetic
+company list, for autocomplete-style queries: ticker prefixes, exact tickers,
+name fragments with and without Turkish characters, and misses. Results are
+checked to be identical.
+
+Usage:
+    python benchmarks/bench_company_search.py [--companies 3000] [--repeat 200]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pandas as pd  # noqa: E402
+
+from borsapy._providers.kap import KAPProvider, _CompanyIndex  # noqa: E402
+
+WORDS = [
+    "Türk", "Hava", "Yolları", "Garanti", "Bankası", "Akbank", "Holding", "Enerji",
+    "Çimento", "Gıda", "Şişe", "Cam", "Sanayi", "Ticaret", "Yatırım", "Ortaklığı",
+    "Gayrimenkul", "Elektrik", "Otomotiv", "Tekstil", "İnşaat", "Madencilik",
+    "Sigorta", "Teknoloji", "Kimya", "İlaç", "Petrol", "Demir", "Çelik", "Ulaşım",
+]
+CITIES = ["İstanbul", "Ankara", "İzmir", "Bursa", "Kocaeli", "Konya"]
+
+QUERIES = [
+    "T", "TH", "THY", "THYAO", "GAR", "GARAN", "AK", "akb", "banka", "bankasi",
+    "holding", "türk hava", "turk hava", "enerji", "çimento", "cimento", "sise cam",
+    "yatırım ortaklığı", "xyzq", "teknoloji a.s.",
+]
+
+
+def make_companies(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = random.Random(seed)
+    tickers = {"THYAO", "GARAN", "AKBNK"}
+    while len(tickers) < n:
+        tickers.add("".join(rng.choices("ABCDEFGHIJKLMNOPRSTUVYZ", k=rng.choice((4, 5)))))
+    rows = []
+    for ticker in sorted(tickers):
+        name = " ".join(rng.sample(WORDS, rng.randint(2, 5))) + " A.Ş."
+        rows.append({"ticker": ticker, "name": name.upper(), "city": rng.choice(CITIES)})
+    return pd.DataFrame(rows)
+
+
+def legacy_search(provider: KAPProvider, companies: pd.DataFrame, query: str) -> pd.DataFrame:
+    """KAPProvider.search before the index, verbatim apart from get_companies()."""
+    query_normalized = provider._normalize_text(query)
+    query_upper = query.upper()
+    results = []
+    for _, row in companies.iterrows():
+        score = 0
+        ticker = row["ticker"]
+        name = row["name"]
+        if ticker.upper() == query_upper:
+            score = 1000
+        elif ticker.upper().startswith(query_upper):
+            score = 500
+        elif query_normalized in provider._normalize_text(name):
+            score = 100
+        if score > 0:
+            results.append((score, row))
+    results.sort(key=lambda x: x[0], reverse=True)
+    if not results:
+        return pd.DataFrame(columns=["ticker", "name", "city"])
+    return pd.DataFrame([r[1] for r in results])
+
+
+def per_query_us(fn, queries: list[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for query in queries:
+            fn(query)
+    return (time.perf_counter() - start) / (repeat * len(queries)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--companies", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    companies = make_companies(args.companies)
+    provider = KAPProvider()
+    provider.get_companies = lambda: companies
+
+    for query in QUERIES:
+        expected = legacy_search(provider, companies, query)
+        got = provider.search(query)
+        assert expected["ticker"].tolist() == got["ticker"].tolist(), query
+
+    start = time.perf_counter()
+    _CompanyIndex(companies, provider._normalize_text)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    index = provider._search_index
+    legacy_repeat = max(1, args.repeat // 100)
+    legacy_us = per_query_us(lambda q: legacy_search(provider, companies, q), QUERIES, legacy_repeat)
+    search_us = per_query_us(provider.search, QUERIES, args.repeat)
+    lookup_us = per_query_us(
+        lambda q: index.search(q.upper(), provider._normalize_text(q)), QUERIES, args.repeat
+    )
+
+    print(f"companies: {len(companies)}, queries: {len(QUERIES)}, index build: {build_ms:.1f} ms\n")
+    print(f"{'legacy search':>22} {legacy_us:>10.1f} us/query")
+    print(f"{'indexed search':>22} {search_us:>10.1f} us/query  ({legacy_us / search_us:.0f}x)")
+    print(f"{'index lookup only':>22} {lookup_us:>10.1f} us/query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Paratic range-request benchmark.
+
+Compares the old request shape (``from=""``: full history, filtered while
+parsing) with bounded range requests for 5d, 1mo and 1y daily history. A
+synthetic 20-year daily series is served from an in-process transport that
+honours ``from``/``at``. Timings cover serving, JSON decoding and parsing
+in-process (no network latency), so they track payload size.
+
+Usage:
+    python benchmarks/bench_paratic_range.py [--years 20] [--repeat 5]
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx  # noqa: E402
+
+from borsapy._providers.paratic import ParaticProvider  # noqa: E402
+from borsapy.cache import Cache  # noqa: E402
+
+PERIODS = ("5d", "1mo", "1y")
+
+
+def make_bars(years: int) -> list[dict]:
+    """Daily bars in Paratic's payload shape, weekdays only."""
+    bars = []
+    day = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    first = day - timedelta(days=365 * years)
+    price = 10.0
+    while day >= first:
+        if day.weekday() < 5:
+            bars.append(
+                {
+                    "d": int(day.timestamp() * 1000),
+                    "o": price,
+                    "h": price * 1.02,
+                    "l": price * 0.98,
+                    "c": price * 1.01,
+                    "v": 1_250_000,
+                    "a": 1_250_000 * price,
+                }
+            )
+            price *= 0.9995
+        day -= timedelta(days=1)
+    bars.reverse()
+    return bars
+
+
+class RangeServer:
+    """Mock Paratic endpoint serving bars in [from, at], recording bytes sent."""
+
+    def __init__(self, bars: list[dict]):
+        self.bars = bars
+        self.bytes_sent = 0
+        self.requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        at = datetime.strptime(request.url.params["at"], "%Y%m%d%H%M%S").timestamp() * 1000
+        raw_from = request.url.params.get("from")
+        since = datetime.strptime(raw_from, "%Y%m%d%H%M%S").timestamp() * 1000 if raw_from else 0
+        body = json.dumps([b for b in self.bars if since <= b["d"] <= at]).encode()
+        self.bytes_sent += len(body)
+        self.requests += 1
+        return httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+
+
+def make_provider(server: RangeServer) -> ParaticProvider:
+    provider = ParaticProvider(cache=Cache())
+    provider._client = httpx.Client(transport=httpx.MockTransport(server))
+    return provider
+
+
+def legacy_history(provider: ParaticProvider, period: str) -> tuple[int, float]:
+    """The previous implementation: full history, range filter in the parser."""
+    end_dt = datetime.now()
+    start_dt = end_dt - timedelta(days=provider._get_period_days(period))
+    params = {
+        "a": "d",
+        "c": "THYAO",
+        "p": 1440,
+        "from": "",
+        "at": end_dt.strftime("%Y%m%d%H%M%S"),
+        "group": "f",
+    }
+    start = time.perf_counter()
+    data = provider._client.get(provider.BASE_URL, params=params).json()
+    df = provider._parse_response(data, start_dt, end_dt)
+    return len(df), time.perf_counter() - start
+
+
+def bounded_history(provider: ParaticProvider, period: str) -> tuple[int, float]:
+    """Current implementation on a cold cache."""
+    start = time.perf_counter()
+    df = provider.get_history("THYAO", period=period)
+    return len(df), time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--years", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    bars = make_bars(args.years)
+    print(f"Synthetic history: {len(bars)} daily bars\n")
+    print(f"{'period':>6} {'mode':>8} {'rows':>6} {'requests':>8} {'KB sent':>10} {'ms/call':>9}")
+    for period in PERIODS:
+        for mode, fn in (("legacy", legacy_history), ("bounded", bounded_history)):
+            timings = []
+            for _ in range(args.repeat):
+                server = RangeServer(bars)
+                rows, elapsed = fn(make_provider(server), period)
+                timings.append(elapsed)
+            print(
+                f"{period:>6} {mode:>8} {rows:>6} {server.requests:>8} "
+                f"{server.bytes_sent / 1024:>10.1f} {min(timings) * 1000:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+History parsing benchmark.
+
+Times the previous per-bar parsing loops against the shared columnar parser
+(borsapy._providers.columnar) for each provider's payload shape:
+
+- Paratic: list of {"d": ms, "o", "h", "l", "c", "v"} dicts
+  (paratic* mixes in null, unparseable and missing values; the old loop
+  skipped such bars, and the columnar parser must drop the same rows)
+- BtcTurk: TradingView arrays {"t": [s], "o": [...], ...}
+- TEFAS: list of {"TARIH": ms, "FIYAT", "PORTFOYBUYUKLUK", "KISISAYISI"} dicts
+- doviz.com: list of {"update_date": s, "open", "highest", "lowest", "close"} dicts
+
+JSON decoding is timed separately (json vs orjson when installed).
+
+Usage:
+    python benchmarks/bench_parse.py [--bars 2500 50000] [--repeat 5]
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pandas as pd  # noqa: E402
+
+from borsapy._providers import columnar  # noqa: E402
+from borsapy._providers.columnar import frame_from_arrays, frame_from_records  # noqa: E402
+
+
+def epochs(n: int, step: timedelta) -> list[float]:
+    start = datetime(2015, 1, 1)
+    return [(start + step * i).timestamp() for i in range(n)]
+
+
+def paratic_payload(n: int) -> list[dict]:
+    return [
+        {"d": int(t * 1000), "o": 10.0 + i % 7, "h": 11.0, "l": 9.5, "c": 10.5, "v": 1000 + i, "a": 1.0}
+        for i, t in enumerate(epochs(n, timedelta(minutes=5)))
+    ]
+
+
+def btcturk_payload(n: int) -> dict:
+    ts = [int(t) for t in epochs(n, timedelta(minutes=1))]
+    return {"s": "ok", "t": ts, "o": [1.0] * n, "h": [1.1] * n, "l": [0.9] * n, "c": [1.05] * n, "v": [3.2] * n}
+
+
+def tefas_payload(n: int) -> list[dict]:
+    return [
+        {"TARIH": str(int(t * 1000)), "FIYAT": 1.2345, "PORTFOYBUYUKLUK": 1.5e9, "KISISAYISI": 12000}
+        for t in epochs(n, timedelta(days=1))
+    ]
+
+
+def dovizcom_payload(n: int) -> list[dict]:
+    return [
+        {"update_date": t, "open": 30.1, "highest": 30.5, "lowest": 29.9, "close": 30.2}
+        for t in epochs(n, timedelta(hours=1))
+    ]
+
+
+# Previous implementations, kept verbatim in spirit for comparison
+
+
+def legacy_paratic(data: list[dict]) -> pd.DataFrame:
+    records = []
+    for item in data:
+        try:
+            dt = datetime.fromtimestamp(item["d"] / 1000)
+            records.append(
+                {
+                    "Date": dt,
+                    "Open": float(item.get("o", 0)),
+                    "High": float(item.get("h", 0)),
+                    "Low": float(item.get("l", 0)),
+                    "Close": float(item.get("c", 0)),
+                    "Volume": int(item.get("v", 0)),
+                }
+            )
+        except (TypeError, ValueError):
+            continue
+    return pd.DataFrame(records).set_index("Date").sort_index()
+
+
+def legacy_btcturk(data: dict) -> pd.DataFrame:
+    t, o, h, l, c, v = (data[k] for k in "tohlcv")
+    records = [
+        {
+            "Date": datetime.fromtimestamp(t[i]),
+            "Open": float(o[i]),
+            "High": float(h[i]),
+            "Low": float(l[i]),
+            "Close": float(c[i]),
+            "Volume": float(v[i]),
+        }
+        for i in range(len(t))
+    ]
+    return pd.DataFrame(records).set_index("Date").sort_index()
+
+
+def legacy_tefas(data: list[dict]) -> pd.DataFrame:
+    records = []
+    for item in data:
+        timestamp = int(item.get("TARIH", 0))
+        if timestamp > 0:
+            records.append(
+                {
+                    "Date": datetime.fromtimestamp(timestamp / 1000),
+                    "Price": float(item.get("FIYAT", 0)),
+                    "FundSize": float(item.get("PORTFOYBUYUKLUK", 0)),
+                    "Investors": int(item.get("KISISAYISI", 0)),
+                }
+            )
+    return pd.DataFrame(records).set_index("Date").sort_index()
+
+
+def legacy_dovizcom(data: list[dict]) -> pd.DataFrame:
+    records = [
+        {
+            "Date": datetime.fromtimestamp(item["update_date"]),
+            "Open": float(item.get("open", 0)),
+            "High": float(item.get("highest", 0)),
+            "Low": float(item.get("lowest", 0)),
+            "Close": float(item.get("close", 0)),
+        }
+        for item in data
+    ]
+    return pd.DataFrame(records).set_index("Date").sort_index()
+
+
+def columnar_paratic(data: list[dict]) -> pd.DataFrame:
+    return frame_from_records(
+        data, "d", {"o": "Open", "h": "High", "l": "Low", "c": "Close", "v": "Volume"}, int_columns=("Volume",)
+    )
+
+
+def columnar_btcturk(data: dict) -> pd.DataFrame:
+    cols = {"Open": data["o"], "High": data["h"], "Low": data["l"], "Close": data["c"], "Volume": data["v"]}
+    return frame_from_arrays(data["t"], cols, unit="s")
+
+
+def columnar_tefas(data: list[dict]) -> pd.DataFrame:
+    return frame_from_records(
+        data,
+        "TARIH",
+        {"FIYAT": "Price", "PORTFOYBUYUKLUK": "FundSize", "KISISAYISI": "Investors"},
+        int_columns=("Investors",),
+    )
+
+
+def columnar_dovizcom(data: list[dict]) -> pd.DataFrame:
+    return frame_from_records(
+        data, "update_date", {"open": "Open", "highest": "High", "lowest": "Low", "close": "Close"}, unit="s"
+    )
+
+
+def dirty_paratic_payload(n: int) -> list[dict]:
+    """Paratic bars with nulls, junk and missing fields mixed in."""
+    data = paratic_payload(n)
+    for i in range(0, n, 97):
+        data[i] = {"d": data[i]["d"], "o": None, "h": None, "l": None, "c": None, "v": None}
+    for i in range(13, n, 89):
+        data[i]["o"] = "x"
+    for i in range(29, n, 83):
+        del data[i]["h"]
+    return data
+
+
+CASES = {
+    "paratic*": (dirty_paratic_payload, legacy_paratic, columnar_paratic),
+    "paratic": (paratic_payload, legacy_paratic, columnar_paratic),
+    "btcturk": (btcturk_payload, legacy_btcturk, columnar_btcturk),
+    "tefas": (tefas_payload, legacy_tefas, columnar_tefas),
+    "dovizcom": (dovizcom_payload, legacy_dovizcom, columnar_dovizcom),
+}
+
+
+def best_of(fn, arg, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(arg)
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bars", type=int, nargs="+", default=[2500, 50000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"orjson: {'yes' if columnar.orjson is not None else 'no (stdlib json)'}\n")
+    print(f"{'provider':>9} {'bars':>7} {'json ms':>8} {'fast ms':>8} {'legacy ms':>10} {'columnar ms':>12} {'speedup':>8}")
+    for name, (make, legacy, fast) in CASES.items():
+        for n in args.bars:
+            payload = make(n)
+            raw = json.dumps(payload).encode()
+            pd.testing.assert_frame_equal(legacy(payload), fast(payload), check_freq=False, check_index_type=False)
+            json_ms = best_of(json.loads, raw, args.repeat)
+            fast_json_ms = best_of(columnar.loads, raw, args.repeat)
+            legacy_ms = best_of(legacy, payload, args.repeat)
+            columnar_ms = best_of(fast, payload, args.repeat)
+            print(
+                f"{name:>9} {n:>7} {json_ms:>8.1f} {fast_json_ms:>8.1f} {legacy_ms:>10.1f} "
+                f"{columnar_ms:>12.1f} {legacy_ms / columnar_ms:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+End-to-end provider benchmark on recorded HTTP fixtures.
+
+Runs the public API calls below against responses recorded once from the
+live sites (borsapy._providers.replay), so runs are offline, repeatable and
+comparable across commits. Each repetition starts from an empty cache; an
+artificial per-request latency stands in for the network.
+
+- Ticker.history (Paratic)
+- Fund.history 1y (TEFAS, chunked)
+- FX.bank_rates (doviz.com)
+- VIOP.futures (İş Yatırım)
+- economic_calendar (doviz.com)
+- screen_stocks (İş Yatırım screener)
+
+Wall time is end-to-end; CPU time is the process's (all threads), i.e. the
+parsing and bookkeeping cost once the network is taken out.
+
+Usage:
+    python benchmarks/bench_providers.py --record          # once, needs network
+    python benchmarks/bench_providers.py [--latency 0.05] [--repeat 5] [--no-limits]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import borsapy as bp  # noqa: E402
+from borsapy._providers.replay import use_fixtures  # noqa: E402
+from borsapy._providers.transport import HOST_POLICIES, configure_host  # noqa: E402
+from borsapy.cache import configure_disk_cache, get_cache  # noqa: E402
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+CASES = {
+    "Ticker.history 1y": lambda: bp.Ticker("THYAO").history(period="1y"),
+    "Fund.history 1y": lambda: bp.Fund("AAK").history(period="1y"),
+    "FX.bank_rates": lambda: bp.FX("USD").bank_rates,
+    "VIOP.futures": lambda: bp.VIOP().futures,
+    "economic_calendar": lambda: bp.economic_calendar(),
+    "screen_stocks": lambda: bp.screen_stocks(template="high_dividend"),
+}
+
+
+def run_case(fn, store, repeat: int) -> tuple[int, list[float], list[float]]:
+    walls, cpus = [], []
+    requests = 0
+    for _ in range(repeat):
+        get_cache().clear()
+        before = store.hits + store.recorded
+        wall, cpu = time.perf_counter(), time.process_time()
+        fn()
+        walls.append((time.perf_counter() - wall) * 1000)
+        cpus.append((time.process_time() - cpu) * 1000)
+        requests = store.hits + store.recorded - before
+    return requests, walls, cpus
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES)
+    parser.add_argument("--record", action="store_true", help="re-record fixtures from the live sites")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds added per replayed request")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-limits", action="store_true", help="disable per-host rate limits")
+    parser.add_argument("cases", nargs="*", help=f"subset of: {', '.join(CASES)}")
+    args = parser.parse_args()
+
+    # Keep the user's disk cache out of it (clear() would also wipe it)
+    configure_disk_cache(None)
+    overrides = {"rate": None} if args.no_limits else {}
+
+    mode = "record" if args.record else "replay"
+    repeat = 1 if args.record else args.repeat
+    print(f"fixtures: {args.fixtures} ({mode}, latency {args.latency * 1000:.0f} ms)\n")
+    print(f"{'case':<20} {'reqs':>5} {'best ms':>9} {'median ms':>10} {'cpu ms':>8}")
+    with use_fixtures(args.fixtures, mode=mode, latency=args.latency) as store:
+        for name, fn in CASES.items():
+            if args.cases and name not in args.cases:
+                continue
+            # Fresh rate limiters and breakers, so a missing fixture in one
+            # case doesn't open the circuit for the next
+            for host in list(HOST_POLICIES):
+                configure_host(host, **overrides)
+            misses = store.misses
+            try:
+                requests, walls, cpus = run_case(fn, store, repeat)
+            except Exception as e:
+                error = e
+            else:
+                error = None
+            # Providers may swallow the replay error, so check the store too
+            if store.misses > misses:
+                error = "missing fixtures (run with --record)"
+            if error is not None:
+                print(f"{name:<20} {error}")
+                continue
+            print(
+                f"{name:<20} {requests:>5} {min(walls):>9.1f} {statistics.median(walls):>10.1f} "
+                f"{statistics.median(cpus):>8.1f}"
+            )
+    if args.record:
+        print(f"\nrecorded {store.recorded} responses")
+
+
+if __name__ == "__main__":
+    main()
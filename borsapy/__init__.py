@@ -25,6 +25,10 @@ Examples:
     >>> bp.companies()
     >>> bp.search_companies("banka")
 
+    # Follow KAP disclosures (one request per refresh for all stocks)
+    >>> feed = bp.KAPFeed(["THYAO", "GARAN"])
+    >>> feed.news("THYAO")
+
     # Get crypto data
     >>> btc = bp.Crypto("BTCTRY")
     >>> btc.current  # Current price
@@ -58,8 +62,17 @@ Examples:
     >>> bp.screen_stocks(market_cap_min=1000, pe_max=15)
     >>> screener = bp.Screener()
     >>> screener.add_filter("dividend_yield", min=3).run()
+
+    # Fundamentals for the whole market (incremental refresh)
+    >>> f = bp.Fundamentals()
+    >>> f.refresh()
+    >>> f.ratios()  # P/E, P/B, net debt, TTM figures for every company
 """
 
+from borsapy import aio
+from borsapy._providers.base import warm_up
+from borsapy._providers.transport import configure_host
+from borsapy.aio import AsyncCrypto, AsyncFund, AsyncFX, AsyncTicker
 from borsapy.bond import Bond, bonds, risk_free_rate
 from borsapy.calendar import EconomicCalendar, economic_calendar
 from borsapy.crypto import Crypto, crypto_pairs
@@ -67,18 +80,29 @@ from borsapy.exceptions import (
     APIError,
     AuthenticationError,
     BorsapyError,
+    CircuitOpenError,
     DataNotAvailableError,
     InvalidIntervalError,
     InvalidPeriodError,
     RateLimitError,
     TickerNotFoundError,
 )
-from borsapy.fund import Fund, compare_funds, screen_funds, search_funds
+from borsapy.fund import (
+    Fund,
+    compare_funds,
+    fund_history_matrix,
+    fund_risk_metrics,
+    screen_funds,
+    search_funds,
+)
+from borsapy.fundamentals import Fundamentals
 from borsapy.fx import FX, banks, metal_institutions
 from borsapy.index import Index, index, indices
 from borsapy.inflation import Inflation
 from borsapy.market import companies, search_companies
-from borsapy.multi import Tickers, download
+from borsapy.metrics import start_stats_reporter, stats, stop_stats_reporter
+from borsapy.multi import Tickers, download, download_financials
+from borsapy.news import KAPFeed
 from borsapy.screener import Screener, screen_stocks, screener_criteria, sectors, stock_indices
 from borsapy.ticker import Ticker
 from borsapy.viop import VIOP
@@ -99,6 +123,14 @@ __all__ = [
     "Bond",
     "EconomicCalendar",
     "Screener",
+    "KAPFeed",
+    "Fundamentals",
+    # Async classes (see borsapy.aio for run/gather)
+    "AsyncTicker",
+    "AsyncFund",
+    "AsyncFX",
+    "AsyncCrypto",
+    "aio",
     # Market functions
     "companies",
     "search_companies",
@@ -108,7 +140,10 @@ __all__ = [
     "search_funds",
     "screen_funds",
     "compare_funds",
+    "fund_history_matrix",
+    "fund_risk_metrics",
     "download",
+    "download_financials",
     "index",
     "indices",
     # Bond functions
@@ -121,6 +156,12 @@ __all__ = [
     "screener_criteria",
     "sectors",
     "stock_indices",
+    # Diagnostics
+    "stats",
+    "start_stats_reporter",
+    "stop_stats_reporter",
+    "configure_host",
+    "warm_up",
     # Exceptions
     "BorsapyError",
     "TickerNotFoundError",
@@ -128,6 +169,7 @@ __all__ = [
     "APIError",
     "AuthenticationError",
     "RateLimitError",
+    "CircuitOpenError",
     "InvalidPeriodError",
     "InvalidIntervalError",
 ]
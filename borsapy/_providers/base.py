@@ -1,10 +1,97 @@
 """Base provider class for all data providers."""
 
-from typing import Any
+import asyncio
+import contextvars
+import threading
+import time
+import weakref
+from collections.abc import Awaitable, Callable, Generator, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any, TypeVar
 
 import httpx
 
-from borsapy.cache import Cache, get_cache
+from borsapy._providers.transport import (
+    HOST_POLICIES,
+    RETRY,
+    AsyncInstrumentedTransport,
+    AsyncPooledTransport,
+    InstrumentedTransport,
+    PooledTransport,
+    get_pool,
+)
+from borsapy.cache import TTL, Cache, get_cache
+
+T = TypeVar("T")
+P = TypeVar("P", bound="BaseProvider")
+
+
+@dataclass(frozen=True)
+class Call:
+    """
+    One HTTP request yielded by a request generator.
+
+    Fetches shared by the sync and async providers are written as generators
+    that yield a Call for each request and receive the httpx.Response (or
+    have the transport error raised at the ``yield``). BaseProvider._run and
+    AsyncBaseProvider._run send the requests.
+    """
+
+    method: str
+    url: str
+    params: dict[str, Any] | None = None
+    data: dict[str, Any] | None = None
+    headers: dict[str, str] | None = None
+    delay: float = 0.0  # Seconds to wait before sending
+    retry: bool = False  # Safe to retry although not idempotent (e.g. a POST query)
+
+
+@dataclass(frozen=True)
+class Batch:
+    """
+    Requests yielded together by a request generator, to be sent concurrently.
+
+    The generator receives a list with an httpx.Response or the transport
+    error for each call, in call order, so it can retry just the failures.
+    Per-host rate limits still apply to each request.
+    """
+
+    calls: tuple[Call, ...]
+    concurrency: int = 4  # Max requests in flight
+
+
+# Request generator returning T (see Call and Batch)
+Steps = Generator[Call | Batch, Any, T]
+
+
+@dataclass
+class _Validated:
+    """A parsed response body with the validators to revalidate it (see _get_revalidated)."""
+
+    value: Any
+    etag: str | None
+    last_modified: str | None
+    checked_at: float  # When the server last confirmed the value (time.time())
+
+
+# Cache keys with a background refresh in progress (shared by all providers)
+_refreshing: set[str] = set()
+_refreshing_lock = threading.Lock()
+
+
+class _Flight:
+    """An in-progress fetch that concurrent callers for the same key wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+# In-flight fetches keyed by (cache id, cache key), shared by all providers
+_flights: dict[tuple[int, str], _Flight] = {}
+_flights_lock = threading.Lock()
 
 
 class BaseProvider:
@@ -28,8 +115,16 @@ class BaseProvider:
             timeout: HTTP request timeout in seconds.
             cache: Cache instance to use. If None, uses global cache.
         """
-        self._client = httpx.Client(timeout=timeout, headers=self.DEFAULT_HEADERS)
-        self._cache = cache or get_cache()
+        self._client = self._create_client(timeout)
+        self._cache = cache if cache is not None else get_cache()
+
+    def _create_client(self, timeout: float) -> httpx.Client:
+        """Create the HTTP client (AsyncBaseProvider returns an AsyncClient)."""
+        return httpx.Client(
+            timeout=timeout,
+            headers=self.DEFAULT_HEADERS,
+            transport=InstrumentedTransport(PooledTransport(), type(self).__name__),
+        )
 
     def close(self) -> None:
         """Close the HTTP client."""
@@ -68,6 +163,7 @@ class BaseProvider:
         data: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
+        retry: bool = False,
     ) -> httpx.Response:
         """
         Make a POST request.
@@ -77,18 +173,484 @@ class BaseProvider:
             data: Form data.
             json: JSON data.
             headers: Request headers.
+            retry: Retry failures like an idempotent request (for read-only queries).
 
         Returns:
             HTTP response.
         """
-        response = self._client.post(url, data=data, json=json, headers=headers)
+        response = self._client.post(
+            url, data=data, json=json, headers=headers, extensions=RETRY if retry else None
+        )
         response.raise_for_status()
         return response
 
-    def _cache_get(self, key: str) -> Any | None:
-        """Get a value from cache."""
-        return self._cache.get(key)
+    def _run(self, steps: Steps[T]) -> T:
+        """
+        Send the requests yielded by a request generator and return its result.
+
+        Transport errors are raised inside the generator at the ``yield`` so it
+        can handle them as if it had called the client itself.
+        """
+        response: httpx.Response | list | None = None
+        error: Exception | None = None
+        try:
+            while True:
+                call = steps.throw(error) if error is not None else steps.send(response)
+                response, error = None, None
+                if isinstance(call, Batch):
+                    response = self._send_batch(call)
+                    continue
+                try:
+                    response = self._send(call)
+                except Exception as e:
+                    error = e
+        except StopIteration as stop:
+            return stop.value
+
+    def _send(self, call: Call) -> httpx.Response:
+        if call.delay:
+            time.sleep(call.delay)
+        return self._client.request(
+            call.method,
+            call.url,
+            params=call.params,
+            data=call.data,
+            headers=call.headers,
+            extensions=RETRY if call.retry else None,
+        )
+
+    def _send_batch(self, batch: Batch) -> list[httpx.Response | Exception]:
+        """Send a Batch from worker threads, returning responses or errors in call order."""
+
+        def send(call: Call) -> httpx.Response | Exception:
+            try:
+                return self._send(call)
+            except Exception as e:
+                return e
+
+        workers = max(1, min(batch.concurrency, len(batch.calls)))
+        if workers == 1:
+            return [send(call) for call in batch.calls]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="borsapy-batch") as pool:
+            # Each worker runs in a copy of the caller's context so rate_limited() applies
+            futures = [pool.submit(contextvars.copy_context().run, send, call) for call in batch.calls]
+            return [future.result() for future in futures]
+
+    def _get_revalidated(
+        self,
+        key: str,
+        url: str,
+        parse: Callable[[httpx.Response], Any],
+        ttl: int,
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        """
+        GET a large, slow-changing resource and cache its parsed value.
+
+        The value is served from cache for ``ttl`` seconds. After that the
+        request is sent with If-None-Match / If-Modified-Since from the last
+        response; a 304 keeps the cached value without downloading or parsing
+        the body again. Values and validators are kept for TTL.REVALIDATED,
+        so with a disk cache they survive restarts. If revalidation fails the
+        cached value is returned and the next call tries again.
+
+        Args:
+            key: Cache key.
+            url: Resource URL.
+            parse: Turns a 200 response into the value to cache. Exceptions
+                propagate and nothing is cached.
+            ttl: Seconds the value is used without asking the server.
+            headers: Extra request headers.
+            params: Query parameters.
+        """
+        record = self._cache.get(key)
+        if isinstance(record, _Validated) and time.time() - record.checked_at < ttl:
+            return record.value
+
+        return self._single_flight(
+            key,
+            lambda: self._run(self._revalidate_steps(key, url, parse, ttl, headers, params)),
+            check_cache=False,
+        )
+
+    def _revalidate_steps(
+        self,
+        key: str,
+        url: str,
+        parse: Callable[[httpx.Response], Any],
+        ttl: int,
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> Steps[Any]:
+        """Request generator for _get_revalidated (see Call)."""
+        record = self._cache.get(key, track=False)
+        if not isinstance(record, _Validated):
+            record = None
+        elif time.time() - record.checked_at < ttl:
+            # Revalidated by another caller while we waited
+            return record.value
+
+        request_headers = dict(headers or {})
+        if record is not None:
+            if record.etag:
+                request_headers["If-None-Match"] = record.etag
+            if record.last_modified:
+                request_headers["If-Modified-Since"] = record.last_modified
+
+        try:
+            response = yield Call("GET", url, params=params, headers=request_headers)
+            if response.status_code == 304 and record is not None:
+                record = replace(record, checked_at=time.time())
+            else:
+                response.raise_for_status()
+                record = _Validated(
+                    value=parse(response),
+                    etag=response.headers.get("etag"),
+                    last_modified=response.headers.get("last-modified"),
+                    checked_at=time.time(),
+                )
+        except Exception:
+            if record is None:
+                raise
+            return record.value
+
+        self._cache_set(key, record, TTL.REVALIDATED)
+        return record.value
+
+    def _cache_get(self, key: str, refresh: Callable[[], Any] | None = None) -> Any | None:
+        """
+        Get a value from cache.
+
+        With ``refresh``, an expired value still inside its grace window (see
+        ``_cache_set(stale=...)``) is returned immediately and ``refresh`` is run
+        once in a background thread to update the entry. Stale dict values are
+        returned as a copy with ``"stale": True``.
+
+        Args:
+            key: Cache key.
+            refresh: Callable that fetches the value and stores it in the cache.
+        """
+        if refresh is None:
+            return self._cache.get(key)
+
+        hit = self._cache.get_stale(key)
+        if hit is None:
+            return None
+        value, is_stale = hit
+        if not is_stale:
+            return value
+
+        self._refresh_in_background(key, lambda: self._single_flight(key, refresh))
+        if isinstance(value, dict):
+            value = {**value, "stale": True}
+        return value
+
+    def _single_flight(
+        self, key: str, fetch: Callable[[], Any], check_cache: bool = True
+    ) -> Any:
+        """
+        Run ``fetch`` once for concurrent cache misses on ``key``.
+
+        The first caller runs ``fetch`` (which is expected to populate the
+        cache); callers arriving while it is in flight wait and receive the same
+        result or exception instead of sending an identical request.
+
+        Args:
+            key: Cache key the fetch populates.
+            fetch: Callable that fetches, caches and returns the value.
+            check_cache: Return a value already cached under ``key`` instead of
+                fetching. Pass False when ``fetch`` updates an existing entry.
+
+        Returns:
+            The fetched (or freshly cached) value.
+        """
+        flight_key = (id(self._cache), key)
+        with _flights_lock:
+            flight = _flights.get(flight_key)
+            leader = flight is None
+            if leader:
+                flight = _flights[flight_key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            # A previous flight may have filled the cache since our caller missed
+            result = self._cache.get(key, track=False) if check_cache else None
+            if result is None:
+                result = fetch()
+            flight.result = result
+            return result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with _flights_lock:
+                del _flights[flight_key]
+            flight.done.set()
+
+    def _cache_set(self, key: str, value: Any, ttl: int, stale: int = 0) -> None:
+        """Set a value in cache, optionally servable for ``stale`` seconds past its TTL."""
+        self._cache.set(key, value, ttl, stale_seconds=stale)
+
+    @staticmethod
+    def _refresh_in_background(key: str, refresh: Callable[[], Any]) -> None:
+        """Run ``refresh`` in a daemon thread unless one is already running for ``key``."""
+        with _refreshing_lock:
+            if key in _refreshing:
+                return
+            _refreshing.add(key)
+
+        def run() -> None:
+            try:
+                refresh()
+            except Exception:
+                # Keep serving the stale value; the next caller after the grace
+                # window fetches synchronously and sees the error.
+                pass
+            finally:
+                with _refreshing_lock:
+                    _refreshing.discard(key)
+
+        threading.Thread(target=run, name=f"borsapy-refresh-{key}", daemon=True).start()
+
+
+# In-flight async fetches keyed by (event loop id, cache id, cache key)
+_async_flights: dict[tuple[int, int, str], asyncio.Future] = {}
+
+# Result of a flight whose leading task was cancelled; its waiters retry
+_LEADER_CANCELLED = object()
+
+# Background refresh tasks (referenced here so they aren't garbage collected)
+_refresh_tasks: set[asyncio.Task] = set()
+
+
+class AsyncBaseProvider(BaseProvider):
+    """
+    Base class for asyncio providers.
+
+    Combine with a sync provider (``class AsyncXProvider(AsyncBaseProvider,
+    XProvider)``) and override its public methods as coroutines that drive the
+    same request generators with ``await self._run(...)``. The cache is shared
+    with the sync providers. Methods that are not overridden use the sync
+    client API and cannot be called on an async provider.
+
+    An AsyncClient is bound to the event loop it is used on, so get instances
+    with async_provider() rather than constructing them directly.
+    """
+
+    def _create_client(self, timeout: float) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=timeout,
+            headers=self.DEFAULT_HEADERS,
+            transport=AsyncInstrumentedTransport(AsyncPooledTransport(), type(self).__name__),
+        )
+
+    def close(self) -> None:
+        raise TypeError("Use 'await provider.aclose()' to close an async provider")
+
+    async def aclose(self) -> None:
+        """Close the HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def _run(self, steps: Steps[T]) -> T:
+        """Async version of BaseProvider._run."""
+        response: httpx.Response | list | None = None
+        error: Exception | None = None
+        try:
+            while True:
+                call = steps.throw(error) if error is not None else steps.send(response)
+                response, error = None, None
+                if isinstance(call, Batch):
+                    response = await self._send_batch(call)
+                    continue
+                try:
+                    response = await self._send(call)
+                except Exception as e:
+                    error = e
+        except StopIteration as stop:
+            return stop.value
+
+    async def _send(self, call: Call) -> httpx.Response:
+        if call.delay:
+            await asyncio.sleep(call.delay)
+        return await self._client.request(
+            call.method,
+            call.url,
+            params=call.params,
+            data=call.data,
+            headers=call.headers,
+            extensions=RETRY if call.retry else None,
+        )
+
+    async def _send_batch(self, batch: Batch) -> list[httpx.Response | Exception]:
+        """Async version of BaseProvider._send_batch."""
+        semaphore = asyncio.Semaphore(max(1, batch.concurrency))
+
+        async def send(call: Call) -> httpx.Response | Exception:
+            async with semaphore:
+                try:
+                    return await self._send(call)
+                except Exception as e:
+                    return e
+
+        return list(await asyncio.gather(*(send(call) for call in batch.calls)))
+
+    def _cache_get(
+        self, key: str, refresh: Callable[[], Awaitable[Any]] | None = None
+    ) -> Any | None:
+        """
+        Get a value from cache.
+
+        Same as BaseProvider._cache_get, except ``refresh`` returns an awaitable
+        and runs as a task on the current event loop.
+        """
+        if refresh is None:
+            return self._cache.get(key)
+
+        hit = self._cache.get_stale(key)
+        if hit is None:
+            return None
+        value, is_stale = hit
+        if not is_stale:
+            return value
+
+        self._refresh_in_task(key, lambda: self._single_flight(key, refresh))
+        if isinstance(value, dict):
+            value = {**value, "stale": True}
+        return value
+
+    async def _single_flight(
+        self, key: str, fetch: Callable[[], Awaitable[T]], check_cache: bool = True
+    ) -> T:
+        """
+        Await ``fetch`` once for concurrent cache misses on ``key``.
+
+        Same as BaseProvider._single_flight, for tasks on one event loop. If
+        the leading task is cancelled, its waiters aren't: one of them takes
+        over and runs its own ``fetch``.
+        """
+        flight_key = (id(asyncio.get_running_loop()), id(self._cache), key)
+        flight = _async_flights.get(flight_key)
+        while flight is not None:
+            # shield() so a cancelled waiter doesn't cancel the leader's fetch
+            result = await asyncio.shield(flight)
+            if result is not _LEADER_CANCELLED:
+                return result
+            flight = _async_flights.get(flight_key)
+
+        flight = _async_flights[flight_key] = asyncio.get_running_loop().create_future()
+        try:
+            result = self._cache.get(key, track=False) if check_cache else None
+            if result is None:
+                result = await fetch()
+            flight.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            # Wake the waiters so the first of them leads a new flight
+            flight.set_result(_LEADER_CANCELLED)
+            raise
+        except BaseException as e:
+            flight.set_exception(e)
+            # Mark retrieved so an unawaited failure isn't logged by asyncio
+            flight.exception()
+            raise
+        finally:
+            del _async_flights[flight_key]
+
+    @staticmethod
+    def _refresh_in_task(key: str, refresh: Callable[[], Awaitable[Any]]) -> None:
+        """Run ``refresh`` as a task unless a refresh is already running for ``key``."""
+        with _refreshing_lock:
+            if key in _refreshing:
+                return
+            _refreshing.add(key)
+
+        async def run() -> None:
+            try:
+                await refresh()
+            except Exception:
+                pass
+            finally:
+                with _refreshing_lock:
+                    _refreshing.discard(key)
+
+        task = asyncio.get_running_loop().create_task(run(), name=f"borsapy-refresh-{key}")
+        _refresh_tasks.add(task)
+        task.add_done_callback(_refresh_tasks.discard)
+
+
+# Async provider instances per event loop
+_async_providers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[type, AsyncBaseProvider]]" = (
+    weakref.WeakKeyDictionary()
+)
+_async_providers_lock = threading.Lock()
+
+
+def async_provider(cls: type[P]) -> P:
+    """
+    Get the instance of an async provider class for the running event loop.
+
+    Raises:
+        RuntimeError: If called outside a running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    with _async_providers_lock:
+        providers = _async_providers.setdefault(loop, {})
+        if cls not in providers:
+            providers[cls] = cls()
+        return providers[cls]
+
+
+def warm_up(hosts: Iterable[str] | None = None, timeout: float = 5.0) -> dict[str, float | str]:
+    """
+    Open connections to upstream hosts ahead of first use.
+
+    Sends a HEAD request to each host in parallel so the DNS lookup, TCP
+    connect and TLS handshake are done (and the connection is kept alive in
+    the shared pool) before the first real request.
+
+    Args:
+        hosts: Host names. Defaults to all hosts in HOST_POLICIES.
+        timeout: Per-host timeout in seconds.
+
+    Returns:
+        Host -> seconds taken, or the error message if it failed.
+
+    Examples:
+        >>> import borsapy as bp
+        >>> bp.warm_up()
+        {'www.tefas.gov.tr': 0.21, 'api.doviz.com': 0.12, ...}
+    """
+    hosts = list(hosts) if hosts is not None else list(HOST_POLICIES)
+
+    def connect(host: str) -> float | str:
+        start = time.perf_counter()
+        request = httpx.Request(
+            "HEAD",
+            f"https://{host}/",
+            headers={"User-Agent": BaseProvider.DEFAULT_HEADERS["User-Agent"]},
+            extensions={"timeout": httpx.Timeout(timeout).as_dict()},
+        )
+        try:
+            response = get_pool(host).handle_request(request)
+            response.read()
+            response.close()
+        except Exception as e:
+            return str(e) or type(e).__name__
+        return round(time.perf_counter() - start, 3)
 
-    def _cache_set(self, key: str, value: Any, ttl: int) -> None:
-        """Set a value in cache."""
-        self._cache.set(key, value, ttl)
+    if not hosts:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(len(hosts), 16), thread_name_prefix="borsapy-warmup") as pool:
+        return dict(zip(hosts, pool.map(connect, hosts), strict=True))
@@ -5,7 +5,8 @@ from typing import Any
 
 import pandas as pd
 
-from borsapy._providers.base import BaseProvider
+from borsapy._providers.base import AsyncBaseProvider, BaseProvider, Call, Steps, async_provider
+from borsapy._providers.columnar import frame_from_arrays, loads
 from borsapy.cache import TTL
 from borsapy.exceptions import APIError, DataNotAvailableError
 
@@ -51,11 +52,16 @@ class BtcTurkProvider(BaseProvider):
         if cached is not None:
             return cached
 
+        return self._run(self._ticker_steps(pair))
+
+    def _ticker_steps(self, pair: str) -> Steps[dict[str, Any]]:
+        """Fetch ticker data from the API and cache it (see base.Call)."""
+        cache_key = f"btcturk:ticker:{pair}"
         try:
             url = f"{self.BASE_URL}/ticker"
             params = {"pairSymbol": pair}
 
-            response = self._client.get(url, params=params)
+            response = yield Call("GET", url, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -141,38 +147,25 @@ class BtcTurkProvider(BaseProvider):
 
             response = self._client.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = loads(response.content)
 
             # Graph API returns TradingView format
             status = data.get("s", "error")
             if status != "ok":
                 raise DataNotAvailableError(f"No data available for {pair}")
 
-            # Parse TradingView format
-            timestamps = data.get("t", [])
-            opens = data.get("o", [])
-            highs = data.get("h", [])
-            lows = data.get("l", [])
-            closes = data.get("c", [])
-            volumes = data.get("v", [])
-
-            records = []
-            for i in range(len(timestamps)):
-                records.append(
-                    {
-                        "Date": datetime.fromtimestamp(timestamps[i]),
-                        "Open": float(opens[i]) if i < len(opens) else 0.0,
-                        "High": float(highs[i]) if i < len(highs) else 0.0,
-                        "Low": float(lows[i]) if i < len(lows) else 0.0,
-                        "Close": float(closes[i]) if i < len(closes) else 0.0,
-                        "Volume": float(volumes[i]) if i < len(volumes) else 0.0,
-                    }
-                )
-
-            df = pd.DataFrame(records)
-            if not df.empty:
-                df.set_index("Date", inplace=True)
-                df.sort_index(inplace=True)
+            # Parse TradingView format (already columnar)
+            df = frame_from_arrays(
+                data.get("t", []),
+                {
+                    "Open": data.get("o", []),
+                    "High": data.get("h", []),
+                    "Low": data.get("l", []),
+                    "Close": data.get("c", []),
+                    "Volume": data.get("v", []),
+                },
+                unit="s",
+            )
 
             self._cache_set(cache_key, df, TTL.OHLCV_HISTORY)
             return df
@@ -228,3 +221,23 @@ def get_btcturk_provider() -> BtcTurkProvider:
     if _provider is None:
         _provider = BtcTurkProvider()
     return _provider
+
+
+class AsyncBtcTurkProvider(AsyncBaseProvider, BtcTurkProvider):
+    """Asyncio version of BtcTurkProvider's get_ticker."""
+
+    async def get_ticker(self, pair: str) -> dict[str, Any]:
+        """Async version of BtcTurkProvider.get_ticker."""
+        pair = pair.upper()
+
+        cache_key = f"btcturk:ticker:{pair}"
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        return await self._run(self._ticker_steps(pair))
+
+
+def get_async_btcturk_provider() -> AsyncBtcTurkProvider:
+    """Get the BtcTurk async provider for the running event loop."""
+    return async_provider(AsyncBtcTurkProvider)
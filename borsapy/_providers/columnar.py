@@ -0,0 +1,164 @@
+"""Vectorized parsing of history payloads into DataFrames."""
+
+import json
+import os
+from collections.abc import Mapping, Sequence
+from datetime import datetime, tzinfo
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def loads(content: bytes | str) -> Any:
+    """Decode JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+@lru_cache(maxsize=1)
+def local_timezone() -> tzinfo:
+    """
+    The system time zone, as used by ``datetime.fromtimestamp``.
+
+    Prefers a named zone (tzlocal if installed, then ``TZ`` or /etc/localtime)
+    so historical DST changes are honoured; falls back to the current offset.
+    """
+    try:
+        import tzlocal
+
+        return tzlocal.get_localzone()
+    except Exception:
+        pass
+
+    from zoneinfo import ZoneInfo
+
+    name = os.environ.get("TZ", "").lstrip(":")
+    if not name:
+        target = os.path.realpath("/etc/localtime")
+        if "zoneinfo/" in target:
+            name = target.split("zoneinfo/", 1)[1]
+    if name:
+        try:
+            return ZoneInfo(name)
+        except Exception:
+            pass
+    return datetime.now().astimezone().tzinfo
+
+
+def epoch_to_index(values: Any, unit: str = "ms", name: str = "Date") -> pd.DatetimeIndex:
+    """Convert epoch timestamps to a naive local-time DatetimeIndex."""
+    index = pd.to_datetime(np.asarray(values, dtype=np.int64), unit=unit, utc=True)
+    return index.tz_convert(local_timezone()).tz_localize(None).rename(name)
+
+
+def empty_frame(columns: Sequence[str]) -> pd.DataFrame:
+    """An empty frame with the given columns (the shape callers expect for no data)."""
+    return pd.DataFrame(columns=list(columns))
+
+
+def _to_float(values: list) -> np.ndarray:
+    """Numbers, numeric strings, None or junk to float64 (NaN where unparseable)."""
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        return pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(np.float64)
+
+
+def frame_from_arrays(
+    timestamps: Sequence,
+    columns: Mapping[str, Sequence],
+    unit: str = "ms",
+    int_columns: Sequence[str] = (),
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> pd.DataFrame:
+    """
+    Build a Date-indexed frame from column arrays.
+
+    Rows with a null or unparseable value, or without a valid (positive)
+    timestamp, are dropped, as are rows outside [start, end]; values missing
+    from the payload altogether (absent fields, short arrays) count as 0. The
+    result is sorted by date.
+
+    Args:
+        timestamps: Epoch timestamps.
+        columns: Output column name -> values (shorter arrays are padded with 0).
+        unit: Timestamp unit ("s" or "ms").
+        int_columns: Columns to return as int64.
+        start: Drop rows before this (local time).
+        end: Drop rows after this (local time).
+    """
+    ts = _to_float(list(timestamps))
+    n = len(ts)
+    if not n:
+        return empty_frame(columns)
+
+    data = {}
+    for col, values in columns.items():
+        arr = np.zeros(n, dtype=np.float64)
+        parsed = _to_float(list(values[:n]))
+        arr[: len(parsed)] = parsed
+        data[col] = arr
+
+    valid = np.isfinite(ts) & (ts > 0)
+    for arr in data.values():
+        valid &= ~np.isnan(arr)
+    if not valid.all():
+        ts = ts[valid]
+        data = {col: arr[valid] for col, arr in data.items()}
+    for col in int_columns:
+        if col in data:
+            data[col] = data[col].astype(np.int64)
+
+    index = epoch_to_index(ts, unit=unit)
+    mask = np.ones(len(index), dtype=bool)
+    if start is not None:
+        mask &= index >= start
+    if end is not None:
+        mask &= index <= end
+
+    df = pd.DataFrame({col: arr[mask] for col, arr in data.items()}, index=index[mask])
+    if not df.index.is_monotonic_increasing:
+        df.sort_index(inplace=True)
+    return df
+
+
+def frame_from_records(
+    records: Sequence[Mapping[str, Any]],
+    time_key: str,
+    columns: Mapping[str, str],
+    unit: str = "ms",
+    int_columns: Sequence[str] = (),
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> pd.DataFrame:
+    """
+    Build a Date-indexed frame from a list of per-bar dicts.
+
+    Each field is pulled out once into a column array, so no per-row
+    datetime or dict objects are created.
+
+    Args:
+        records: Payload rows, e.g. ``[{"d": 1700000000000, "c": 1.5, ...}]``.
+        time_key: Field holding the epoch timestamp.
+        columns: Payload field -> output column name.
+        unit: Timestamp unit ("s" or "ms").
+        int_columns: Output columns to return as int64.
+        start: Drop rows before this (local time).
+        end: Drop rows after this (local time).
+    """
+    if not records:
+        return empty_frame(columns.values())
+    timestamps = [r.get(time_key) for r in records]
+    arrays = {name: [r.get(field, 0) for r in records] for field, name in columns.items()}
+    return frame_from_arrays(
+        timestamps, arrays, unit=unit, int_columns=int_columns, start=start, end=end
+    )
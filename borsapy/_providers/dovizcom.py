@@ -8,8 +8,9 @@ from typing import Any
 import pandas as pd
 from bs4 import BeautifulSoup
 
-from borsapy._providers.base import BaseProvider
-from borsapy.cache import TTL
+from borsapy._providers.base import AsyncBaseProvider, BaseProvider, Call, Steps, async_provider
+from borsapy._providers.columnar import frame_from_records, loads
+from borsapy.cache import TTL, StaleTTL
 from borsapy.exceptions import APIError, DataNotAvailableError
 
 
@@ -181,14 +182,14 @@ class DovizcomProvider(BaseProvider):
         self._token: str | None = None
         self._token_expiry: float = 0
 
-    def _get_token(self) -> str:
+    def _token_steps(self) -> Steps[str]:
         """Get valid Bearer token."""
         if self._token and time.time() < self._token_expiry:
             return self._token
 
         # Try to extract token from website
         try:
-            token = self._extract_token()
+            token = yield from self._extract_token_steps()
             if token:
                 self._token = token
                 self._token_expiry = time.time() + self.TOKEN_EXPIRY
@@ -199,10 +200,10 @@ class DovizcomProvider(BaseProvider):
         # Use fallback
         return self.FALLBACK_TOKEN
 
-    def _extract_token(self) -> str | None:
+    def _extract_token_steps(self) -> Steps[str | None]:
         """Extract token from doviz.com website."""
         try:
-            response = self._client.get("https://www.doviz.com/")
+            response = yield Call("GET", "https://www.doviz.com/")
             html = response.text
 
             # Look for 64-char hex token
@@ -220,14 +221,14 @@ class DovizcomProvider(BaseProvider):
         except Exception:
             return None
 
-    def _get_headers(self, asset: str) -> dict[str, str]:
+    def _headers_steps(self, asset: str) -> Steps[dict[str, str]]:
         """Get request headers with token."""
         if asset in ["gram-altin", "gumus", "ons"]:
             origin = "https://altin.doviz.com"
         else:
             origin = "https://www.doviz.com"
 
-        token = self._get_token()
+        token = yield from self._token_steps()
 
         return {
             "Accept": "*/*",
@@ -245,7 +246,8 @@ class DovizcomProvider(BaseProvider):
             asset: Asset code (USD, EUR, gram-altin, BRENT, etc.)
 
         Returns:
-            Dictionary with current price data.
+            Dictionary with current price data. ``stale`` is True when the
+            price is past its TTL and a refresh is running in the background.
         """
         asset = asset.upper() if asset.upper() in self.SUPPORTED_ASSETS else asset
 
@@ -255,15 +257,24 @@ class DovizcomProvider(BaseProvider):
             )
 
         cache_key = f"dovizcom:current:{asset}"
-        cached = self._cache_get(cache_key)
+        cached = self._cache_get(cache_key, refresh=lambda: self._fetch_current(asset))
         if cached:
             return cached
 
+        return self._single_flight(cache_key, lambda: self._fetch_current(asset))
+
+    def _fetch_current(self, asset: str) -> dict[str, Any]:
+        """Fetch the current price from the API and cache it."""
+        return self._run(self._current_steps(asset))
+
+    def _current_steps(self, asset: str) -> Steps[dict[str, Any]]:
+        """Request generator for _fetch_current (see base.Call)."""
+        cache_key = f"dovizcom:current:{asset}"
         try:
             if asset in self.FUEL_ASSETS:
-                data = self._get_from_archive(asset, days=7)
+                data = yield from self._archive_latest_steps(asset, days=7)
             else:
-                data = self._get_from_daily(asset)
+                data = yield from self._daily_latest_steps(asset)
 
             if not data:
                 raise DataNotAvailableError(f"No data for {asset}")
@@ -275,9 +286,10 @@ class DovizcomProvider(BaseProvider):
                 "high": float(data.get("highest", 0)),
                 "low": float(data.get("lowest", 0)),
                 "update_time": self._parse_timestamp(data.get("update_date")),
+                "stale": False,
             }
 
-            self._cache_set(cache_key, result, TTL.FX_RATES)
+            self._cache_set(cache_key, result, TTL.FX_RATES, stale=StaleTTL.FX_RATES)
             return result
 
         except Exception as e:
@@ -307,19 +319,33 @@ class DovizcomProvider(BaseProvider):
         if asset not in self.SUPPORTED_ASSETS:
             raise DataNotAvailableError(f"Unsupported asset: {asset}")
 
-        # Calculate date range
-        end_dt = end or datetime.now()
-        if start:
-            start_dt = start
-        else:
-            days = {"1d": 1, "5d": 5, "1mo": 30, "3mo": 90, "6mo": 180, "1y": 365}.get(period, 30)
-            start_dt = end_dt - timedelta(days=days)
+        start_dt, end_dt = self._date_range(period, start, end)
 
         cache_key = f"dovizcom:history:{asset}:{start_dt.date()}:{end_dt.date()}"
         cached = self._cache_get(cache_key)
         if cached is not None:
             return cached
 
+        return self._single_flight(
+            cache_key,
+            lambda: self._run(self._history_steps(cache_key, asset, start_dt, end_dt)),
+        )
+
+    @staticmethod
+    def _date_range(
+        period: str, start: datetime | None, end: datetime | None
+    ) -> tuple[datetime, datetime]:
+        """Resolve period/start/end to a (start, end) datetime range."""
+        end_dt = end or datetime.now()
+        if start:
+            return start, end_dt
+        days = {"1d": 1, "5d": 5, "1mo": 30, "3mo": 90, "6mo": 180, "1y": 365}.get(period, 30)
+        return end_dt - timedelta(days=days), end_dt
+
+    def _history_steps(
+        self, cache_key: str, asset: str, start_dt: datetime, end_dt: datetime
+    ) -> Steps[pd.DataFrame]:
+        """Fetch archive data from the API and cache it under ``cache_key``."""
         try:
             api_slug = self.HISTORY_API_SLUGS.get(asset, asset)
             url = f"{self.BASE_URL}/assets/{api_slug}/archive"
@@ -328,28 +354,18 @@ class DovizcomProvider(BaseProvider):
                 "end": int(end_dt.timestamp()),
             }
 
-            response = self._client.get(url, headers=self._get_headers(asset), params=params)
+            headers = yield from self._headers_steps(asset)
+            response = yield Call("GET", url, params=params, headers=headers)
             response.raise_for_status()
-            data = response.json()
+            data = loads(response.content)
 
             archive = data.get("data", {}).get("archive", [])
-
-            records = []
-            for item in archive:
-                records.append(
-                    {
-                        "Date": self._parse_timestamp(item.get("update_date")),
-                        "Open": float(item.get("open", 0)),
-                        "High": float(item.get("highest", 0)),
-                        "Low": float(item.get("lowest", 0)),
-                        "Close": float(item.get("close", 0)),
-                    }
-                )
-
-            df = pd.DataFrame(records)
-            if not df.empty:
-                df.set_index("Date", inplace=True)
-                df.sort_index(inplace=True)
+            df = frame_from_records(
+                archive,
+                time_key="update_date",
+                columns={"open": "Open", "highest": "High", "lowest": "Low", "close": "Close"},
+                unit="s",
+            )
 
             self._cache_set(cache_key, df, TTL.OHLCV_HISTORY)
             return df
@@ -357,18 +373,19 @@ class DovizcomProvider(BaseProvider):
         except Exception as e:
             raise APIError(f"Failed to fetch history for {asset}: {e}") from e
 
-    def _get_from_daily(self, asset: str) -> dict | None:
+    def _daily_latest_steps(self, asset: str) -> Steps[dict | None]:
         """Get latest data from daily endpoint."""
         api_slug = self.HISTORY_API_SLUGS.get(asset, asset)
         url = f"{self.BASE_URL}/assets/{api_slug}/daily"
-        response = self._client.get(url, headers=self._get_headers(asset), params={"limit": 1})
+        headers = yield from self._headers_steps(asset)
+        response = yield Call("GET", url, params={"limit": 1}, headers=headers)
         response.raise_for_status()
         data = response.json()
 
         archive = data.get("data", {}).get("archive", [])
         return archive[0] if archive else None
 
-    def _get_from_archive(self, asset: str, days: int = 7) -> dict | None:
+    def _archive_latest_steps(self, asset: str, days: int = 7) -> Steps[dict | None]:
         """Get latest data from archive endpoint."""
         end_time = int(time.time())
         start_time = end_time - (days * 86400)
@@ -377,7 +394,8 @@ class DovizcomProvider(BaseProvider):
         url = f"{self.BASE_URL}/assets/{api_slug}/archive"
         params = {"start": start_time, "end": end_time}
 
-        response = self._client.get(url, headers=self._get_headers(asset), params=params)
+        headers = yield from self._headers_steps(asset)
+        response = yield Call("GET", url, params=params, headers=headers)
         response.raise_for_status()
         data = response.json()
 
@@ -818,6 +836,22 @@ class DovizcomProvider(BaseProvider):
         if cached is not None:
             return cached
 
+        return self._run(
+            self._institution_history_steps(
+                cache_key, asset, institution, api_asset_slug, start_dt, end_dt
+            )
+        )
+
+    def _institution_history_steps(
+        self,
+        cache_key: str,
+        asset: str,
+        institution: str,
+        api_asset_slug: str,
+        start_dt: datetime,
+        end_dt: datetime,
+    ) -> Steps[pd.DataFrame]:
+        """Fetch an institution's archive data and cache it under ``cache_key``."""
         try:
             # Build API slug: {institution_id}-{asset_slug}
             institution_id = self.INSTITUTION_IDS[institution]
@@ -829,28 +863,18 @@ class DovizcomProvider(BaseProvider):
                 "end": int(end_dt.timestamp()),
             }
 
-            response = self._client.get(url, headers=self._get_headers(asset), params=params)
+            headers = yield from self._headers_steps(asset)
+            response = yield Call("GET", url, params=params, headers=headers)
             response.raise_for_status()
-            data = response.json()
+            data = loads(response.content)
 
             archive = data.get("data", {}).get("archive", [])
-
-            records = []
-            for item in archive:
-                records.append(
-                    {
-                        "Date": self._parse_timestamp(item.get("update_date")),
-                        "Open": float(item.get("open", 0)),
-                        "High": float(item.get("highest", 0)),
-                        "Low": float(item.get("lowest", 0)),
-                        "Close": float(item.get("close", 0)),
-                    }
-                )
-
-            df = pd.DataFrame(records)
-            if not df.empty:
-                df.set_index("Date", inplace=True)
-                df.sort_index(inplace=True)
+            df = frame_from_records(
+                archive,
+                time_key="update_date",
+                columns={"open": "Open", "highest": "High", "lowest": "Low", "close": "Close"},
+                unit="s",
+            )
 
             self._cache_set(cache_key, df, TTL.OHLCV_HISTORY)
             return df
@@ -878,3 +902,53 @@ def get_dovizcom_provider() -> DovizcomProvider:
     if _provider is None:
         _provider = DovizcomProvider()
     return _provider
+
+
+class AsyncDovizcomProvider(AsyncBaseProvider, DovizcomProvider):
+    """Asyncio version of DovizcomProvider's get_current and get_history."""
+
+    async def get_current(self, asset: str) -> dict[str, Any]:
+        """Async version of DovizcomProvider.get_current."""
+        asset = asset.upper() if asset.upper() in self.SUPPORTED_ASSETS else asset
+
+        if asset not in self.SUPPORTED_ASSETS:
+            raise DataNotAvailableError(
+                f"Unsupported asset: {asset}. Supported: {sorted(self.SUPPORTED_ASSETS)}"
+            )
+
+        cache_key = f"dovizcom:current:{asset}"
+        cached = self._cache_get(cache_key, refresh=lambda: self._run(self._current_steps(asset)))
+        if cached:
+            return cached
+
+        return await self._single_flight(cache_key, lambda: self._run(self._current_steps(asset)))
+
+    async def get_history(
+        self,
+        asset: str,
+        period: str = "1mo",
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> pd.DataFrame:
+        """Async version of DovizcomProvider.get_history."""
+        asset = asset.upper() if asset.upper() in self.SUPPORTED_ASSETS else asset
+
+        if asset not in self.SUPPORTED_ASSETS:
+            raise DataNotAvailableError(f"Unsupported asset: {asset}")
+
+        start_dt, end_dt = self._date_range(period, start, end)
+
+        cache_key = f"dovizcom:history:{asset}:{start_dt.date()}:{end_dt.date()}"
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        return await self._single_flight(
+            cache_key,
+            lambda: self._run(self._history_steps(cache_key, asset, start_dt, end_dt)),
+        )
+
+
+def get_async_dovizcom_provider() -> AsyncDovizcomProvider:
+    """Get the doviz.com async provider for the running event loop."""
+    return async_provider(AsyncDovizcomProvider)
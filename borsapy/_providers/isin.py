@@ -5,6 +5,7 @@ import time
 
 from borsapy._providers.base import BaseProvider
 from borsapy._providers.kap import get_kap_provider
+from borsapy._providers.transport import RETRY
 
 
 class ISINProvider(BaseProvider):
@@ -119,6 +120,7 @@ class ISINProvider(BaseProvider):
                 self.COMPANY_LIST_URL,
                 headers=headers,
                 timeout=30,
+                extensions=RETRY,
             )
             response.raise_for_status()
             data = response.json()
@@ -216,6 +218,7 @@ class ISINProvider(BaseProvider):
                 json=payload,
                 headers=headers,
                 timeout=15,
+                extensions=RETRY,
             )
             response.raise_for_status()
             data = response.json()
@@ -1,15 +1,36 @@
 """İş Yatırım provider for real-time prices and financial statements."""
 
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
-from borsapy._providers.base import BaseProvider
+from borsapy._providers.base import Batch, BaseProvider, Call, Steps
+from borsapy._providers.columnar import empty_frame, loads
+from borsapy._providers.transport import RETRY
 from borsapy.cache import TTL
 from borsapy.exceptions import APIError, DataNotAvailableError, TickerNotFoundError
 
 
+@dataclass
+class _FinancialsPanel:
+    """Long-format statements of many companies (see get_financials_panel)."""
+
+    data: pd.DataFrame
+    fetched_at: dict[str, float] = field(default_factory=dict)  # symbol -> time.time()
+    errors: dict[str, tuple[float, str]] = field(default_factory=dict)  # symbol -> (time, error)
+
+
+# Serializes panel merges (read-modify-write of one cache entry); held only
+# while merging, never during downloads
+_panel_lock = threading.Lock()
+
+
 class IsYatirimProvider(BaseProvider):
     """
     Provider for real-time stock data and financial statements from İş Yatırım.
@@ -27,6 +48,9 @@ class IsYatirimProvider(BaseProvider):
     FINANCIAL_GROUP_INDUSTRIAL = "XI_29"  # Sanayi şirketleri
     FINANCIAL_GROUP_BANK = "UFRS"  # Bankalar
 
+    # Long-format statement table (see get_financials_batch)
+    FINANCIAL_COLUMNS = ["symbol", "frequency", "line", "code", "item", "period", "value"]
+
     # Known market indices
     INDICES = {
         "XU100": "BIST 100",
@@ -251,7 +275,9 @@ class IsYatirimProvider(BaseProvider):
         })
 
         try:
-            response = self._client.post(url, content=payload, headers=headers, timeout=15)
+            response = self._client.post(
+                url, content=payload, headers=headers, timeout=15, extensions=RETRY
+            )
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -475,6 +501,10 @@ class IsYatirimProvider(BaseProvider):
         """
         Get financial statements for a company.
 
+        The MaliTablo response carries every statement section, so all
+        statement types of a symbol and frequency share one request and one
+        cache entry.
+
         Args:
             symbol: Stock symbol.
             statement_type: Type of statement ("balance_sheet", "income_stmt", "cashflow").
@@ -486,7 +516,7 @@ class IsYatirimProvider(BaseProvider):
         """
         symbol = symbol.upper().replace(".IS", "").replace(".E", "")
 
-        cache_key = f"isyatirim:financial:{symbol}:{statement_type}:{quarterly}"
+        cache_key = f"isyatirim:financial:{symbol}:{quarterly}"
         cached = self._cache_get(cache_key)
         if cached is not None:
             return cached
@@ -495,43 +525,211 @@ class IsYatirimProvider(BaseProvider):
         if financial_group is None:
             financial_group = self.FINANCIAL_GROUP_INDUSTRIAL
 
-        # Map statement type to table names
-        table_map = {
-            "balance_sheet": ["BILANCO_AKTIF", "BILANCO_PASIF"],
-            "income_stmt": ["GELIR_TABLOSU"],
-            "cashflow": ["NAKIT_AKIM_TABLOSU"],
-        }
+        # Get last 5 years/quarters
+        periods = self._get_periods(datetime.now().year, quarterly, count=5)
 
-        tables = table_map.get(statement_type, ["BILANCO_AKTIF", "BILANCO_PASIF"])
+        try:
+            data = self._fetch_financial_table(symbol, financial_group, periods)
+        except Exception as e:
+            raise DataNotAvailableError(f"No financial data available for {symbol}") from e
 
-        # Get last 5 years/quarters
+        result, _ = self._store_financials(symbol, quarterly, data, periods)
+        if result.empty:
+            raise DataNotAvailableError(f"No financial data available for {symbol}")
+        return result
+
+    def get_financials_batch(
+        self,
+        symbols: Iterable[str],
+        quarterly: bool | None = None,
+        financial_group: str | None = None,
+        concurrency: int = 4,
+        refresh: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Get financial statements for many companies as one long table.
+
+        Symbols not cached are fetched concurrently (one request per symbol
+        and frequency, under the host rate limit). Each result also fills the
+        get_financial_statements cache, so Ticker statements read it after.
+
+        Args:
+            symbols: Stock symbols.
+            quarterly: True for quarterly, False for annual, None for both.
+            financial_group: Financial group code (XI_29 for industrial, UFRS for banks).
+            concurrency: Max requests in flight.
+            refresh: Fetch every symbol, ignoring cached statements.
+
+        Returns:
+            DataFrame with one row per symbol, item and period and columns:
+            symbol, frequency ("annual"/"quarterly"), line (item position in
+            the statement), code (İş Yatırım item code), item, period ("2024"
+            or "2024Q3") and value. Failed symbols are listed in
+            ``df.attrs["errors"]``.
+        """
+        symbols = list(dict.fromkeys(s.upper().replace(".IS", "").replace(".E", "") for s in symbols))
+        frequencies = [False, True] if quarterly is None else [quarterly]
+        return self._run(
+            self._financials_batch_steps(
+                symbols,
+                frequencies,
+                financial_group or self.FINANCIAL_GROUP_INDUSTRIAL,
+                concurrency,
+                refresh,
+            )
+        )
+
+    def _financials_batch_steps(
+        self,
+        symbols: list[str],
+        frequencies: list[bool],
+        financial_group: str,
+        concurrency: int,
+        refresh: bool = False,
+    ) -> Steps[pd.DataFrame]:
         current_year = datetime.now().year
-        periods = self._get_periods(current_year, quarterly, count=5)
+        periods = {q: self._get_periods(current_year, q, count=5) for q in frequencies}
+
+        frames: dict[tuple[str, bool], pd.DataFrame] = {}
+        missing = []
+        for symbol in symbols:
+            for q in frequencies:
+                cached = None if refresh else self._cache_get(f"isyatirim:financials:{symbol}:{q}")
+                if cached is not None:
+                    frames[(symbol, q)] = cached
+                else:
+                    missing.append((symbol, q))
+
+        errors: dict[str, str] = {}
+        if missing:
+            calls = tuple(
+                self._financial_call(symbol, financial_group, periods[q]) for symbol, q in missing
+            )
+            responses = yield Batch(calls, concurrency=concurrency)
+            for (symbol, q), response in zip(missing, responses, strict=True):
+                try:
+                    if isinstance(response, Exception):
+                        raise response
+                    response.raise_for_status()
+                    _, long = self._store_financials(symbol, q, loads(response.content), periods[q])
+                    if long.empty:
+                        raise DataNotAvailableError(f"No financial data available for {symbol}")
+                    frames[(symbol, q)] = long
+                except Exception as e:
+                    errors.setdefault(symbol, str(e))
+
+        # Request order, annual before quarterly
+        ordered = [frames[(s, q)] for s in symbols for q in frequencies if (s, q) in frames]
+        result = (
+            pd.concat(ordered, ignore_index=True) if ordered else empty_frame(self.FINANCIAL_COLUMNS)
+        )
+        result.attrs["errors"] = errors
+        return result
 
-        all_data = []
-        for table_name in tables:
-            try:
-                df = self._fetch_financial_table(
-                    symbol=symbol,
-                    table_name=table_name,
-                    financial_group=financial_group,
-                    periods=periods,
-                )
-                if not df.empty:
-                    all_data.append(df)
-            except Exception:
-                continue
+    def get_financials_panel(
+        self,
+        symbols: Iterable[str],
+        refresh: Iterable[str] = (),
+        concurrency: int = 4,
+    ) -> pd.DataFrame:
+        """
+        Get the statements of many companies from a persistent panel.
 
-        if not all_data:
-            raise DataNotAvailableError(f"No financial data available for {symbol}")
+        The panel keeps every company fetched so far (annual and quarterly,
+        in get_financials_batch's long format) under one long-lived cache
+        entry, so it survives restarts with the disk cache. Only symbols not
+        in the panel yet, plus those in ``refresh``, are fetched; symbols
+        with no industrial (XI_29) statements are retried as banks (UFRS),
+        and symbols that failed altogether are not retried for a day.
 
-        result = pd.concat(all_data, axis=0) if len(all_data) > 1 else all_data[0]
-        result = result.drop_duplicates()
+        Args:
+            symbols: Stock symbols to return.
+            refresh: Symbols to fetch again (e.g. a new period was published).
+            concurrency: Max requests in flight.
 
-        self._cache_set(cache_key, result, TTL.FINANCIAL_STATEMENTS)
+        Returns:
+            Long-format DataFrame for ``symbols`` (categorical symbol,
+            frequency, code, item and period). ``df.attrs["fetched_at"]``
+            maps each symbol to its fetch time and ``df.attrs["errors"]``
+            lists the symbols that could not be fetched.
+        """
+        symbols = list(dict.fromkeys(s.upper().replace(".IS", "").replace(".E", "") for s in symbols))
+        refresh = {s.upper().replace(".IS", "").replace(".E", "") for s in refresh}
+        key = "isyatirim:panel"
+
+        store = self._cache_get(key)
+        if store is None:
+            store = _FinancialsPanel(empty_frame(self.FINANCIAL_COLUMNS))
+
+        # Symbols that failed recently (e.g. no statements at all) wait a day
+        now = time.time()
+        retry_after = now - TTL.FINANCIAL_STATEMENTS
+        todo = [
+            s for s in symbols
+            if s in refresh
+            or (s not in store.fetched_at and store.errors.get(s, (0.0,))[0] < retry_after)
+        ]
+        if todo:
+            # Download without the lock, so readers of the stored panel don't wait
+            fetched = self.get_financials_batch(todo, concurrency=concurrency, refresh=True)
+            failed = fetched.attrs["errors"]
+            if failed:
+                banks = self.get_financials_batch(
+                    list(failed),
+                    financial_group=self.FINANCIAL_GROUP_BANK,
+                    concurrency=concurrency,
+                    refresh=True,
+                )
+                failed = {s: failed[s] for s in banks.attrs["errors"]}
+                fetched = pd.concat([fetched, banks], ignore_index=True)
+            store = self._merge_panel(key, fetched, failed, now)
 
+        result = store.data[store.data["symbol"].isin(symbols)].reset_index(drop=True)
+        result.attrs["fetched_at"] = {s: store.fetched_at[s] for s in symbols if s in store.fetched_at}
+        result.attrs["errors"] = {s: store.errors[s][1] for s in symbols if s in store.errors}
         return result
 
+    def _merge_panel(
+        self, key: str, fetched: pd.DataFrame, failed: dict[str, str], now: float
+    ) -> _FinancialsPanel:
+        """Merge fetched statements and errors into the stored panel and save it."""
+        with _panel_lock:
+            # Re-read: another caller may have stored its own batch meanwhile
+            store = self._cache_get(key)
+            if store is None:
+                store = _FinancialsPanel(empty_frame(self.FINANCIAL_COLUMNS))
+
+            updated = set(fetched["symbol"].unique())
+            kept = store.data[~store.data["symbol"].isin(updated)]
+            data = pd.concat([f for f in (kept, fetched) if not f.empty], ignore_index=True)
+            if data.empty:
+                data = empty_frame(self.FINANCIAL_COLUMNS)
+            data = data.astype({"line": "int32", "value": "float64"})
+            for column in ["symbol", "frequency", "code", "item", "period"]:
+                data[column] = data[column].astype("category")
+            errors = {s: v for s, v in store.errors.items() if s not in updated}
+            errors.update((s, (now, message)) for s, message in failed.items())
+            store = _FinancialsPanel(
+                data, {**store.fetched_at, **dict.fromkeys(updated, now)}, errors
+            )
+            self._cache_set(key, store, TTL.HISTORY_STORE)
+        return store
+
+    def _store_financials(
+        self,
+        symbol: str,
+        quarterly: bool,
+        data: Any,
+        periods: list[tuple[int, int]],
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Parse a MaliTablo response into the wide and long frames and cache both."""
+        wide = self._parse_financial_response(data, periods).drop_duplicates()
+        long = self._parse_financial_long(symbol, data, periods)
+        if not wide.empty:
+            self._cache_set(f"isyatirim:financial:{symbol}:{quarterly}", wide, TTL.FINANCIAL_STATEMENTS)
+            self._cache_set(f"isyatirim:financials:{symbol}:{quarterly}", long, TTL.FINANCIAL_STATEMENTS)
+        return wide, long
+
     def _get_periods(
         self,
         current_year: int,
@@ -600,16 +798,13 @@ class IsYatirimProvider(BaseProvider):
                 periods.append((current_year - 1 - i, 12))
         return periods
 
-    def _fetch_financial_table(
+    def _financial_call(
         self,
         symbol: str,
-        table_name: str,
         financial_group: str,
         periods: list[tuple[int, int]],
-    ) -> pd.DataFrame:
-        """Fetch a specific financial table."""
-        url = f"{self.BASE_URL}/Data.aspx/MaliTablo"
-
+    ) -> Call:
+        """MaliTablo request for up to 5 periods (all statement sections)."""
         # Build params with multiple year/period pairs
         params: dict[str, Any] = {
             "companyCode": symbol,
@@ -621,14 +816,22 @@ class IsYatirimProvider(BaseProvider):
             params[f"year{i}"] = year
             params[f"period{i}"] = period
 
+        return Call("GET", f"{self.BASE_URL}/Data.aspx/MaliTablo", params=params)
+
+    def _fetch_financial_table(
+        self,
+        symbol: str,
+        financial_group: str,
+        periods: list[tuple[int, int]],
+    ) -> Any:
+        """Fetch the MaliTablo response for a company."""
+        call = self._financial_call(symbol, financial_group, periods)
         try:
-            response = self._get(url, params=params)
-            data = response.json()
+            response = self._get(call.url, params=call.params)
+            return response.json()
         except Exception as e:
             raise APIError(f"Failed to fetch financial data for {symbol}: {e}") from e
 
-        return self._parse_financial_response(data, periods)
-
     def _parse_financial_response(
         self,
         data: Any,
@@ -671,6 +874,45 @@ class IsYatirimProvider(BaseProvider):
 
         return df
 
+    def _parse_financial_long(
+        self,
+        symbol: str,
+        data: Any,
+        periods: list[tuple[int, int]],
+    ) -> pd.DataFrame:
+        """Parse a MaliTablo response into long format (see get_financials_batch)."""
+        items = data.get("value", []) if isinstance(data, dict) else []
+        if not items:
+            return empty_frame(self.FINANCIAL_COLUMNS)
+
+        periods = periods[:5]
+        is_quarterly = len({p[1] for p in periods}) > 1
+        labels = [
+            f"{year}Q{period // 3}" if is_quarterly else str(year) for year, period in periods
+        ]
+
+        n, k = len(items), len(periods)
+        values = pd.to_numeric(
+            pd.Series(
+                [item.get(f"value{i}") for item in items for i in range(1, k + 1)], dtype=object
+            ),
+            errors="coerce",
+        ).to_numpy(dtype="float64")
+        df = pd.DataFrame(
+            {
+                "symbol": symbol,
+                "frequency": "quarterly" if is_quarterly else "annual",
+                "line": np.repeat(np.arange(n, dtype="int32"), k),
+                "code": np.repeat([item.get("itemCode") for item in items], k),
+                "item": np.repeat(
+                    [item.get("itemDescTr", item.get("itemDescEng", "Unknown")) for item in items], k
+                ),
+                "period": np.tile(labels, n),
+                "value": values,
+            }
+        )
+        return df[~np.isnan(values)].reset_index(drop=True)
+
     def get_major_holders(self, symbol: str) -> pd.DataFrame:
         """
         Get major shareholders (ortaklık yapısı) for a stock.
@@ -3,9 +3,11 @@
 import json
 from typing import Any
 
+import httpx
+
 from borsapy._providers.base import BaseProvider
 from borsapy.cache import TTL
-from borsapy.exceptions import APIError
+from borsapy.exceptions import APIError, DataNotAvailableError
 
 
 class IsyatirimScreenerProvider(BaseProvider):
@@ -144,8 +146,6 @@ class IsyatirimScreenerProvider(BaseProvider):
     def __init__(self, timeout: float = 30.0, cache=None):
         """Initialize the provider."""
         super().__init__(timeout=timeout, cache=cache)
-        self._criteria_cache: list[dict[str, Any]] | None = None
-        self._sectors_cache: list[dict[str, Any]] | None = None
         self._indices_cache: list[dict[str, Any]] | None = None
         self._session_initialized = False
         self._request_digest: str | None = None
@@ -198,68 +198,62 @@ class IsyatirimScreenerProvider(BaseProvider):
         Returns:
             List of criteria with id, name, min, max values.
         """
-        if self._criteria_cache is not None:
-            return self._criteria_cache
-
-        cache_key = "isyatirim:screener:criteria"
-        cached = self._cache_get(cache_key)
-        if cached is not None:
-            self._criteria_cache = cached
-            return cached
-
         try:
-            response = self._get(
+            return self._get_revalidated(
+                "isyatirim:screener:criteria",
                 self.CRITERIA_URL,
+                self._parse_criteria,
+                TTL.COMPANY_LIST,
                 headers={"X-Requested-With": "XMLHttpRequest"},
             )
-            data = response.json()
+        except Exception as e:
+            raise APIError(f"Failed to fetch screening criteria: {e}") from e
 
-            criteria = []
-            for item in data.get("value", []):
-                # Parse the complex format
-                kriter_tanim = item.get("KriterTanim", "")
-                if ";#" in kriter_tanim:
-                    parts = kriter_tanim.split(";#")
-                    kriter_id = parts[0] if len(parts) > 0 else None
-                else:
-                    kriter_id = None
+    def _parse_criteria(self, response: httpx.Response) -> list[dict[str, Any]]:
+        """Parse the criteria list response."""
+        data = response.json()
+
+        criteria = []
+        for item in data.get("value", []):
+            # Parse the complex format
+            kriter_tanim = item.get("KriterTanim", "")
+            if ";#" in kriter_tanim:
+                parts = kriter_tanim.split(";#")
+                kriter_id = parts[0] if len(parts) > 0 else None
+            else:
+                kriter_id = None
+
+            # Get name from another field
+            name_field = item.get("KriterTanim_x003a_Ba_x015f_l_x01", "")
+            if ";#" in name_field:
+                name = name_field.split(";#")[1] if len(name_field.split(";#")) > 1 else ""
+            else:
+                name = name_field
+
+            # Get min/max
+            min_field = item.get("KriterTanim_x003a_MIN_DEGER", "")
+            max_field = item.get("KriterTanim_x003a_MAX_DEGER", "")
+
+            min_val = min_field.split(";#")[1] if ";#" in min_field else min_field
+            max_val = max_field.split(";#")[1] if ";#" in max_field else max_field
+
+            if kriter_id and name:
+                criteria.append({
+                    "id": kriter_id,
+                    "name": name,
+                    "min": min_val,
+                    "max": max_val,
+                })
 
-                # Get name from another field
-                name_field = item.get("KriterTanim_x003a_Ba_x015f_l_x01", "")
-                if ";#" in name_field:
-                    name = name_field.split(";#")[1] if len(name_field.split(";#")) > 1 else ""
-                else:
-                    name = name_field
-
-                # Get min/max
-                min_field = item.get("KriterTanim_x003a_MIN_DEGER", "")
-                max_field = item.get("KriterTanim_x003a_MAX_DEGER", "")
-
-                min_val = min_field.split(";#")[1] if ";#" in min_field else min_field
-                max_val = max_field.split(";#")[1] if ";#" in max_field else max_field
-
-                if kriter_id and name:
-                    criteria.append({
-                        "id": kriter_id,
-                        "name": name,
-                        "min": min_val,
-                        "max": max_val,
-                    })
-
-            # Deduplicate by id
-            seen = set()
-            unique_criteria = []
-            for c in criteria:
-                if c["id"] not in seen:
-                    seen.add(c["id"])
-                    unique_criteria.append(c)
-
-            self._criteria_cache = unique_criteria
-            self._cache_set(cache_key, unique_criteria, TTL.COMPANY_LIST)
-            return unique_criteria
+        # Deduplicate by id
+        seen = set()
+        unique_criteria = []
+        for c in criteria:
+            if c["id"] not in seen:
+                seen.add(c["id"])
+                unique_criteria.append(c)
 
-        except Exception as e:
-            raise APIError(f"Failed to fetch screening criteria: {e}") from e
+        return unique_criteria
 
     def get_sectors(self) -> list[dict[str, Any]]:
         """
@@ -268,23 +262,16 @@ class IsyatirimScreenerProvider(BaseProvider):
         Returns:
             List of sectors with id and name.
         """
-        if self._sectors_cache is not None:
-            return self._sectors_cache
-
-        cache_key = "isyatirim:screener:sectors"
-        cached = self._cache_get(cache_key)
-        if cached is not None:
-            self._sectors_cache = cached
-            return cached
-
         # Extract from page HTML
-        sectors = self._extract_sectors_from_page()
-        if sectors:
-            self._sectors_cache = sectors
-            self._cache_set(cache_key, sectors, TTL.COMPANY_LIST)
-            return sectors
-
-        return []
+        try:
+            return self._get_revalidated(
+                "isyatirim:screener:sectors",
+                self.PAGE_URL,
+                self._parse_sectors,
+                TTL.COMPANY_LIST,
+            )
+        except Exception:
+            return []
 
     def get_indices(self) -> list[dict[str, Any]]:
         """
@@ -311,31 +298,27 @@ class IsyatirimScreenerProvider(BaseProvider):
 
         return []
 
-    def _extract_sectors_from_page(self) -> list[dict[str, Any]]:
+    def _parse_sectors(self, response: httpx.Response) -> list[dict[str, Any]]:
         """Extract sectors from the screener page HTML."""
         from bs4 import BeautifulSoup
 
-        try:
-            self._init_session()
-            response = self._get(self.PAGE_URL)
-            soup = BeautifulSoup(response.content, "html.parser")
+        soup = BeautifulSoup(response.content, "html.parser")
 
-            # Find sector dropdown
-            sector_select = soup.find("select", id="ctl00_ctl58_g_877a6dc3_ec50_46c8_9ce3_f240bf1fe822_ctl00_ddlStockSector")
-            if not sector_select:
-                return []
+        # Find sector dropdown
+        sector_select = soup.find("select", id="ctl00_ctl58_g_877a6dc3_ec50_46c8_9ce3_f240bf1fe822_ctl00_ddlStockSector")
+        if not sector_select:
+            raise DataNotAvailableError("Sector list not found on screener page")
 
-            sectors = []
-            for opt in sector_select.find_all("option"):
-                value = opt.get("value", "")
-                name = opt.text.strip()
-                if value and name and name != "Sektör Seçiniz":
-                    sectors.append({"id": value, "name": name})
+        sectors = []
+        for opt in sector_select.find_all("option"):
+            value = opt.get("value", "")
+            name = opt.text.strip()
+            if value and name and name != "Sektör Seçiniz":
+                sectors.append({"id": value, "name": name})
 
-            return sectors
-
-        except Exception:
-            return []
+        if not sectors:
+            raise DataNotAvailableError("Sector list is empty")
+        return sectors
 
     def _extract_indices_from_page(self) -> list[dict[str, Any]]:
         """Extract indices from the screener page HTML."""
@@ -413,6 +396,7 @@ class IsyatirimScreenerProvider(BaseProvider):
                 self.SCREENER_URL,
                 json=payload,
                 headers=self._get_headers(),
+                retry=True,
             )
 
             data = response.json()
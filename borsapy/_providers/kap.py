@@ -1,16 +1,163 @@
 """KAP (Kamuyu Aydınlatma Platformu) provider for disclosures and calendar."""
 
 import io
+import json
 import re
 import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from typing import Any
 
+import httpx
 import pandas as pd
 
 from borsapy._providers.base import BaseProvider
+from borsapy._providers.transport import RETRY
+from borsapy.cache import TTL
 from borsapy.exceptions import APIError
 
 
+@dataclass
+class _Snapshot:
+    """A scraped value and when it was scraped (kept past its refresh age)."""
+
+    data: Any
+    fetched_at: float
+
+
+class _CompanyIndex:
+    """
+    Search index over one company list (see KAPProvider.search).
+
+    Holds the upper-case tickers and normalized names, a ticker prefix
+    index and a trigram index over the names. A name query intersects the
+    postings of its trigrams and verifies the few candidates, instead of
+    normalizing and scanning every name.
+    """
+
+    NGRAM = 3
+
+    def __init__(self, companies: pd.DataFrame, normalize: Callable[[str], str]):
+        self.companies = companies
+        self.tickers = [str(t).upper() for t in companies["ticker"]]
+        self.names = [normalize(str(n)) for n in companies["name"]]
+
+        self.by_prefix: dict[str, list[int]] = {}
+        for i, ticker in enumerate(self.tickers):
+            for end in range(1, len(ticker) + 1):
+                self.by_prefix.setdefault(ticker[:end], []).append(i)
+
+        self.by_ngram: dict[str, set[int]] = {}
+        for i, name in enumerate(self.names):
+            for start in range(len(name) - self.NGRAM + 1):
+                self.by_ngram.setdefault(name[start : start + self.NGRAM], set()).add(i)
+
+    def search(self, query_upper: str, query_normalized: str) -> list[int]:
+        """Row positions matching a query, best first."""
+        exact, prefix = [], []
+        for i in self.by_prefix.get(query_upper, ()):
+            (exact if self.tickers[i] == query_upper else prefix).append(i)
+
+        ticker_hits = set(exact) | set(prefix)
+        name_hits = [i for i in self._name_matches(query_normalized) if i not in ticker_hits]
+        return exact + prefix + name_hits
+
+    def _name_matches(self, query: str) -> list[int]:
+        """Positions of names containing ``query``, in list order."""
+        n = self.NGRAM
+        if len(query) < n:
+            # Too short for the trigram index
+            return [i for i, name in enumerate(self.names) if query in name]
+
+        grams = sorted(
+            {query[start : start + n] for start in range(len(query) - n + 1)},
+            key=lambda gram: len(self.by_ngram.get(gram, ())),
+        )
+        candidates = set(self.by_ngram.get(grams[0], ()))
+        for gram in grams[1:]:
+            if not candidates:
+                break
+            candidates &= self.by_ngram.get(gram, set())
+        return sorted(i for i in candidates if query in self.names[i])
+
+
+# Next.js streams the page data as JSON string chunks, e.g.
+# self.__next_f.push([1,"...{\"publishDate\":\"29.12.2025 19:21:18\",\"disclosureIndex\":1530826..."])
+_NEXT_CHUNK_PATTERN = re.compile(r'self\.__next_f\.push\(\[\d+,\s*("(?:[^"\\]|\\.)*")\]\)')
+_DISCLOSURE_KEY = '"disclosureIndex":'
+_STOCK_CODE_KEYS = ("stockCodes", "stockCode")
+
+_json_decoder = json.JSONDecoder()
+
+
+def _next_payload(text: str) -> str:
+    """The JSON text embedded in a Next.js page (the page itself if it has none)."""
+    chunks = []
+    for match in _NEXT_CHUNK_PATTERN.finditer(text):
+        try:
+            chunks.append(json.loads(match.group(1)))
+        except ValueError:
+            continue
+    return "".join(chunks) if chunks else text
+
+
+def _enclosing_objects(payload: str, pos: int) -> Iterator[dict]:
+    """Decode the JSON objects enclosing ``pos``, innermost first."""
+    start = payload.rfind("{", 0, pos)
+    while start != -1:
+        try:
+            obj, end = _json_decoder.raw_decode(payload, start)
+        except ValueError:
+            # A brace inside a string, or an object cut off by the stream
+            obj, end = None, start
+        if end > pos and isinstance(obj, dict):
+            yield obj
+        start = payload.rfind("{", 0, start)
+
+
+def _parse_disclosures(text: str) -> list[dict]:
+    """
+    Parse disclosures (in page order) from a KAP disclosure query page.
+
+    Each disclosure object is decoded from the embedded JSON. Stock codes are
+    read from the disclosure or the object enclosing it; they may list several
+    codes ("GARAN, TGB") or be missing (then symbols is empty).
+    """
+    payload = _next_payload(text)
+    items = []
+    seen = set()
+    pos = payload.find(_DISCLOSURE_KEY)
+    while pos != -1:
+        objects = _enclosing_objects(payload, pos)
+        disclosure = next((obj for obj in objects if "disclosureIndex" in obj), None)
+        pos = payload.find(_DISCLOSURE_KEY, pos + len(_DISCLOSURE_KEY))
+        if disclosure is None:
+            continue
+        try:
+            idx = int(disclosure["disclosureIndex"])
+        except (TypeError, ValueError):
+            continue
+        if idx in seen or not disclosure.get("publishDate") or not disclosure.get("title"):
+            continue
+        seen.add(idx)
+
+        codes = next((disclosure[key] for key in _STOCK_CODE_KEYS if key in disclosure), None)
+        if codes is None:
+            parent = next(objects, None)
+            if parent is not None:
+                codes = next((parent[key] for key in _STOCK_CODE_KEYS if key in parent), None)
+        symbols = [code.strip() for code in codes.split(",")] if isinstance(codes, str) else []
+        items.append({
+            "id": idx,
+            "date": disclosure["publishDate"],
+            "title": disclosure["title"],
+            "url": f"https://www.kap.org.tr/tr/Bildirim/{idx}",
+            "symbols": tuple(code for code in symbols if code),
+        })
+    return items
+
+
 class KAPProvider(BaseProvider):
     """
     Provider for KAP (Kamuyu Aydınlatma Platformu) data.
@@ -21,7 +168,7 @@ class KAPProvider(BaseProvider):
     Provides:
     - List of all BIST companies with ticker codes
     - Company search functionality
-    - Company disclosures (bildirimler)
+    - Company disclosures (bildirimler), per stock or across BIST
     - Expected disclosure calendar (beklenen bildirimler)
     """
 
@@ -31,89 +178,74 @@ class KAPProvider(BaseProvider):
     CALENDAR_API_URL = "https://kap.org.tr/tr/api/expected-disclosure-inquiry/company"
     COMPANY_INFO_URL = "https://kap.org.tr/tr/sirket-bilgileri/ozet"
     COMPANY_GENERAL_URL = "https://kap.org.tr/tr/sirket-bilgileri/genel"
-    CACHE_DURATION = 86400  # 24 hours
+    CACHE_DURATION = 86400  # 24 hours (refresh age of the OID map and company details)
 
     def __init__(self):
         super().__init__()
-        self._company_cache: pd.DataFrame | None = None
-        self._cache_time: float = 0
-        self._oid_map: dict[str, str] | None = None
-        self._oid_cache_time: float = 0
-        self._company_details_cache: dict[str, dict] = {}
-        self._company_details_cache_time: dict[str, float] = {}
+        self._search_index: _CompanyIndex | None = None
 
     def get_companies(self) -> pd.DataFrame:
         """
         Get list of all BIST companies.
 
+        The Excel file is revalidated with the server once a day and only
+        downloaded and parsed again when it has changed.
+
         Returns:
             DataFrame with columns: ticker, name, city
         """
-        current_time = time.time()
-
-        # Check cache
-        if (
-            self._company_cache is not None
-            and (current_time - self._cache_time) < self.CACHE_DURATION
-        ):
-            return self._company_cache
+        headers = {
+            "Accept": "*/*",
+            "Accept-Language": "tr",
+            "User-Agent": self.DEFAULT_HEADERS["User-Agent"],
+            "Referer": "https://www.kap.org.tr/tr/bist-sirketler",
+        }
 
         try:
-            headers = {
-                "Accept": "*/*",
-                "Accept-Language": "tr",
-                "User-Agent": self.DEFAULT_HEADERS["User-Agent"],
-                "Referer": "https://www.kap.org.tr/tr/bist-sirketler",
-            }
-
-            response = self._client.get(self.EXCEL_URL, headers=headers)
-            response.raise_for_status()
-
-            # Read Excel data
-            df = pd.read_excel(io.BytesIO(response.content))
-
-            companies = []
-            for _, row in df.iterrows():
-                if len(row) >= 3:
-                    ticker_field = str(row.iloc[0]).strip() if pd.notna(row.iloc[0]) else ""
-                    name = str(row.iloc[1]).strip() if pd.notna(row.iloc[1]) else ""
-                    city = str(row.iloc[2]).strip() if pd.notna(row.iloc[2]) else ""
-
-                    # Skip header or empty rows
-                    if ticker_field and name and ticker_field not in ("BIST KODU", "Kod"):
-                        # Handle multiple tickers (e.g., "GARAN, TGB")
-                        if "," in ticker_field:
-                            tickers = [t.strip() for t in ticker_field.split(",")]
-                            for ticker in tickers:
-                                if ticker:
-                                    companies.append(
-                                        {
-                                            "ticker": ticker,
-                                            "name": name,
-                                            "city": city,
-                                        }
-                                    )
-                        else:
-                            companies.append(
-                                {
-                                    "ticker": ticker_field,
-                                    "name": name,
-                                    "city": city,
-                                }
-                            )
-
-            result = pd.DataFrame(companies)
-            self._company_cache = result
-            self._cache_time = current_time
-            return result
-
+            return self._get_revalidated(
+                "kap:companies",
+                self.EXCEL_URL,
+                self._parse_companies_excel,
+                TTL.COMPANY_LIST,
+                headers=headers,
+            )
         except Exception as e:
             raise APIError(f"Failed to fetch company list: {e}") from e
 
+    def _parse_companies_excel(self, response: httpx.Response) -> pd.DataFrame:
+        """Parse the IGS company list Excel file."""
+        # Read Excel data
+        df = pd.read_excel(io.BytesIO(response.content))
+        if df.shape[1] < 3:
+            return pd.DataFrame(columns=["ticker", "name", "city"])
+
+        def text(column: pd.Series) -> pd.Series:
+            return column.where(column.notna(), "").astype(str).str.strip()
+
+        companies = pd.DataFrame(
+            {"ticker": text(df.iloc[:, 0]), "name": text(df.iloc[:, 1]), "city": text(df.iloc[:, 2])}
+        )
+        # Skip header or empty rows
+        companies = companies[
+            (companies["ticker"] != "")
+            & (companies["name"] != "")
+            & ~companies["ticker"].isin(["BIST KODU", "Kod"])
+        ]
+
+        # Handle multiple tickers (e.g., "GARAN, TGB"): one row per ticker
+        companies = companies.assign(ticker=companies["ticker"].str.split(",")).explode("ticker")
+        companies["ticker"] = companies["ticker"].str.strip()
+        companies = companies[companies["ticker"] != ""]
+        return companies.reset_index(drop=True)
+
     def search(self, query: str) -> pd.DataFrame:
         """
         Search companies by name or ticker.
 
+        Results are ranked: exact ticker, then ticker prefix, then name
+        match (in list order within each group). Lookups use an index built
+        once per company list (see _CompanyIndex).
+
         Args:
             query: Search query (ticker code or company name)
 
@@ -127,36 +259,15 @@ class KAPProvider(BaseProvider):
         if companies.empty:
             return companies
 
-        query_normalized = self._normalize_text(query)
-        query_upper = query.upper()
-
-        # Score and filter results
-        results = []
-        for _, row in companies.iterrows():
-            score = 0
-            ticker = row["ticker"]
-            name = row["name"]
-
-            # Exact ticker match
-            if ticker.upper() == query_upper:
-                score = 1000
-            # Ticker starts with query
-            elif ticker.upper().startswith(query_upper):
-                score = 500
-            # Name contains query
-            elif query_normalized in self._normalize_text(name):
-                score = 100
-
-            if score > 0:
-                results.append((score, row))
-
-        # Sort by score descending
-        results.sort(key=lambda x: x[0], reverse=True)
-
-        if not results:
+        index = self._search_index
+        if index is None or index.companies is not companies:
+            index = self._search_index = _CompanyIndex(companies, self._normalize_text)
+
+        positions = index.search(query.upper(), self._normalize_text(query))
+        if not positions:
             return pd.DataFrame(columns=["ticker", "name", "city"])
 
-        return pd.DataFrame([r[1] for r in results])
+        return companies.iloc[positions]
 
     def _normalize_text(self, text: str) -> str:
         """Normalize Turkish text for comparison."""
@@ -179,46 +290,65 @@ class KAPProvider(BaseProvider):
             Member OID string or None if not found.
         """
         symbol = symbol.upper().replace(".IS", "").replace(".E", "")
-        current_time = time.time()
-
-        # Check cache
-        if (
-            self._oid_map is not None
-            and (current_time - self._oid_cache_time) < self.CACHE_DURATION
-        ):
-            return self._oid_map.get(symbol)
-
-        # Fetch BIST companies list from KAP
         try:
-            response = self._client.get(self.BIST_COMPANIES_URL, timeout=20)
-            response.raise_for_status()
-
-            # Parse mkkMemberOid and stockCode pairs from Next.js data
-            # Format: \"mkkMemberOid\":\"xxx\",\"kapMemberTitle\":\"...\",
-            #         \"relatedMemberTitle\":\"...\",\"stockCode\":\"THYAO\",...
-            # Note: stockCode may contain multiple codes like "GARAN, TGB"
-            pattern = (
-                r'\\"mkkMemberOid\\":\\"([^\\"]+)\\",'
-                r'\\"kapMemberTitle\\":\\"[^\\"]+\\",'
-                r'\\"relatedMemberTitle\\":\\"[^\\"]*\\",'
-                r'\\"stockCode\\":\\"([^\\"]+)\\"'
-            )
-            matches = re.findall(pattern, response.text)
-
-            # Build mapping: stockCode -> mkkMemberOid
-            # Handle multiple codes per company (e.g., "GARAN, TGB")
-            self._oid_map = {}
-            for oid, codes_str in matches:
-                for code in codes_str.split(","):
-                    code = code.strip()
-                    if code:
-                        self._oid_map[code] = oid
-
-            self._oid_cache_time = current_time
-            return self._oid_map.get(symbol)
-
+            oid_map = self._snapshot("kap:oid_map", self._fetch_oid_map)
         except Exception:
             return None
+        return oid_map.get(symbol)
+
+    def _fetch_oid_map(self) -> dict[str, str]:
+        """Scrape the stockCode -> mkkMemberOid map from the BIST companies page."""
+        response = self._client.get(self.BIST_COMPANIES_URL, timeout=20)
+        response.raise_for_status()
+
+        # Parse mkkMemberOid and stockCode pairs from Next.js data
+        # Format: \"mkkMemberOid\":\"xxx\",\"kapMemberTitle\":\"...\",
+        #         \"relatedMemberTitle\":\"...\",\"stockCode\":\"THYAO\",...
+        # Note: stockCode may contain multiple codes like "GARAN, TGB"
+        pattern = (
+            r'\\"mkkMemberOid\\":\\"([^\\"]+)\\",'
+            r'\\"kapMemberTitle\\":\\"[^\\"]+\\",'
+            r'\\"relatedMemberTitle\\":\\"[^\\"]*\\",'
+            r'\\"stockCode\\":\\"([^\\"]+)\\"'
+        )
+        matches = re.findall(pattern, response.text)
+
+        # Build mapping: stockCode -> mkkMemberOid
+        # Handle multiple codes per company (e.g., "GARAN, TGB")
+        oid_map = {}
+        for oid, codes_str in matches:
+            for code in codes_str.split(","):
+                code = code.strip()
+                if code:
+                    oid_map[code] = oid
+        if not oid_map:
+            # Don't persist an empty map over a good one
+            raise APIError("No companies found on the KAP BIST companies page")
+        return oid_map
+
+    def _snapshot(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Cached result of a slow scrape that is kept (and persisted) long-term.
+
+        The value is stored with its scrape time under a long TTL. Once it is
+        older than CACHE_DURATION it is still returned immediately while one
+        background thread scrapes it again, so only the very first lookup
+        (with an empty disk cache) waits for the scrape.
+        """
+
+        def scrape() -> _Snapshot:
+            snapshot = _Snapshot(fetch(), time.time())
+            self._cache_set(key, snapshot, TTL.HISTORY_STORE)
+            return snapshot
+
+        snapshot = self._cache_get(key)
+        if snapshot is None:
+            snapshot = self._single_flight(key, scrape)
+        elif time.time() - snapshot.fetched_at >= self.CACHE_DURATION:
+            self._refresh_in_background(
+                key, lambda: self._single_flight(key, scrape, check_cache=False)
+            )
+        return snapshot.data
 
     def get_disclosures(self, symbol: str, limit: int = 20) -> pd.DataFrame:
         """
@@ -245,29 +375,40 @@ class KAPProvider(BaseProvider):
             response = self._client.get(disc_url, timeout=15)
             response.raise_for_status()
 
-            # Parse disclosures from Next.js embedded data
-            # Format: publishDate\\":\\"29.12.2025 19:21:18\\",\\"disclosureIndex\\":1530826...
-            pattern = (
-                r'publishDate\\":\\"([^\\"]+)\\".*?'
-                r'disclosureIndex\\":(\d+).*?'
-                r'title\\":\\"([^\\"]+)\\"'
-            )
-            matches = re.findall(pattern, response.text, re.DOTALL)
-
-            records = []
-            for date, idx, title in matches[:limit]:
-                url = f"https://www.kap.org.tr/tr/Bildirim/{idx}"
-                records.append({
-                    "Date": date,
-                    "Title": title,
-                    "URL": url,
-                })
+            records = [
+                {"Date": item["date"], "Title": item["title"], "URL": item["url"]}
+                for item in _parse_disclosures(response.text)[:limit]
+            ]
 
             return pd.DataFrame(records)
 
         except Exception as e:
             raise APIError(f"Failed to fetch disclosures for {symbol}: {e}") from e
 
+    def get_latest_disclosures(self) -> list[dict]:
+        """
+        Get the latest disclosures across all of BIST (one page, newest first).
+
+        Returns:
+            Dicts with id, date, title, url and symbols (the stock codes the
+            disclosure is about).
+
+        Raises:
+            APIError: If the page can't be fetched or has no disclosures.
+        """
+        try:
+            response = self._client.get(self.DISCLOSURE_URL, timeout=15)
+            response.raise_for_status()
+        except Exception as e:
+            raise APIError(f"Failed to fetch latest disclosures: {e}") from e
+
+        items = _parse_disclosures(response.text)
+        # An empty page or one without stock codes means the layout changed;
+        # callers fall back to per-symbol queries
+        if not any(item["symbols"] for item in items):
+            raise APIError("No disclosures found on the KAP disclosure page")
+        return items
+
     def get_calendar(self, symbol: str) -> pd.DataFrame:
         """
         Get expected disclosure calendar for a stock from KAP.
@@ -295,9 +436,96 @@ class KAPProvider(BaseProvider):
 
         # Calculate date range: today to 6 months from now
         now = datetime.now()
-        start_date = now.strftime("%Y-%m-%d")
-        end_date = (now + timedelta(days=180)).strftime("%Y-%m-%d")
 
+        try:
+            data = self._expected_disclosures(
+                [member_oid], now, now + timedelta(days=180)
+            )
+
+            records = []
+            for item in data:
+                records.append({
+                    "StartDate": item.get("startDate", ""),
+                    "EndDate": item.get("endDate", ""),
+                    "Subject": item.get("subject", ""),
+                    "Period": item.get("ruleTypeTerm", ""),
+                    "Year": item.get("year", ""),
+                })
+
+            return pd.DataFrame(records)
+
+        except Exception as e:
+            raise APIError(f"Failed to fetch calendar for {symbol}: {e}") from e
+
+    def get_expected_disclosures(
+        self,
+        symbols: list[str] | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> pd.DataFrame:
+        """
+        Get the expected disclosure calendar for many stocks in one request.
+
+        Args:
+            symbols: Stock symbols, or None for all BIST companies.
+            start: Window start (default: today).
+            end: Window end (default: 6 months from start).
+
+        Returns:
+            DataFrame with columns: Symbol, StartDate, EndDate, Subject,
+            Period, Year (see get_calendar).
+
+        Raises:
+            APIError: If the calendar can't be fetched.
+        """
+        start = start or datetime.now()
+        end = end or start + timedelta(days=180)
+        oid_map = self._snapshot("kap:oid_map", self._fetch_oid_map)
+        if symbols is None:
+            oids = []
+        else:
+            symbols = [s.upper().replace(".IS", "").replace(".E", "") for s in symbols]
+            oids = list(dict.fromkeys(oid_map[s] for s in symbols if s in oid_map))
+            if not oids:
+                return pd.DataFrame(
+                    columns=["Symbol", "StartDate", "EndDate", "Subject", "Period", "Year"]
+                )
+
+        try:
+            data = self._expected_disclosures(oids, start, end)
+        except Exception as e:
+            raise APIError(f"Failed to fetch expected disclosures: {e}") from e
+
+        # Items carry the member OID; a member may list several stock codes
+        codes_by_oid: dict[str, list[str]] = {}
+        for code, oid in oid_map.items():
+            codes_by_oid.setdefault(oid, []).append(code)
+        wanted = set(symbols) if symbols is not None else None
+
+        records = []
+        for item in data:
+            codes = [
+                code.strip() for code in str(item.get("stockCode") or "").split(",") if code.strip()
+            ] or codes_by_oid.get(item.get("mkkMemberOid"), [])
+            for code in codes:
+                if wanted is None or code in wanted:
+                    records.append({
+                        "Symbol": code,
+                        "StartDate": item.get("startDate", ""),
+                        "EndDate": item.get("endDate", ""),
+                        "Subject": item.get("subject", ""),
+                        "Period": item.get("ruleTypeTerm", ""),
+                        "Year": item.get("year", ""),
+                    })
+
+        return pd.DataFrame(
+            records, columns=["Symbol", "StartDate", "EndDate", "Subject", "Period", "Year"]
+        )
+
+    def _expected_disclosures(
+        self, member_oids: list[str], start: datetime, end: datetime
+    ) -> list[dict]:
+        """Query KAP expected disclosures for members (all IGS members if empty)."""
         # Fetch expected disclosures from KAP API
         headers = {
             "Accept": "*/*",
@@ -306,10 +534,10 @@ class KAPProvider(BaseProvider):
             "Referer": "https://kap.org.tr/tr/beklenen-bildirim-sorgu",
         }
         payload = {
-            "startDate": start_date,
-            "endDate": end_date,
+            "startDate": start.strftime("%Y-%m-%d"),
+            "endDate": end.strftime("%Y-%m-%d"),
             "memberTypes": ["IGS"],
-            "mkkMemberOidList": [member_oid],
+            "mkkMemberOidList": member_oids,
             "disclosureClass": "",
             "subjects": [],
             "mainSector": "",
@@ -322,30 +550,15 @@ class KAPProvider(BaseProvider):
             "ruleType": "",
         }
 
-        try:
-            response = self._client.post(
-                self.CALENDAR_API_URL,
-                json=payload,
-                headers=headers,
-                timeout=15,
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            records = []
-            for item in data:
-                records.append({
-                    "StartDate": item.get("startDate", ""),
-                    "EndDate": item.get("endDate", ""),
-                    "Subject": item.get("subject", ""),
-                    "Period": item.get("ruleTypeTerm", ""),
-                    "Year": item.get("year", ""),
-                })
-
-            return pd.DataFrame(records)
-
-        except Exception as e:
-            raise APIError(f"Failed to fetch calendar for {symbol}: {e}") from e
+        response = self._client.post(
+            self.CALENDAR_API_URL,
+            json=payload,
+            headers=headers,
+            timeout=15,
+            extensions=RETRY,
+        )
+        response.raise_for_status()
+        return response.json()
 
     def get_company_details(self, symbol: str) -> dict:
         """
@@ -363,68 +576,62 @@ class KAPProvider(BaseProvider):
             - website: Company website URL(s)
         """
         symbol = symbol.upper().replace(".IS", "").replace(".E", "")
-        current_time = time.time()
-
-        # Check cache
-        if symbol in self._company_details_cache:
-            cache_time = self._company_details_cache_time.get(symbol, 0)
-            if (current_time - cache_time) < self.CACHE_DURATION:
-                return self._company_details_cache[symbol]
 
         # Get KAP member OID for the symbol
         member_oid = self.get_member_oid(symbol)
         if not member_oid:
             return {}
 
-        # Fetch company info page
-        url = f"{self.COMPANY_INFO_URL}/{member_oid}"
-
         try:
-            response = self._client.get(url, timeout=15)
-            response.raise_for_status()
-            html = response.text
-
-            result = {}
-
-            # Extract sector: href="/tr/Sektorler?sector=...">SECTOR_NAME</a>
-            sector_match = re.search(
-                r'href="/tr/Sektorler\?sector=[^"]*">([^<]+)</a>',
-                html
-            )
-            if sector_match:
-                result["sector"] = sector_match.group(1).strip()
-
-            # Extract market: href="/tr/Pazarlar?market=...">MARKET_NAME</a>
-            market_match = re.search(
-                r'href="/tr/Pazarlar\?market=[^"]*">([^<]+)</a>',
-                html
-            )
-            if market_match:
-                result["market"] = market_match.group(1).strip()
-
-            # Extract website: after "İnternet Adresi" label
-            # Pattern: <h3...>İnternet Adresi</h3><p class="...">WEBSITE</p>
-            website_match = re.search(
-                r'İnternet Adresi</h3><p[^>]*>([^<]+)</p>',
-                html
+            return self._snapshot(
+                f"kap:company:{symbol}", lambda: self._fetch_company_details(member_oid)
             )
-            if website_match:
-                result["website"] = website_match.group(1).strip()
-
-            # Get business summary from genel page
-            business_summary = self._get_business_summary(member_oid)
-            if business_summary:
-                result["businessSummary"] = business_summary
-
-            # Cache result
-            self._company_details_cache[symbol] = result
-            self._company_details_cache_time[symbol] = current_time
-
-            return result
-
         except Exception:
             return {}
 
+    def _fetch_company_details(self, member_oid: str) -> dict:
+        """Scrape sector, market, website and business summary for a member."""
+        # Fetch company info page
+        url = f"{self.COMPANY_INFO_URL}/{member_oid}"
+
+        response = self._client.get(url, timeout=15)
+        response.raise_for_status()
+        html = response.text
+
+        result = {}
+
+        # Extract sector: href="/tr/Sektorler?sector=...">SECTOR_NAME</a>
+        sector_match = re.search(
+            r'href="/tr/Sektorler\?sector=[^"]*">([^<]+)</a>',
+            html
+        )
+        if sector_match:
+            result["sector"] = sector_match.group(1).strip()
+
+        # Extract market: href="/tr/Pazarlar?market=...">MARKET_NAME</a>
+        market_match = re.search(
+            r'href="/tr/Pazarlar\?market=[^"]*">([^<]+)</a>',
+            html
+        )
+        if market_match:
+            result["market"] = market_match.group(1).strip()
+
+        # Extract website: after "İnternet Adresi" label
+        # Pattern: <h3...>İnternet Adresi</h3><p class="...">WEBSITE</p>
+        website_match = re.search(
+            r'İnternet Adresi</h3><p[^>]*>([^<]+)</p>',
+            html
+        )
+        if website_match:
+            result["website"] = website_match.group(1).strip()
+
+        # Get business summary from genel page
+        business_summary = self._get_business_summary(member_oid)
+        if business_summary:
+            result["businessSummary"] = business_summary
+
+        return result
+
     def _get_business_summary(self, member_oid: str) -> str | None:
         """Get business summary (Faaliyet Konusu) from KAP genel page."""
         url = f"{self.COMPANY_GENERAL_URL}/{member_oid}"
@@ -1,15 +1,26 @@
 """Paratic provider for historical OHLCV data."""
 
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
 
 import pandas as pd
 
-from borsapy._providers.base import BaseProvider
-from borsapy.cache import TTL
+from borsapy._providers.base import AsyncBaseProvider, BaseProvider, Call, Steps, async_provider
+from borsapy._providers.columnar import frame_from_records, loads
+from borsapy.cache import TTL, StaleTTL
 from borsapy.exceptions import APIError, DataNotAvailableError, TickerNotFoundError
 
 
+@dataclass
+class _HistoryStore:
+    """Longest series fetched so far for one symbol and interval."""
+
+    data: pd.DataFrame
+    start: datetime  # Series is complete from here (no older bars are missing)
+    fetched_at: datetime  # Series is complete up to here
+
+
 class ParaticProvider(BaseProvider):
     """
     Provider for historical OHLCV data from Paratic.
@@ -39,6 +50,9 @@ class ParaticProvider(BaseProvider):
         "max": 3650,  # 10 years max
     }
 
+    # Upper bound on backward pages per range request
+    MAX_PAGES = 20
+
     # Interval mapping (minutes)
     INTERVAL_MAP = {
         "1m": 1,
@@ -61,28 +75,40 @@ class ParaticProvider(BaseProvider):
             symbol: Stock symbol (e.g., "THYAO", "GARAN").
 
         Returns:
-            Dictionary with current market data.
+            Dictionary with current market data. ``stale`` is True when the
+            quote is past its TTL and a refresh is running in the background.
         """
         symbol = symbol.upper().replace(".IS", "").replace(".E", "")
 
         cache_key = f"paratic:quote:{symbol}"
-        cached = self._cache_get(cache_key)
+        cached = self._cache_get(cache_key, refresh=lambda: self._fetch_quote(symbol))
         if cached is not None:
             return cached
 
-        # Fetch latest data point
+        return self._single_flight(cache_key, lambda: self._fetch_quote(symbol))
+
+    def _fetch_quote(self, symbol: str) -> dict[str, Any]:
+        """Fetch a quote from the API and cache it."""
+        return self._run(self._quote_steps(symbol))
+
+    def _quote_steps(self, symbol: str) -> Steps[dict[str, Any]]:
+        """Request generator for _fetch_quote (see base.Call)."""
+        cache_key = f"paratic:quote:{symbol}"
+
+        # Fetch the last two daily bars; two weeks spans any weekend/holiday gap
         end_dt = datetime.now()
         params = {
             "a": "d",
             "c": symbol,
             "p": 1440,  # Daily
-            "from": "",
+            "from": (end_dt - timedelta(days=14)).strftime("%Y%m%d%H%M%S"),
             "at": end_dt.strftime("%Y%m%d%H%M%S"),
             "group": "f",
         }
 
         try:
-            response = self._get(self.BASE_URL, params=params, headers=self.HEADERS)
+            response = yield Call("GET", self.BASE_URL, params=params, headers=self.HEADERS)
+            response.raise_for_status()
             data = response.json()
         except Exception as e:
             raise APIError(f"Failed to fetch quote for {symbol}: {e}") from e
@@ -121,9 +147,10 @@ class ParaticProvider(BaseProvider):
             "change": round(change, 2),
             "change_percent": round(change_pct, 2),
             "update_time": datetime.fromtimestamp(latest.get("d", 0) / 1000),
+            "stale": False,
         }
 
-        self._cache_set(cache_key, result, TTL.REALTIME_PRICE)
+        self._cache_set(cache_key, result, TTL.REALTIME_PRICE, stale=StaleTTL.REALTIME_PRICE)
         return result
 
     def get_history(
@@ -137,6 +164,10 @@ class ParaticProvider(BaseProvider):
         """
         Get historical OHLCV data for a symbol.
 
+        Bars are kept in a per-symbol, per-interval store holding the longest
+        series fetched so far. Requests are answered by slicing the store, and
+        only the bars after the last stored one are fetched when it is stale.
+
         Args:
             symbol: Stock symbol (e.g., "THYAO", "GARAN").
             period: Data period (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max).
@@ -149,55 +180,171 @@ class ParaticProvider(BaseProvider):
         """
         # Normalize symbol
         symbol = symbol.upper().replace(".IS", "").replace(".E", "")
-
-        # Cache key
-        cache_key = f"paratic:history:{symbol}:{period}:{interval}"
-        if start:
-            cache_key += f":{start.isoformat()}"
-        if end:
-            cache_key += f":{end.isoformat()}"
-
-        cached = self._cache_get(cache_key)
-        if cached is not None:
-            return cached
-
-        # Calculate date range
+        start_dt, end_dt = self._date_range(period, start, end)
+
+        store_key = f"paratic:history:{symbol}:{interval}"
+        store = self._cache_get(store_key)
+        # Loop: a flight led by a caller with a shorter range may not cover ours
+        while not self._store_covers(store, start_dt, end_dt):
+            store = self._single_flight(
+                store_key,
+                lambda: self._run(
+                    self._update_store_steps(store_key, symbol, interval, start_dt, end_dt)
+                ),
+                check_cache=False,
+            )
+
+        return self._slice(store.data, start_dt, end_dt)
+
+    def _date_range(
+        self, period: str, start: datetime | None, end: datetime | None
+    ) -> tuple[datetime, datetime]:
+        """Resolve period/start/end to a (start, end) datetime range."""
         end_dt = end or datetime.now()
         if start:
-            start_dt = start
-        else:
-            days = self._get_period_days(period)
-            start_dt = end_dt - timedelta(days=days)
+            return start, end_dt
+        return end_dt - timedelta(days=self._get_period_days(period)), end_dt
+
+    def _store_covers(
+        self, store: "_HistoryStore | None", start_dt: datetime, end_dt: datetime
+    ) -> bool:
+        """Whether a store can answer [start_dt, end_dt] without a request."""
+        if store is None or store.start > start_dt:
+            return False
+        if end_dt <= store.fetched_at:
+            return True
+        # Requests up to "now" accept a tail as old as the usual history TTL
+        return (datetime.now() - store.fetched_at).total_seconds() < TTL.OHLCV_HISTORY
+
+    def _update_store_steps(
+        self,
+        store_key: str,
+        symbol: str,
+        interval: str,
+        start_dt: datetime,
+        end_dt: datetime,
+    ) -> Steps["_HistoryStore"]:
+        """Extend the stored series to cover [start_dt, end_dt] and cache it."""
+        store = self._cache.get(store_key, track=False)
+        if self._store_covers(store, start_dt, end_dt):
+            # Another caller updated it while we waited
+            return store
 
-        # Get interval in minutes
         interval_minutes = self.INTERVAL_MAP.get(interval, 1440)
+        now = datetime.now()
+
+        if store is None or store.data.empty:
+            # Look back a little further than asked, so short periods that fall
+            # on weekends/holidays still find bars and an empty result really
+            # means the symbol has no data
+            lookback = timedelta(days=14 if interval_minutes >= 1440 else 4)
+            from_dt = min(start_dt, now - lookback)
+            df = yield from self._fetch_range_steps(symbol, interval_minutes, from_dt, now)
+            if df.empty:
+                raise DataNotAvailableError(f"No data available for {symbol}")
+            store = _HistoryStore(data=df, start=min(from_dt, df.index[0]), fetched_at=now)
+        else:
+            data, store_start, fetched_at = store.data, store.start, store.fetched_at
+            if start_dt < store_start:
+                # Older bars requested: fetch only the missing head
+                head = yield from self._fetch_range_steps(
+                    symbol, interval_minutes, start_dt, store_start
+                )
+                data = self._merge(head, data)
+                store_start = start_dt
+            if not self._store_covers(
+                _HistoryStore(data=data, start=store_start, fetched_at=fetched_at),
+                start_dt,
+                end_dt,
+            ):
+                # Refetch from the last stored bar, which may have been an
+                # unfinished (intraday/in-session) bar
+                tail = yield from self._fetch_range_steps(
+                    symbol, interval_minutes, data.index[-1], now
+                )
+                data = self._merge(data, tail)
+                fetched_at = now
+            store = _HistoryStore(data=data, start=min(store_start, data.index[0]), fetched_at=fetched_at)
+
+        self._cache_set(store_key, store, TTL.HISTORY_STORE)
+        return store
+
+    def _fetch_range_steps(
+        self,
+        symbol: str,
+        interval_minutes: int,
+        from_dt: datetime,
+        at_dt: datetime,
+    ) -> Steps[pd.DataFrame]:
+        """
+        Fetch bars in [from_dt, at_dt], paging backwards if a response stops short.
+
+        The API returns the bars before ``at``; if the oldest bar in a response
+        is well after ``from_dt`` the response may have been truncated, so the
+        next page ends just before it. Pages are requested until ``from_dt`` is
+        reached or an empty page shows there is nothing older.
+        """
+        # Weekends and holidays (up to ~9 days for Kurban Bayrami) leave gaps
+        allowed_gap = max(timedelta(days=10), timedelta(minutes=interval_minutes * 3))
+
+        frames = []
+        page_end = at_dt
+        for _ in range(self.MAX_PAGES):
+            data = yield from self._request_bars_steps(symbol, interval_minutes, from_dt, page_end)
+            page = self._parse_response(data, datetime.min, page_end)
+            if page.empty:
+                break
+            frames.append(page)
+            oldest = page.index[0]
+            if oldest - from_dt <= allowed_gap or oldest >= page_end:
+                break
+            page_end = oldest - timedelta(seconds=1)
+
+        if not frames:
+            return self._parse_response([], from_dt, at_dt)
+        return self._merge(*reversed(frames))
+
+    @staticmethod
+    def _merge(*frames: pd.DataFrame) -> pd.DataFrame:
+        """Concatenate bar frames; later frames win on duplicate timestamps."""
+        frames = [f for f in frames if not f.empty]
+        if not frames:
+            return pd.DataFrame(columns=["Open", "High", "Low", "Close", "Volume"])
+        if len(frames) == 1:
+            return frames[0]
+        merged = pd.concat(frames)
+        return merged[~merged.index.duplicated(keep="last")].sort_index()
 
-        # Build API params
+    def _request_bars_steps(
+        self,
+        symbol: str,
+        interval_minutes: int,
+        from_dt: datetime,
+        at_dt: datetime,
+    ) -> Steps[list[dict[str, Any]]]:
+        """Request raw bars between ``from_dt`` and ``at_dt``."""
         params = {
             "a": "d",  # data type
             "c": symbol,
             "p": interval_minutes,
-            "from": "",  # Start from beginning
-            "at": end_dt.strftime("%Y%m%d%H%M%S"),
+            "from": from_dt.strftime("%Y%m%d%H%M%S"),
+            "at": at_dt.strftime("%Y%m%d%H%M%S"),
             "group": "f",
         }
 
         try:
-            response = self._get(self.BASE_URL, params=params, headers=self.HEADERS)
-            data = response.json()
+            response = yield Call("GET", self.BASE_URL, params=params, headers=self.HEADERS)
+            response.raise_for_status()
+            return loads(response.content) or []
         except Exception as e:
             raise APIError(f"Failed to fetch data for {symbol}: {e}") from e
 
-        if not data:
-            raise DataNotAvailableError(f"No data available for {symbol}")
-
-        # Parse response
-        df = self._parse_response(data, start_dt, end_dt)
-
-        # Cache result
-        self._cache_set(cache_key, df, TTL.OHLCV_HISTORY)
-
-        return df
+    @staticmethod
+    def _slice(df: pd.DataFrame, start_dt: datetime, end_dt: datetime) -> pd.DataFrame:
+        """Return a copy of the bars within [start_dt, end_dt]."""
+        if df.empty:
+            return df.copy()
+        return df[(df.index >= start_dt) & (df.index <= end_dt)].copy()
 
     def _get_period_days(self, period: str) -> int:
         """Convert period string to number of days."""
@@ -227,43 +374,15 @@ class ParaticProvider(BaseProvider):
             ...
         ]
         """
-        if not data:
-            return pd.DataFrame(columns=["Open", "High", "Low", "Close", "Volume"])
-
-        records = []
-        for item in data:
-            try:
-                timestamp_ms = item.get("d")
-                if timestamp_ms is None:
-                    continue
-
-                dt = datetime.fromtimestamp(timestamp_ms / 1000)
-
-                # Filter by date range
-                if dt < start_dt or dt > end_dt:
-                    continue
-
-                records.append(
-                    {
-                        "Date": dt,
-                        "Open": float(item.get("o", 0)),
-                        "High": float(item.get("h", 0)),
-                        "Low": float(item.get("l", 0)),
-                        "Close": float(item.get("c", 0)),
-                        "Volume": int(item.get("v", 0)),
-                    }
-                )
-            except (TypeError, ValueError):
-                continue
-
-        if not records:
-            return pd.DataFrame(columns=["Open", "High", "Low", "Close", "Volume"])
-
-        df = pd.DataFrame(records)
-        df.set_index("Date", inplace=True)
-        df.sort_index(inplace=True)
-
-        return df
+        return frame_from_records(
+            data,
+            time_key="d",
+            columns={"o": "Open", "h": "High", "l": "Low", "c": "Close", "v": "Volume"},
+            unit="ms",
+            int_columns=("Volume",),
+            start=start_dt,
+            end=end_dt,
+        )
 
 
 # Singleton instance
@@ -276,3 +395,49 @@ def get_paratic_provider() -> ParaticProvider:
     if _provider is None:
         _provider = ParaticProvider()
     return _provider
+
+
+class AsyncParaticProvider(AsyncBaseProvider, ParaticProvider):
+    """Asyncio version of ParaticProvider's get_quote and get_history."""
+
+    async def get_quote(self, symbol: str) -> dict[str, Any]:
+        """Async version of ParaticProvider.get_quote."""
+        symbol = symbol.upper().replace(".IS", "").replace(".E", "")
+
+        cache_key = f"paratic:quote:{symbol}"
+        cached = self._cache_get(cache_key, refresh=lambda: self._run(self._quote_steps(symbol)))
+        if cached is not None:
+            return cached
+
+        return await self._single_flight(cache_key, lambda: self._run(self._quote_steps(symbol)))
+
+    async def get_history(
+        self,
+        symbol: str,
+        period: str = "1mo",
+        interval: str = "1d",
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> pd.DataFrame:
+        """Async version of ParaticProvider.get_history."""
+        symbol = symbol.upper().replace(".IS", "").replace(".E", "")
+        start_dt, end_dt = self._date_range(period, start, end)
+
+        store_key = f"paratic:history:{symbol}:{interval}"
+        store = self._cache_get(store_key)
+        # Loop: a flight led by a caller with a shorter range may not cover ours
+        while not self._store_covers(store, start_dt, end_dt):
+            store = await self._single_flight(
+                store_key,
+                lambda: self._run(
+                    self._update_store_steps(store_key, symbol, interval, start_dt, end_dt)
+                ),
+                check_cache=False,
+            )
+
+        return self._slice(store.data, start_dt, end_dt)
+
+
+def get_async_paratic_provider() -> AsyncParaticProvider:
+    """Get the Paratic async provider for the running event loop."""
+    return async_provider(AsyncParaticProvider)
@@ -0,0 +1,215 @@
+"""
+Record/replay of provider HTTP traffic, for offline benchmarks and tests.
+
+Responses are captured once from the live sites and then served from fixture
+files, with optional artificial latency:
+
+    >>> from borsapy._providers.replay import use_fixtures
+    >>> with use_fixtures("fixtures", mode="record"):
+    ...     bp.Ticker("THYAO").history(period="1y")      # hits Paratic, saves
+    >>> with use_fixtures("fixtures", latency=0.05):
+    ...     bp.Ticker("THYAO").history(period="1y")      # offline, 50ms/request
+
+Fixtures apply to every provider (sync and async) because they are consulted
+by the shared pooled transport; host policies (rate limits, retries) and
+request metrics still run as usual.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import random
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import parse_qsl
+
+import httpx
+
+from borsapy._providers import transport
+
+# Query/form fields carrying the current time or a date window. They are left
+# out of fixture keys so a recording still matches on later days.
+VOLATILE_PARAMS = frozenset(
+    {"from", "at", "to", "start", "end", "bastarih", "bittarih", "_", "ts", "timestamp"}
+)
+
+# Response headers not stored (bodies are stored decoded)
+_DROP_HEADERS = frozenset(
+    {"content-encoding", "transfer-encoding", "content-length", "connection", "keep-alive", "date", "set-cookie"}
+)
+
+MODES = ("replay", "record", "auto")
+
+
+class FixtureNotFoundError(LookupError):
+    """Raised in replay mode for a request that has no recorded response."""
+
+
+class FixtureStore:
+    """
+    Recorded responses in a directory, one JSON file per request key.
+
+    A key is the method, host, path and the non-volatile query/form fields.
+    Requests that share a key (e.g. TEFAS history chunks differing only in
+    dates) are recorded as a list and replayed in the same order, cycling.
+
+    Args:
+        path: Fixture directory.
+        mode: "replay" (fixtures only), "record" (network, overwriting
+            fixtures touched in this session) or "auto" (replay, recording
+            what is missing).
+        latency: Seconds added to each replayed response, or a (min, max)
+            range to draw from.
+        ignore_params: Query/form fields left out of keys.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        mode: str = "replay",
+        latency: float | tuple[float, float] = 0.0,
+        ignore_params: frozenset[str] = VOLATILE_PARAMS,
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Invalid mode: {mode}. Use one of {MODES}")
+        self.path = Path(path).expanduser()
+        self.mode = mode
+        self.latency = latency
+        self.ignore_params = ignore_params
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+        self._lock = threading.Lock()
+        self._loaded: dict[str, list[dict]] = {}
+        self._served: dict[str, int] = {}
+        self._touched: set[str] = set()
+
+    def key(self, request: httpx.Request) -> str:
+        """Fixture file name (relative to the store) for ``request``."""
+        params = sorted(
+            (k, v) for k, v in request.url.params.multi_items() if k not in self.ignore_params
+        )
+        body = request.read()
+        if "application/x-www-form-urlencoded" in request.headers.get("content-type", ""):
+            fields = parse_qsl(body.decode("utf-8", "replace"), keep_blank_values=True)
+            body_key = sorted((k, v) for k, v in fields if k not in self.ignore_params)
+        else:
+            body_key = hashlib.sha1(body).hexdigest() if body else ""
+        digest = hashlib.sha1(
+            json.dumps([request.method, request.url.path, params, body_key]).encode()
+        ).hexdigest()[:16]
+        slug = request.url.path.strip("/").replace("/", "_")[-60:] or "root"
+        return f"{request.url.host}/{request.method}-{slug}-{digest}.json"
+
+    def lookup(self, request: httpx.Request) -> httpx.Response | None:
+        """The next recorded response for ``request``, or None."""
+        key = self.key(request)
+        with self._lock:
+            entries = self._load(key)
+            if not entries:
+                return None
+            index = self._served.get(key, 0)
+            self._served[key] = index + 1
+            entry = entries[index % len(entries)]
+            self.hits += 1
+        return httpx.Response(
+            entry["status"],
+            headers=entry["headers"],
+            content=base64.b64decode(entry["body"]),
+        )
+
+    def save(self, request: httpx.Request, response: httpx.Response) -> None:
+        """Record ``response`` (already read) for ``request``."""
+        key = self.key(request)
+        entry = {
+            "request": {"method": request.method, "url": str(request.url)},
+            "status": response.status_code,
+            "headers": [
+                (k, v) for k, v in response.headers.multi_items() if k.lower() not in _DROP_HEADERS
+            ],
+            "body": base64.b64encode(response.content).decode("ascii"),
+        }
+        with self._lock:
+            # The first recording of a key in a session replaces the old file
+            entries = self._load(key) if key in self._touched else []
+            entries.append(entry)
+            self._loaded[key] = entries
+            self._touched.add(key)
+            self.recorded += 1
+            file = self.path / key
+            file.parent.mkdir(parents=True, exist_ok=True)
+            file.write_text(json.dumps(entries, ensure_ascii=False, indent=1), encoding="utf-8")
+
+    def _load(self, key: str) -> list[dict]:
+        if key not in self._loaded:
+            file = self.path / key
+            self._loaded[key] = json.loads(file.read_text(encoding="utf-8")) if file.exists() else []
+        return self._loaded[key]
+
+    def _delay(self) -> float:
+        if isinstance(self.latency, tuple):
+            return random.uniform(*self.latency)
+        return self.latency
+
+    def handle_request(
+        self, request: httpx.Request, network: httpx.BaseTransport
+    ) -> httpx.Response:
+        """Serve ``request`` from fixtures, or from ``network`` when recording."""
+        if self.mode != "record":
+            response = self.lookup(request)
+            if response is not None:
+                if delay := self._delay():
+                    time.sleep(delay)
+                return response
+            if self.mode == "replay":
+                self.misses += 1
+                raise FixtureNotFoundError(f"No fixture for {request.method} {request.url}")
+
+        response = network.handle_request(request)
+        response.read()
+        self.save(request, response)
+        return response
+
+    async def handle_async_request(
+        self, request: httpx.Request, network: httpx.AsyncBaseTransport
+    ) -> httpx.Response:
+        """Async version of handle_request."""
+        if self.mode != "record":
+            response = self.lookup(request)
+            if response is not None:
+                if delay := self._delay():
+                    await asyncio.sleep(delay)
+                return response
+            if self.mode == "replay":
+                self.misses += 1
+                raise FixtureNotFoundError(f"No fixture for {request.method} {request.url}")
+
+        response = await network.handle_async_request(request)
+        await response.aread()
+        self.save(request, response)
+        return response
+
+
+@contextmanager
+def use_fixtures(
+    path: str | Path,
+    mode: str = "replay",
+    latency: float | tuple[float, float] = 0.0,
+    ignore_params: frozenset[str] = VOLATILE_PARAMS,
+) -> Iterator[FixtureStore]:
+    """
+    Route all provider requests made inside the block through a FixtureStore.
+
+    Applies process-wide (worker and refresh threads included), not just to
+    the current thread. See FixtureStore for the arguments.
+    """
+    store = FixtureStore(path, mode=mode, latency=latency, ignore_params=ignore_params)
+    previous = transport.set_fixture_store(store)
+    try:
+        yield store
+    finally:
+        transport.set_fixture_store(previous)
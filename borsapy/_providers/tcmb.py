@@ -8,6 +8,7 @@ import pandas as pd
 from bs4 import BeautifulSoup
 
 from borsapy._providers.base import BaseProvider
+from borsapy._providers.transport import RETRY
 from borsapy.cache import TTL
 from borsapy.exceptions import APIError, DataNotAvailableError
 
@@ -95,7 +96,7 @@ class TCMBProvider(BaseProvider):
             }
 
             response = self._client.post(
-                self.CALC_API_URL, headers=headers, json=payload, timeout=30.0
+                self.CALC_API_URL, headers=headers, json=payload, timeout=30.0, extensions=RETRY
             )
             response.raise_for_status()
             data = response.json()
@@ -138,26 +139,26 @@ class TCMBProvider(BaseProvider):
         if inflation_type not in self.INFLATION_PATHS:
             raise ValueError(f"Invalid type: {inflation_type}. Use 'tufe' or 'ufe'")
 
-        cache_key = f"tcmb:data:{inflation_type}"
-        cached = self._cache_get(cache_key)
-
-        if cached is None:
-            try:
-                url = self.BASE_URL + self.INFLATION_PATHS[inflation_type]
-                headers = {
-                    "Accept": "text/html,application/xhtml+xml",
-                    "Accept-Language": "tr-TR,tr;q=0.9",
-                    "User-Agent": self.DEFAULT_HEADERS["User-Agent"],
-                }
-
-                response = self._client.get(url, headers=headers, timeout=30.0)
-                response.raise_for_status()
+        try:
+            url = self.BASE_URL + self.INFLATION_PATHS[inflation_type]
+            headers = {
+                "Accept": "text/html,application/xhtml+xml",
+                "Accept-Language": "tr-TR,tr;q=0.9",
+                "User-Agent": self.DEFAULT_HEADERS["User-Agent"],
+            }
 
-                cached = self._parse_inflation_table(response.text)
-                self._cache_set(cache_key, cached, TTL.FX_RATES)
+            # The page changes monthly; after TTL.FX_RATES it is revalidated
+            # and only re-parsed when the server reports a change
+            cached = self._get_revalidated(
+                f"tcmb:data:{inflation_type}",
+                url,
+                lambda response: self._parse_inflation_table(response.text),
+                TTL.FX_RATES,
+                headers=headers,
+            )
 
-            except Exception as e:
-                raise APIError(f"Failed to fetch inflation data: {e}") from e
+        except Exception as e:
+            raise APIError(f"Failed to fetch inflation data: {e}") from e
 
         df = pd.DataFrame(cached)
         if df.empty:
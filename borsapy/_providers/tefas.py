@@ -1,13 +1,26 @@
 """TEFAS provider for mutual fund data."""
 
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
 
+import httpx
+import numpy as np
 import pandas as pd
 import urllib3
 
-from borsapy._providers.base import BaseProvider
-from borsapy.cache import TTL
+from borsapy._providers.base import (
+    AsyncBaseProvider,
+    Batch,
+    BaseProvider,
+    Call,
+    Steps,
+    async_provider,
+)
+from borsapy._providers.columnar import epoch_to_index, frame_from_records, loads
+from borsapy._providers.transport import RETRY
+from borsapy.cache import TTL, StaleTTL
 from borsapy.exceptions import APIError, DataNotAvailableError
 
 # Disable SSL warnings for TEFAS
@@ -91,6 +104,15 @@ ASSET_NAME_STANDARDIZATION = {
 }
 
 
+@dataclass
+class _FundMatrix:
+    """Daily history of every fund of one type, as fetched so far."""
+
+    data: pd.DataFrame  # Date x (field, fund_code)
+    start: datetime  # Matrix is complete from here (no older days are missing)
+    fetched_at: datetime  # Matrix is complete up to here
+
+
 class TEFASProvider(BaseProvider):
     """
     Provider for mutual fund data from TEFAS.
@@ -125,91 +147,130 @@ class TEFASProvider(BaseProvider):
         if cached is not None:
             return cached
 
+        return self._single_flight(cache_key, lambda: self._fetch_fund_detail(fund_code))
+
+    def _fetch_fund_detail(self, fund_code: str) -> dict[str, Any]:
+        """Fetch fund details from the API and cache them."""
+        return self._run(self._fund_detail_steps(fund_code))
+
+    def _fund_detail_steps(self, fund_code: str) -> Steps[dict[str, Any]]:
+        """Request generator for _fetch_fund_detail (see base.Call)."""
         try:
-            url = f"{self.BASE_URL}/GetAllFundAnalyzeData"
-            data = {"dil": "TR", "fonkod": fund_code}
+            response = yield self._fund_detail_call(fund_code)
+            detail = self._parse_fund_detail(fund_code, response)
+        except Exception as e:
+            raise APIError(f"Failed to fetch fund detail for {fund_code}: {e}") from e
 
-            headers = {
-                "Content-Type": "application/x-www-form-urlencoded; charset=utf-8",
-                "User-Agent": self.DEFAULT_HEADERS["User-Agent"],
-                "Accept": "application/json, text/plain, */*",
-            }
+        self._cache_set(f"tefas:detail:{fund_code}", detail, TTL.FX_RATES)
+        return detail
 
-            response = self._client.post(url, data=data, headers=headers)
-            response.raise_for_status()
-            result = response.json()
+    def _fund_detail_call(self, fund_code: str) -> Call:
+        """GetAllFundAnalyzeData request for one fund."""
+        url = f"{self.BASE_URL}/GetAllFundAnalyzeData"
+        data = {"dil": "TR", "fonkod": fund_code}
 
-            if not result or not result.get("fundInfo"):
-                raise DataNotAvailableError(f"No data for fund: {fund_code}")
-
-            fund_info = result["fundInfo"][0]
-            fund_return = result.get("fundReturn", [{}])[0] if result.get("fundReturn") else {}
-            fund_profile = result.get("fundProfile", [{}])[0] if result.get("fundProfile") else {}
-            fund_allocation = result.get("fundAllocation", [])
-
-            # Parse allocation data
-            allocation = None
-            if fund_allocation:
-                allocation = []
-                for item in fund_allocation:
-                    weight = float(item.get("PORTFOYORANI", 0) or 0)
-                    if weight > 0:
-                        asset_type_tr = item.get("KIYMETTIP", "")
-                        allocation.append({
-                            "asset_type": asset_type_tr,
-                            "asset_name": ASSET_NAME_STANDARDIZATION.get(asset_type_tr, asset_type_tr),
-                            "weight": weight,
-                        })
-                # Sort by weight descending
-                allocation.sort(key=lambda x: x["weight"], reverse=True)
-
-            detail = {
-                "fund_code": fund_code,
-                "name": fund_info.get("FONUNVAN", ""),
-                "date": fund_info.get("TARIH", ""),
-                "price": float(fund_info.get("SONFIYAT", 0) or 0),
-                "fund_size": float(fund_info.get("PORTBUYUKLUK", 0) or 0),
-                "investor_count": int(fund_info.get("YATIRIMCISAYI", 0) or 0),
-                "founder": fund_info.get("KURUCU", ""),
-                "manager": fund_info.get("YONETICI", ""),
-                "fund_type": fund_info.get("FONTUR", ""),
-                "category": fund_info.get("FONKATEGORI", ""),
-                "risk_value": int(fund_info.get("RISKDEGERI", 0) or 0),
-                # Performance metrics
-                "return_1m": fund_return.get("GETIRI1A"),
-                "return_3m": fund_return.get("GETIRI3A"),
-                "return_6m": fund_return.get("GETIRI6A"),
-                "return_ytd": fund_return.get("GETIRIYB"),
-                "return_1y": fund_return.get("GETIRI1Y"),
-                "return_3y": fund_return.get("GETIRI3Y"),
-                "return_5y": fund_return.get("GETIRI5Y"),
-                # Daily/weekly change
-                "daily_return": fund_info.get("GUNLUKGETIRI"),
-                "weekly_return": fund_info.get("HAFTALIKGETIRI"),
-                # Category ranking
-                "category_rank": fund_info.get("KATEGORIDERECE"),
-                "category_fund_count": fund_info.get("KATEGORIFONSAY"),
-                "market_share": fund_info.get("PAZARPAYI"),
-                # Fund profile (from fundProfile)
-                "isin": fund_profile.get("ISINKOD"),
-                "last_trading_time": fund_profile.get("SONISSAAT"),
-                "min_purchase": fund_profile.get("MINALIS"),
-                "min_redemption": fund_profile.get("MINSATIS"),
-                "entry_fee": fund_profile.get("GIRISKOMISYONU"),
-                "exit_fee": fund_profile.get("CIKISKOMISYONU"),
-                "kap_link": fund_profile.get("KAPLINK"),
-                # Portfolio allocation (from fundAllocation)
-                "allocation": allocation,
-            }
+        headers = {
+            "Content-Type": "application/x-www-form-urlencoded; charset=utf-8",
+            "User-Agent": self.DEFAULT_HEADERS["User-Agent"],
+            "Accept": "application/json, text/plain, */*",
+        }
 
-            self._cache_set(cache_key, detail, TTL.FX_RATES)
-            return detail
+        return Call("POST", url, data=data, headers=headers, retry=True)
 
-        except Exception as e:
-            raise APIError(f"Failed to fetch fund detail for {fund_code}: {e}") from e
+    def _parse_fund_detail(
+        self, fund_code: str, response: httpx.Response, light: bool = False
+    ) -> dict[str, Any]:
+        """
+        Parse a GetAllFundAnalyzeData response.
+
+        With ``light``, only the fields compare_funds uses are extracted
+        (no profile, ranking or manager fields).
+        """
+        response.raise_for_status()
+        result = loads(response.content)
+
+        if not result or not result.get("fundInfo"):
+            raise DataNotAvailableError(f"No data for fund: {fund_code}")
+
+        fund_info = result["fundInfo"][0]
+        fund_return = result.get("fundReturn", [{}])[0] if result.get("fundReturn") else {}
+        fund_allocation = result.get("fundAllocation", [])
+
+        # Parse allocation data
+        allocation = None
+        if fund_allocation:
+            allocation = []
+            for item in fund_allocation:
+                weight = float(item.get("PORTFOYORANI", 0) or 0)
+                if weight > 0:
+                    asset_type_tr = item.get("KIYMETTIP", "")
+                    allocation.append({
+                        "asset_type": asset_type_tr,
+                        "asset_name": ASSET_NAME_STANDARDIZATION.get(asset_type_tr, asset_type_tr),
+                        "weight": weight,
+                    })
+            # Sort by weight descending
+            allocation.sort(key=lambda x: x["weight"], reverse=True)
+
+        # The light parse skips the profile and the fields compare_funds doesn't show
+        full = not light
+        fund_profile = {}
+        if full and result.get("fundProfile"):
+            fund_profile = result["fundProfile"][0]
+
+        return {
+            "fund_code": fund_code,
+            "name": fund_info.get("FONUNVAN", ""),
+            **({"date": fund_info.get("TARIH", "")} if full else {}),
+            "price": float(fund_info.get("SONFIYAT", 0) or 0),
+            "fund_size": float(fund_info.get("PORTBUYUKLUK", 0) or 0),
+            "investor_count": int(fund_info.get("YATIRIMCISAYI", 0) or 0),
+            "founder": fund_info.get("KURUCU", ""),
+            **({"manager": fund_info.get("YONETICI", "")} if full else {}),
+            "fund_type": fund_info.get("FONTUR", ""),
+            "category": fund_info.get("FONKATEGORI", ""),
+            "risk_value": int(fund_info.get("RISKDEGERI", 0) or 0),
+            # Performance metrics
+            "return_1m": fund_return.get("GETIRI1A"),
+            "return_3m": fund_return.get("GETIRI3A"),
+            "return_6m": fund_return.get("GETIRI6A"),
+            "return_ytd": fund_return.get("GETIRIYB"),
+            "return_1y": fund_return.get("GETIRI1Y"),
+            "return_3y": fund_return.get("GETIRI3Y"),
+            "return_5y": fund_return.get("GETIRI5Y"),
+            # Daily/weekly change
+            "daily_return": fund_info.get("GUNLUKGETIRI"),
+            "weekly_return": fund_info.get("HAFTALIKGETIRI"),
+            **(
+                {
+                    # Category ranking
+                    "category_rank": fund_info.get("KATEGORIDERECE"),
+                    "category_fund_count": fund_info.get("KATEGORIFONSAY"),
+                    "market_share": fund_info.get("PAZARPAYI"),
+                    # Fund profile (from fundProfile)
+                    "isin": fund_profile.get("ISINKOD"),
+                    "last_trading_time": fund_profile.get("SONISSAAT"),
+                    "min_purchase": fund_profile.get("MINALIS"),
+                    "min_redemption": fund_profile.get("MINSATIS"),
+                    "entry_fee": fund_profile.get("GIRISKOMISYONU"),
+                    "exit_fee": fund_profile.get("CIKISKOMISYONU"),
+                    "kap_link": fund_profile.get("KAPLINK"),
+                }
+                if full
+                else {}
+            ),
+            # Portfolio allocation (from fundAllocation)
+            "allocation": allocation,
+        }
 
     # WAF limit for TEFAS API - requests longer than ~90 days get blocked
     MAX_CHUNK_DAYS = 90
+    # Requests in flight at once for chunked and batched fetches; the host
+    # rate limit (see transport.HOST_POLICIES) also applies
+    CHUNK_CONCURRENCY = 4
+    # Extra rounds for failed chunks, waiting CHUNK_RETRY_DELAY * round seconds
+    CHUNK_RETRIES = 2
+    CHUNK_RETRY_DELAY = 1.0
 
     def get_history(
         self,
@@ -235,122 +296,210 @@ class TEFASProvider(BaseProvider):
             to avoid TEFAS WAF blocking.
         """
         fund_code = fund_code.upper()
+        start_dt, end_dt = self._date_range(period, start, end)
 
-        # Calculate date range
-        end_dt = end or datetime.now()
-        if start:
-            start_dt = start
-        else:
-            days = {
-                "1d": 1,
-                "5d": 5,
-                "1mo": 30,
-                "3mo": 90,
-                "6mo": 180,
-                "1y": 365,
-                "3y": 365 * 3,
-                "5y": 365 * 5,
-                "max": 365 * 5,  # Limited to 5y due to WAF constraints
-            }.get(period, 30)
-            start_dt = end_dt - timedelta(days=days)
+        # A fund matrix (see get_history_matrix) answers without a per-fund request
+        from_matrix = self._history_from_matrix(fund_code, start_dt, end_dt)
+        if from_matrix is not None:
+            return from_matrix
 
         cache_key = f"tefas:history:{fund_code}:{start_dt.date()}:{end_dt.date()}"
         cached = self._cache_get(cache_key)
         if cached is not None:
             return cached
 
+        return self._single_flight(
+            cache_key,
+            lambda: self._run(self._history_steps(cache_key, fund_code, start_dt, end_dt)),
+        )
+
+    @staticmethod
+    def _date_range(
+        period: str, start: datetime | None, end: datetime | None
+    ) -> tuple[datetime, datetime]:
+        """Resolve period/start/end to a (start, end) datetime range."""
+        end_dt = end or datetime.now()
+        if start:
+            return start, end_dt
+        days = {
+            "1d": 1,
+            "5d": 5,
+            "1mo": 30,
+            "3mo": 90,
+            "6mo": 180,
+            "1y": 365,
+            "3y": 365 * 3,
+            "5y": 365 * 5,
+            "max": 365 * 5,  # Limited to 5y due to WAF constraints
+        }.get(period, 30)
+        return end_dt - timedelta(days=days), end_dt
+
+    def _history_steps(
+        self, cache_key: str, fund_code: str, start_dt: datetime, end_dt: datetime
+    ) -> Steps[pd.DataFrame]:
+        """Fetch history from the API (chunked if needed) and cache it."""
         # Check if we need chunked requests
         total_days = (end_dt - start_dt).days
         if total_days > self.MAX_CHUNK_DAYS:
-            df = self._get_history_chunked(fund_code, start_dt, end_dt)
+            df = yield from self._history_chunked_steps(fund_code, start_dt, end_dt)
         else:
-            df = self._fetch_history_chunk(fund_code, start_dt, end_dt)
+            df = yield from self._history_chunk_steps(fund_code, start_dt, end_dt)
 
         self._cache_set(cache_key, df, TTL.OHLCV_HISTORY)
         return df
 
-    def _get_history_chunked(
+    def _history_chunked_steps(
         self,
         fund_code: str,
         start_dt: datetime,
         end_dt: datetime,
-    ) -> pd.DataFrame:
+    ) -> Steps[pd.DataFrame]:
         """
         Fetch history in chunks to avoid WAF blocking.
 
-        TEFAS WAF blocks requests longer than ~90-100 days.
-        This method fetches data in chunks and combines them.
+        TEFAS WAF blocks requests longer than ~90-100 days, so the range is
+        split into MAX_CHUNK_DAYS chunks (see _fetch_chunks_steps).
+
+        Raises:
+            APIError: If a chunk still fails after the retries.
+            DataNotAvailableError: If no chunk has data.
         """
-        import time
+        frames = yield from self._fetch_chunks_steps(
+            f"history for {fund_code}",
+            self._split_range(start_dt, end_dt, self.MAX_CHUNK_DAYS),
+            lambda chunk_start, chunk_end, delay: self._history_call(
+                fund_code, chunk_start, chunk_end, delay=delay
+            ),
+            lambda response: self._parse_history(fund_code, response),
+        )
+        if not frames:
+            raise DataNotAvailableError(f"No history for fund: {fund_code}")
 
-        all_records = []
-        chunk_start = start_dt
-        chunk_count = 0
+        # Combine chunks in date order
+        df = pd.concat(frames)
+        df = df[~df.index.duplicated(keep="last")]  # Remove duplicate dates
+        df.sort_index(inplace=True)
+        return df
 
+    @staticmethod
+    def _split_range(start_dt: datetime, end_dt: datetime, days: int) -> list[tuple[datetime, datetime]]:
+        """Split [start_dt, end_dt] into consecutive inclusive ranges of at most ``days``."""
+        chunks = []
+        chunk_start = start_dt
         while chunk_start < end_dt:
-            chunk_end = min(chunk_start + timedelta(days=self.MAX_CHUNK_DAYS), end_dt)
-
-            try:
-                # Add delay between requests to avoid rate limiting
-                if chunk_count > 0:
-                    time.sleep(0.3)
-
-                chunk_df = self._fetch_history_chunk(fund_code, chunk_start, chunk_end)
-                if not chunk_df.empty:
-                    all_records.append(chunk_df)
-                chunk_count += 1
-            except DataNotAvailableError:
-                # No data for this chunk, continue to next
-                pass
-            except APIError:
-                # WAF blocked - stop fetching older data
-                # Return what we have so far
-                break
-
-            # Move to next chunk
+            chunk_end = min(chunk_start + timedelta(days=days), end_dt)
+            chunks.append((chunk_start, chunk_end))
             chunk_start = chunk_end + timedelta(days=1)
+        return chunks
 
-        if not all_records:
-            raise DataNotAvailableError(f"No history for fund: {fund_code}")
+    def _fetch_chunks_steps(
+        self,
+        what: str,
+        chunks: list[tuple[datetime, datetime]],
+        make_call: Callable[[datetime, datetime, float], Call],
+        parse: Callable[[httpx.Response], pd.DataFrame],
+    ) -> Steps[list[pd.DataFrame]]:
+        """
+        Fetch date-range chunks concurrently and parse them.
 
-        # Combine all chunks
-        df = pd.concat(all_records)
-        df = df[~df.index.duplicated(keep="last")]  # Remove duplicate dates
-        df.sort_index(inplace=True)
-        return df
+        At most CHUNK_CONCURRENCY requests are in flight (within the host's
+        rate limit). Chunks that fail are retried up to CHUNK_RETRIES times;
+        chunks without data (DataNotAvailableError from ``parse``) are skipped.
+
+        Returns:
+            Parsed frames in chunk (date) order.
 
-    def _fetch_history_chunk(
+        Raises:
+            APIError: If a chunk still fails after the retries.
+        """
+        frames: dict[int, pd.DataFrame] = {}
+        pending = list(range(len(chunks)))
+        errors: dict[int, Exception] = {}
+        for attempt in range(self.CHUNK_RETRIES + 1):
+            delay = self.CHUNK_RETRY_DELAY * attempt
+            calls = tuple(make_call(*chunks[i], delay) for i in pending)
+            responses = yield Batch(calls, concurrency=self.CHUNK_CONCURRENCY)
+
+            errors = {}
+            for i, response in zip(pending, responses, strict=True):
+                try:
+                    if isinstance(response, Exception):
+                        raise response
+                    frames[i] = parse(response)
+                except DataNotAvailableError:
+                    pass
+                except Exception as e:
+                    errors[i] = e
+            pending = list(errors)
+            if not pending:
+                break
+
+        if errors:
+            failed = ", ".join(
+                f"{chunks[i][0]:%Y-%m-%d}..{chunks[i][1]:%Y-%m-%d}" for i in sorted(errors)[:3]
+            ) + (", ..." if len(errors) > 3 else "")
+            first = errors[min(errors)]
+            raise APIError(
+                f"Failed to fetch {what} ({len(errors)} of {len(chunks)} chunks: {failed}): {first}"
+            ) from first
+
+        return [frames[i] for i in sorted(frames)]
+
+    def _history_chunk_steps(
         self,
         fund_code: str,
         start_dt: datetime,
         end_dt: datetime,
-    ) -> pd.DataFrame:
+    ) -> Steps[pd.DataFrame]:
         """Fetch a single chunk of history data (max ~90 days)."""
         try:
-            url = f"{self.BASE_URL}/BindHistoryInfo"
+            response = yield self._history_call(fund_code, start_dt, end_dt)
+        except Exception as e:
+            raise APIError(f"Failed to fetch history for {fund_code}: {e}") from e
+        return self._parse_history(fund_code, response)
 
-            data = {
-                "fontip": "YAT",
-                "sfontur": "",
-                "fonkod": fund_code,
-                "fongrup": "",
-                "bastarih": start_dt.strftime("%d.%m.%Y"),
-                "bittarih": end_dt.strftime("%d.%m.%Y"),
-                "fonturkod": "",
-                "fonunvantip": "",
-                "kurucukod": "",
-            }
+    def _history_call(
+        self,
+        fund_code: str,
+        start_dt: datetime,
+        end_dt: datetime,
+        delay: float = 0.0,
+        fund_type: str = "YAT",
+    ) -> Call:
+        """BindHistoryInfo request for one chunk (all funds of ``fund_type`` if no code)."""
+        data = {
+            "fontip": fund_type,
+            "sfontur": "",
+            "fonkod": fund_code,
+            "fongrup": "",
+            "bastarih": start_dt.strftime("%d.%m.%Y"),
+            "bittarih": end_dt.strftime("%d.%m.%Y"),
+            "fonturkod": "",
+            "fonunvantip": "",
+            "kurucukod": "",
+        }
 
-            headers = {
-                "Accept": "application/json, text/javascript, */*; q=0.01",
-                "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-                "Origin": "https://www.tefas.gov.tr",
-                "Referer": "https://www.tefas.gov.tr/TarihselVeriler.aspx",
-                "User-Agent": self.DEFAULT_HEADERS["User-Agent"],
-                "X-Requested-With": "XMLHttpRequest",
-            }
+        headers = {
+            "Accept": "application/json, text/javascript, */*; q=0.01",
+            "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+            "Origin": "https://www.tefas.gov.tr",
+            "Referer": "https://www.tefas.gov.tr/TarihselVeriler.aspx",
+            "User-Agent": self.DEFAULT_HEADERS["User-Agent"],
+            "X-Requested-With": "XMLHttpRequest",
+        }
+
+        return Call(
+            "POST",
+            f"{self.BASE_URL}/BindHistoryInfo",
+            data=data,
+            headers=headers,
+            delay=delay,
+            retry=True,
+        )
 
-            response = self._client.post(url, data=data, headers=headers)
+    def _parse_history(self, fund_code: str, response: httpx.Response) -> pd.DataFrame:
+        """Parse a BindHistoryInfo response into a Price/FundSize/Investors frame."""
+        try:
             response.raise_for_status()
 
             # Check if response is JSON (not HTML error page)
@@ -358,36 +507,212 @@ class TEFASProvider(BaseProvider):
             if "text/html" in content_type:
                 raise APIError("TEFAS WAF blocked the request")
 
-            result = response.json()
+            result = loads(response.content)
 
             if not result.get("data"):
                 raise DataNotAvailableError(f"No history for fund: {fund_code}")
 
-            records = []
-            for item in result["data"]:
-                timestamp = int(item.get("TARIH", 0))
-                if timestamp > 0:
-                    dt = datetime.fromtimestamp(timestamp / 1000)
-                    records.append(
-                        {
-                            "Date": dt,
-                            "Price": float(item.get("FIYAT", 0)),
-                            "FundSize": float(item.get("PORTFOYBUYUKLUK", 0)),
-                            "Investors": int(item.get("KISISAYISI", 0)),
-                        }
-                    )
+            return frame_from_records(
+                result["data"],
+                time_key="TARIH",
+                columns={"FIYAT": "Price", "PORTFOYBUYUKLUK": "FundSize", "KISISAYISI": "Investors"},
+                unit="ms",
+                int_columns=("Investors",),
+            )
 
-            df = pd.DataFrame(records)
-            if not df.empty:
-                df.set_index("Date", inplace=True)
-                df.sort_index(inplace=True)
+        except Exception as e:
+            if "WAF" in str(e) or isinstance(e, DataNotAvailableError):
+                raise
+            raise APIError(f"Failed to fetch history for {fund_code}: {e}") from e
 
-            return df
+    # Days per all-funds BindHistoryInfo request (one row per fund per day)
+    BULK_CHUNK_DAYS = 7
+    # BindHistoryInfo fields in the fund matrix, as named in results
+    MATRIX_FIELDS = {"FIYAT": "Price", "PORTFOYBUYUKLUK": "FundSize", "KISISAYISI": "Investors"}
+    # Fund types checked for a matrix before fetching one fund's history
+    MATRIX_TYPES = ("YAT", "EMK")
 
+    def get_history_matrix(
+        self,
+        fund_type: str = "YAT",
+        period: str = "1y",
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> pd.DataFrame:
+        """
+        Get daily history of every fund of a type as one dates x funds table.
+
+        The whole universe is fetched with date-range requests that cover all
+        funds at once (BULK_CHUNK_DAYS per request) instead of per fund. The
+        table is kept as a store that only grows: later calls fetch just the
+        missing days, so a daily update is a single request. With a disk
+        cache (configure_disk_cache) it persists across processes. While a
+        store covers a fund, get_history answers from it.
+
+        Args:
+            fund_type: "YAT" (investment funds) or "EMK" (pension funds).
+            period: Data period (1mo, 3mo, 6mo, 1y, 3y, 5y, max).
+            start: Start date (overrides period if provided).
+            end: End date (defaults to now).
+
+        Returns:
+            DataFrame indexed by Date with MultiIndex columns (field, fund_code),
+            field being Price, FundSize or Investors. Days a fund has no data
+            for (e.g. before its launch) are NaN.
+        """
+        start_dt, end_dt = self._date_range(period, start, end)
+        store_key = f"tefas:matrix:{fund_type}"
+        store = self._cache_get(store_key)
+        # Loop: a flight led by a caller with a later start may not cover ours
+        while not self._matrix_covers(store, start_dt, end_dt):
+            store = self._single_flight(
+                store_key,
+                lambda: self._run(
+                    self._update_matrix_steps(store_key, fund_type, start_dt, end_dt)
+                ),
+                check_cache=False,
+            )
+
+        return self._slice_matrix(store.data, start_dt, end_dt)
+
+    @staticmethod
+    def _slice_matrix(data: pd.DataFrame, start_dt: datetime, end_dt: datetime) -> pd.DataFrame:
+        """Return a copy of the matrix rows from start_dt's day through end_dt."""
+        day = start_dt.replace(hour=0, minute=0, second=0, microsecond=0)
+        return data[(data.index >= day) & (data.index <= end_dt)].copy()
+
+    @staticmethod
+    def _matrix_covers(store: "_FundMatrix | None", start_dt: datetime, end_dt: datetime) -> bool:
+        """Whether a matrix can answer [start_dt, end_dt] without a request."""
+        if store is None or store.start.date() > start_dt.date():
+            return False
+        if end_dt <= store.fetched_at:
+            return True
+        # Requests up to "now" accept a tail as old as the usual history TTL
+        return (datetime.now() - store.fetched_at).total_seconds() < TTL.OHLCV_HISTORY
+
+    def _update_matrix_steps(
+        self, store_key: str, fund_type: str, start_dt: datetime, end_dt: datetime
+    ) -> Steps["_FundMatrix"]:
+        """Extend the stored matrix to cover [start_dt, end_dt] and cache it."""
+        store = self._cache.get(store_key, track=False)
+        if self._matrix_covers(store, start_dt, end_dt):
+            # Another caller updated it while we waited
+            return store
+
+        now = datetime.now()
+        if store is None or store.data.empty:
+            data = yield from self._fetch_matrix_steps(fund_type, start_dt, now)
+            if data.empty:
+                raise DataNotAvailableError(f"No fund history for type: {fund_type}")
+            store = _FundMatrix(data=data, start=start_dt, fetched_at=now)
+        else:
+            data, store_start, fetched_at = store.data, store.start, store.fetched_at
+            if start_dt.date() < store_start.date():
+                # Older days requested: fetch only the missing head
+                head = yield from self._fetch_matrix_steps(
+                    fund_type, start_dt, store_start - timedelta(days=1)
+                )
+                data = data.combine_first(head)
+                store_start = start_dt
+            if not self._matrix_covers(
+                _FundMatrix(data=data, start=store_start, fetched_at=fetched_at), start_dt, end_dt
+            ):
+                # Refetch from the last stored day, which may have been partial
+                tail = yield from self._fetch_matrix_steps(fund_type, data.index[-1], now)
+                data = tail.combine_first(data)
+                fetched_at = now
+            store = _FundMatrix(data=data, start=store_start, fetched_at=fetched_at)
+
+        self._cache_set(store_key, store, TTL.HISTORY_STORE)
+        return store
+
+    def _fetch_matrix_steps(
+        self, fund_type: str, start_dt: datetime, end_dt: datetime
+    ) -> Steps[pd.DataFrame]:
+        """Fetch all funds of a type over [start_dt, end_dt] into a (field, code) matrix."""
+        frames = yield from self._fetch_chunks_steps(
+            f"{fund_type} fund history",
+            self._split_range(start_dt, end_dt, self.BULK_CHUNK_DAYS) or [(start_dt, end_dt)],
+            lambda chunk_start, chunk_end, delay: self._history_call(
+                "", chunk_start, chunk_end, delay=delay, fund_type=fund_type
+            ),
+            self._parse_matrix,
+        )
+        if not frames:
+            return pd.DataFrame()
+        data = pd.concat(frames)
+        data = data[~data.index.duplicated(keep="last")]
+        return data.sort_index().sort_index(axis=1)
+
+    def _parse_matrix(self, response: httpx.Response) -> pd.DataFrame:
+        """Parse an all-funds BindHistoryInfo response into a (field, code) matrix."""
+        try:
+            response.raise_for_status()
+            if "text/html" in response.headers.get("content-type", ""):
+                raise APIError("TEFAS WAF blocked the request")
+            result = loads(response.content)
         except Exception as e:
             if "WAF" in str(e):
                 raise
-            raise APIError(f"Failed to fetch history for {fund_code}: {e}") from e
+            raise APIError(f"Failed to fetch fund history: {e}") from e
+
+        records = result.get("data") if isinstance(result, dict) else None
+        if not records:
+            raise DataNotAvailableError("No fund history in range")
+
+        raw = pd.DataFrame.from_records(records, columns=["TARIH", "FONKODU", *self.MATRIX_FIELDS])
+        timestamps = pd.to_numeric(raw["TARIH"], errors="coerce")
+        raw = raw[timestamps > 0]
+        index = pd.MultiIndex.from_arrays(
+            [
+                epoch_to_index(timestamps[timestamps > 0].to_numpy(), unit="ms"),
+                raw["FONKODU"].fillna("").astype(str).str.upper().to_numpy(),
+            ],
+            names=["Date", "fund_code"],
+        )
+        long = pd.DataFrame(
+            {
+                name: pd.to_numeric(raw[field], errors="coerce").to_numpy()
+                for field, name in self.MATRIX_FIELDS.items()
+            },
+            index=index,
+        )
+        long = long[~long.index.duplicated(keep="last")]
+        return long.unstack("fund_code")
+
+    def _history_from_matrix(
+        self, fund_code: str, start_dt: datetime, end_dt: datetime, update: bool = True
+    ) -> pd.DataFrame | None:
+        """
+        One fund's history from a fund matrix that already includes it, or None.
+
+        With ``update``, a matrix that covers the start but not the latest days
+        is brought up to date first (one request for all funds).
+        """
+        for fund_type in self.MATRIX_TYPES:
+            store = self._cache.get(f"tefas:matrix:{fund_type}", track=False)
+            if (
+                store is None
+                or store.start.date() > start_dt.date()
+                or fund_code not in store.data.columns.get_level_values("fund_code")
+            ):
+                continue
+            if update:
+                matrix = self.get_history_matrix(fund_type, start=start_dt, end=end_dt)
+            elif self._matrix_covers(store, start_dt, end_dt):
+                matrix = self._slice_matrix(store.data, start_dt, end_dt)
+            else:
+                continue
+
+            df = matrix.xs(fund_code, axis=1, level="fund_code").dropna(subset=["Price"])
+            if df.empty:
+                return None
+            df = df[list(self.MATRIX_FIELDS.values())].fillna(0)
+            df["Investors"] = df["Investors"].astype("int64")
+            df.columns.name = None
+            return df
+        return None
 
     def get_allocation(
         self,
@@ -441,7 +766,7 @@ class TEFASProvider(BaseProvider):
                 "X-Requested-With": "XMLHttpRequest",
             }
 
-            response = self._client.post(url, data=data, headers=headers)
+            response = self._client.post(url, data=data, headers=headers, extensions=RETRY)
             response.raise_for_status()
             result = response.json()
 
@@ -479,6 +804,116 @@ class TEFASProvider(BaseProvider):
         except Exception as e:
             raise APIError(f"Failed to fetch allocation for {fund_code}: {e}") from e
 
+    # Period return columns of BindComparisonFundReturns, as named in results
+    UNIVERSE_RETURNS = {
+        "GETIRI1A": "return_1m",
+        "GETIRI3A": "return_3m",
+        "GETIRI6A": "return_6m",
+        "GETIRIYB": "return_ytd",
+        "GETIRI1Y": "return_1y",
+        "GETIRI3Y": "return_3y",
+        "GETIRI5Y": "return_5y",
+    }
+
+    def get_universe(self, fund_type: str = "YAT", founder: str | None = None) -> pd.DataFrame:
+        """
+        Get a snapshot of all active funds of a type with their period returns.
+
+        Fetched with one request and cached for TTL.FUND_DATA (then refreshed
+        in the background), so screening and searching don't hit TEFAS.
+
+        Args:
+            fund_type: "YAT" (investment funds) or "EMK" (pension funds).
+            founder: Only funds of this management company (server-side filter).
+
+        Returns:
+            DataFrame indexed by fund_code with columns name, fund_type,
+            founder, return_1m ... return_5y and name_norm (lowercase ASCII
+            name for matching). Missing returns are NaN.
+        """
+        key = f"tefas:universe:{fund_type}:{founder or ''}"
+
+        def fetch() -> pd.DataFrame:
+            return self._run(self._universe_steps(key, fund_type, founder))
+
+        cached = self._cache_get(key, refresh=fetch)
+        if cached is not None:
+            return cached
+
+        return self._single_flight(key, fetch)
+
+    def _universe_steps(self, key: str, fund_type: str, founder: str | None) -> Steps[pd.DataFrame]:
+        """Fetch the BindComparisonFundReturns table and cache it as a frame."""
+        # Use calismatipi=2 for period-based returns (1A, 3A, 6A, YB, 1Y, 3Y, 5Y)
+        data = {
+            "calismatipi": "2",  # Period-based returns
+            "fontip": fund_type,
+            "sfontur": "Tümü",
+            "kurucukod": founder or "",
+            "fongrup": "",
+            "bastarih": "Başlangıç",  # Start (placeholder for period-based)
+            "bittarih": "Bitiş",  # End (placeholder for period-based)
+            "fonturkod": "",
+            "fonunvantip": "",
+            "strperiod": "1,1,1,1,1,1,1",  # All periods: 1A, 3A, 6A, YB, 1Y, 3Y, 5Y
+            "islemdurum": "1",  # Active funds only
+        }
+
+        headers = {
+            "Accept": "application/json, text/javascript, */*; q=0.01",
+            "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+            "Origin": "https://www.tefas.gov.tr",
+            "Referer": "https://www.tefas.gov.tr/FonKarsilastirma.aspx",
+            "User-Agent": self.DEFAULT_HEADERS["User-Agent"],
+            "X-Requested-With": "XMLHttpRequest",
+        }
+
+        response = yield Call(
+            "POST",
+            f"{self.BASE_URL}/BindComparisonFundReturns",
+            data=data,
+            headers=headers,
+            retry=True,
+        )
+        response.raise_for_status()
+        result = loads(response.content)
+        records = result.get("data", []) if isinstance(result, dict) else result
+
+        df = self._universe_frame(records or [], founder)
+        self._cache_set(key, df, TTL.FUND_DATA, stale=StaleTTL.FUND_DATA)
+        return df
+
+    def _universe_frame(self, records: list[dict], founder: str | None) -> pd.DataFrame:
+        """Build the get_universe() frame from BindComparisonFundReturns records."""
+        raw = pd.DataFrame.from_records(records)
+        if raw.empty:
+            raw = pd.DataFrame(columns=["FONKODU", "FONUNVAN", "FONTURACIKLAMA"])
+
+        def text(column: str) -> pd.Series:
+            if column in raw:
+                return raw[column].fillna("").astype(str)
+            return pd.Series("", index=raw.index)
+
+        df = pd.DataFrame(
+            {
+                "fund_code": text("FONKODU").str.upper(),
+                "name": text("FONUNVAN"),
+                "fund_type": text("FONTURACIKLAMA"),
+            }
+        )
+        # The founder code isn't always in the payload; a founder query implies it
+        founders = text("KURUCUKODU")
+        df["founder"] = founders.where(founders != "", founder or "")
+        for source, column in self.UNIVERSE_RETURNS.items():
+            if source in raw:
+                df[column] = pd.to_numeric(raw[source], errors="coerce")
+            else:
+                df[column] = float("nan")
+        df["name_norm"] = _normalize_series(df["name"])
+
+        df = df[df["fund_code"] != ""].drop_duplicates("fund_code")
+        return df.set_index("fund_code")
+
     def screen_funds(
         self,
         fund_type: str = "YAT",
@@ -494,6 +929,8 @@ class TEFASProvider(BaseProvider):
         """
         Screen funds based on fund type and return criteria.
 
+        Filters the cached fund universe (see get_universe) locally.
+
         Args:
             fund_type: Fund type filter:
                 - "YAT": Investment Funds (Yatırım Fonları) - default
@@ -516,94 +953,44 @@ class TEFASProvider(BaseProvider):
             >>> provider.screen_funds(fund_type="EMK", min_return_ytd=20)
         """
         try:
-            url = f"{self.BASE_URL}/BindComparisonFundReturns"
-
-            # Use calismatipi=2 for period-based returns (1A, 3A, 6A, YB, 1Y, 3Y, 5Y)
-            data = {
-                "calismatipi": "2",  # Period-based returns
-                "fontip": fund_type,
-                "sfontur": "Tümü",
-                "kurucukod": founder or "",
-                "fongrup": "",
-                "bastarih": "Başlangıç",  # Start (placeholder for period-based)
-                "bittarih": "Bitiş",  # End (placeholder for period-based)
-                "fonturkod": "",
-                "fonunvantip": "",
-                "strperiod": "1,1,1,1,1,1,1",  # All periods: 1A, 3A, 6A, YB, 1Y, 3Y, 5Y
-                "islemdurum": "1",  # Active funds only
-            }
-
-            headers = {
-                "Accept": "application/json, text/javascript, */*; q=0.01",
-                "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-                "Origin": "https://www.tefas.gov.tr",
-                "Referer": "https://www.tefas.gov.tr/FonKarsilastirma.aspx",
-                "User-Agent": self.DEFAULT_HEADERS["User-Agent"],
-                "X-Requested-With": "XMLHttpRequest",
-            }
-
-            response = self._client.post(url, data=data, headers=headers)
-            response.raise_for_status()
-            result = response.json()
-
-            all_funds = result.get("data", []) if isinstance(result, dict) else result
-
-            # Apply return-based filters
-            filtered = []
-            for fund in all_funds:
-                # Extract return values
-                r1m = fund.get("GETIRI1A")
-                r3m = fund.get("GETIRI3A")
-                r6m = fund.get("GETIRI6A")
-                rytd = fund.get("GETIRIYB")
-                r1y = fund.get("GETIRI1Y")
-                r3y = fund.get("GETIRI3Y")
-                r5y = fund.get("GETIRI5Y")
-
-                # Apply filters
-                if min_return_1m is not None and (r1m is None or r1m < min_return_1m):
-                    continue
-                if min_return_3m is not None and (r3m is None or r3m < min_return_3m):
-                    continue
-                if min_return_6m is not None and (r6m is None or r6m < min_return_6m):
-                    continue
-                if min_return_ytd is not None and (rytd is None or rytd < min_return_ytd):
-                    continue
-                if min_return_1y is not None and (r1y is None or r1y < min_return_1y):
-                    continue
-                if min_return_3y is not None and (r3y is None or r3y < min_return_3y):
-                    continue
-
-                filtered.append({
-                    "fund_code": fund.get("FONKODU", ""),
-                    "name": fund.get("FONUNVAN", ""),
-                    "fund_type": fund.get("FONTURACIKLAMA", ""),
-                    "return_1m": r1m,
-                    "return_3m": r3m,
-                    "return_6m": r6m,
-                    "return_ytd": rytd,
-                    "return_1y": r1y,
-                    "return_3y": r3y,
-                    "return_5y": r5y,
-                })
-
-            # Sort by 1-year return (descending), then YTD if 1Y not available
-            def sort_key(x):
-                r1y = x.get("return_1y")
-                rytd = x.get("return_ytd")
-                if r1y is not None:
-                    return (1, r1y)
-                if rytd is not None:
-                    return (0, rytd)
-                return (-1, 0)
-
-            filtered.sort(key=sort_key, reverse=True)
-
-            return filtered[:limit]
-
+            universe = self.get_universe(fund_type)
+            if founder:
+                founder = founder.upper()
+                if (universe["founder"] != "").any():
+                    universe = universe[universe["founder"] == founder]
+                else:
+                    # Payload without founder codes: use TEFAS's own filter
+                    universe = self.get_universe(fund_type, founder)
         except Exception as e:
             raise APIError(f"Failed to screen funds: {e}") from e
 
+        # Apply return-based filters (NaN never passes a minimum)
+        mask = pd.Series(True, index=universe.index)
+        for column, minimum in (
+            ("return_1m", min_return_1m),
+            ("return_3m", min_return_3m),
+            ("return_6m", min_return_6m),
+            ("return_ytd", min_return_ytd),
+            ("return_1y", min_return_1y),
+            ("return_3y", min_return_3y),
+        ):
+            if minimum is not None:
+                mask &= universe[column] >= minimum
+        filtered = universe[mask]
+
+        # Sort by 1-year return (descending), then YTD if 1Y not available
+        r1y, rytd = filtered["return_1y"], filtered["return_ytd"]
+        order = pd.DataFrame(
+            {
+                "tier": np.where(r1y.notna(), 1, np.where(rytd.notna(), 0, -1)),
+                "value": r1y.fillna(rytd).fillna(0),
+            },
+            index=filtered.index,
+        ).sort_values(["tier", "value"], ascending=False, kind="stable")
+
+        top = filtered.loc[order.index[:limit]]
+        return _records(top, ["fund_code", "name", "fund_type", *self.UNIVERSE_RETURNS.values()])
+
     def compare_funds(self, fund_codes: list[str]) -> dict[str, Any]:
         """
         Compare multiple funds side by side.
@@ -624,14 +1011,25 @@ class TEFASProvider(BaseProvider):
             return {"funds": [], "rankings": {}, "summary": {}}
 
         # Limit to 10 funds
-        fund_codes = [code.upper() for code in fund_codes[:10]]
+        fund_codes = list(dict.fromkeys(code.upper() for code in fund_codes[:10]))
+
+        # Comparisons are cached per fund set; only the order of "funds" follows the call
+        compare_key = f"tefas:compare:{','.join(sorted(fund_codes))}"
+        cached = self._cache_get(compare_key)
+        if cached is not None:
+            by_code = {fund["fund_code"]: fund for fund in cached["funds"]}
+            return {**cached, "funds": [by_code[code] for code in fund_codes]}
+
+        details = self._run(self._compare_details_steps(fund_codes))
 
         funds_data = []
         errors = []
 
         for code in fund_codes:
-            try:
-                detail = self.get_fund_detail(code)
+            detail = details[code]
+            if isinstance(detail, Exception):
+                errors.append({"fund_code": code, "error": str(detail)})
+            else:
                 funds_data.append({
                     "fund_code": detail.get("fund_code"),
                     "name": detail.get("name"),
@@ -655,58 +1053,49 @@ class TEFASProvider(BaseProvider):
                     # Allocation summary
                     "allocation": detail.get("allocation"),
                 })
-            except Exception as e:
-                errors.append({"fund_code": code, "error": str(e)})
 
         if not funds_data:
             return {"funds": [], "rankings": {}, "summary": {}, "errors": errors}
 
-        # Calculate rankings
-        rankings = {}
-
-        # Rank by 1-year return
-        sorted_1y = sorted(
-            [f for f in funds_data if f.get("return_1y") is not None],
-            key=lambda x: x["return_1y"],
-            reverse=True,
-        )
-        rankings["by_return_1y"] = [f["fund_code"] for f in sorted_1y]
-
-        # Rank by YTD return
-        sorted_ytd = sorted(
-            [f for f in funds_data if f.get("return_ytd") is not None],
-            key=lambda x: x["return_ytd"],
-            reverse=True,
-        )
-        rankings["by_return_ytd"] = [f["fund_code"] for f in sorted_ytd]
-
-        # Rank by fund size
-        sorted_size = sorted(
-            [f for f in funds_data if f.get("fund_size") is not None],
-            key=lambda x: x["fund_size"],
-            reverse=True,
-        )
-        rankings["by_size"] = [f["fund_code"] for f in sorted_size]
-
-        # Rank by risk (ascending - lower is better)
-        sorted_risk = sorted(
-            [f for f in funds_data if f.get("risk_value") is not None],
-            key=lambda x: x["risk_value"],
-        )
-        rankings["by_risk_asc"] = [f["fund_code"] for f in sorted_risk]
+        # Period returns from the universe snapshot, so they match screen_funds()
+        try:
+            universe = self.get_universe("YAT")
+        except Exception:
+            universe = None
+        if universe is not None:
+            for fund in funds_data:
+                if fund["fund_code"] in universe.index:
+                    row = universe.loc[fund["fund_code"]]
+                    for column in self.UNIVERSE_RETURNS.values():
+                        if pd.notna(row[column]):
+                            fund[column] = float(row[column])
+
+        frame = pd.DataFrame(funds_data).set_index("fund_code")
+        for column in ("return_1y", "return_ytd", "fund_size", "risk_value"):
+            frame[column] = pd.to_numeric(frame[column], errors="coerce")
+
+        def ranked(column: str, ascending: bool = False) -> list[str]:
+            return frame[column].dropna().sort_values(ascending=ascending, kind="stable").index.tolist()
+
+        # Calculate rankings (risk ascending - lower is better)
+        rankings = {
+            "by_return_1y": ranked("return_1y"),
+            "by_return_ytd": ranked("return_ytd"),
+            "by_size": ranked("fund_size"),
+            "by_risk_asc": ranked("risk_value", ascending=True),
+        }
 
         # Summary statistics
-        returns_1y = [f["return_1y"] for f in funds_data if f.get("return_1y") is not None]
-        returns_ytd = [f["return_ytd"] for f in funds_data if f.get("return_ytd") is not None]
-        sizes = [f["fund_size"] for f in funds_data if f.get("fund_size") is not None]
+        returns_1y = frame["return_1y"].dropna()
+        returns_ytd = frame["return_ytd"].dropna()
 
         summary = {
             "fund_count": len(funds_data),
-            "total_size": sum(sizes) if sizes else 0,
-            "avg_return_1y": sum(returns_1y) / len(returns_1y) if returns_1y else None,
-            "avg_return_ytd": sum(returns_ytd) / len(returns_ytd) if returns_ytd else None,
-            "best_return_1y": max(returns_1y) if returns_1y else None,
-            "worst_return_1y": min(returns_1y) if returns_1y else None,
+            "total_size": float(frame["fund_size"].sum()),
+            "avg_return_1y": float(returns_1y.mean()) if len(returns_1y) else None,
+            "avg_return_ytd": float(returns_ytd.mean()) if len(returns_ytd) else None,
+            "best_return_1y": float(returns_1y.max()) if len(returns_1y) else None,
+            "worst_return_1y": float(returns_1y.min()) if len(returns_1y) else None,
         }
 
         result = {
@@ -717,13 +1106,56 @@ class TEFASProvider(BaseProvider):
 
         if errors:
             result["errors"] = errors
+        else:
+            self._cache_set(compare_key, result, TTL.FX_RATES)
 
         return result
 
+    def _compare_details_steps(
+        self, fund_codes: list[str]
+    ) -> Steps[dict[str, dict[str, Any] | Exception]]:
+        """
+        Fund details for compare_funds: cached ones, the rest fetched concurrently.
+
+        Fetched details are parsed in light mode and cached separately from
+        get_fund_detail's. Failures are returned as APIError values.
+        """
+        details: dict[str, dict[str, Any] | Exception] = {}
+        pending = []
+        for code in fund_codes:
+            cached = self._cache_get(f"tefas:detail:{code}")
+            if cached is None:
+                cached = self._cache_get(f"tefas:detail:{code}:light")
+            if cached is not None:
+                details[code] = cached
+            else:
+                pending.append(code)
+
+        if pending:
+            responses = yield Batch(
+                tuple(self._fund_detail_call(code) for code in pending),
+                concurrency=self.CHUNK_CONCURRENCY,
+            )
+            for code, response in zip(pending, responses, strict=True):
+                try:
+                    if isinstance(response, Exception):
+                        raise response
+                    detail = self._parse_fund_detail(code, response, light=True)
+                except Exception as e:
+                    details[code] = APIError(f"Failed to fetch fund detail for {code}: {e}")
+                    continue
+                self._cache_set(f"tefas:detail:{code}:light", detail, TTL.FX_RATES)
+                details[code] = detail
+
+        return details
+
     def search(self, query: str, limit: int = 20) -> list[dict[str, Any]]:
         """
         Search for funds by name or code.
 
+        Matches the cached fund universe (see get_universe); an exact fund
+        code comes first. Turkish characters and case are ignored.
+
         Args:
             query: Search query
             limit: Maximum results
@@ -732,62 +1164,41 @@ class TEFASProvider(BaseProvider):
             List of matching funds.
         """
         try:
-            url = f"{self.BASE_URL}/BindComparisonFundReturns"
+            universe = self.get_universe("YAT")
+        except Exception as e:
+            raise APIError(f"Failed to search funds: {e}") from e
 
-            data = {
-                "calismatipi": "2",
-                "fontip": "YAT",
-                "sfontur": "Tümü",
-                "kurucukod": "",
-                "fongrup": "",
-                "bastarih": "Başlangıç",
-                "bittarih": "Bitiş",
-                "fonturkod": "",
-                "fonunvantip": "",
-                "strperiod": "1,1,1,1,1,1,1",
-                "islemdurum": "1",
-            }
+        needle = _normalize_text(query)
+        codes = universe.index.str.lower()
+        matches = universe[
+            codes.str.contains(needle, regex=False)
+            | universe["name_norm"].str.contains(needle, regex=False)
+        ]
+        exact = query.strip().upper()
+        if exact in matches.index:
+            matches = pd.concat([matches.loc[[exact]], matches.drop(exact)])
 
-            headers = {
-                "Accept": "application/json, text/javascript, */*; q=0.01",
-                "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-                "Origin": "https://www.tefas.gov.tr",
-                "Referer": "https://www.tefas.gov.tr/FonKarsilastirma.aspx",
-                "User-Agent": self.DEFAULT_HEADERS["User-Agent"],
-                "X-Requested-With": "XMLHttpRequest",
-            }
+        return _records(matches.head(limit), ["fund_code", "name", "fund_type", "return_1y"])
 
-            response = self._client.post(url, data=data, headers=headers)
-            response.raise_for_status()
-            result = response.json()
 
-            all_funds = result.get("data", []) if isinstance(result, dict) else result
+# Turkish letters folded to ASCII for name matching
+_TR_ASCII = str.maketrans("İıÖöÜüŞşÇçĞğ", "iioouussccgg")
 
-            # Normalize query for matching
-            query_lower = query.lower()
 
-            matching = []
-            for fund in all_funds:
-                code = fund.get("FONKODU", "").lower()
-                name = fund.get("FONUNVAN", "").lower()
+def _normalize_text(text: str) -> str:
+    """Normalize Turkish text for comparison."""
+    return text.translate(_TR_ASCII).lower().strip()
 
-                if query_lower in code or query_lower in name:
-                    matching.append(
-                        {
-                            "fund_code": fund.get("FONKODU", ""),
-                            "name": fund.get("FONUNVAN", ""),
-                            "fund_type": fund.get("FONTURACIKLAMA", ""),
-                            "return_1y": fund.get("GETIRI1Y"),
-                        }
-                    )
 
-                if len(matching) >= limit:
-                    break
+def _normalize_series(texts: pd.Series) -> pd.Series:
+    """Vectorized _normalize_text."""
+    return texts.str.translate(_TR_ASCII).str.lower().str.strip()
 
-            return matching
 
-        except Exception as e:
-            raise APIError(f"Failed to search funds: {e}") from e
+def _records(df: pd.DataFrame, columns: list[str]) -> list[dict[str, Any]]:
+    """Rows of a universe slice as dicts, with NaN as None."""
+    out = df.reset_index()[columns].astype(object)
+    return out.where(out.notna(), None).to_dict("records")
 
 
 # Singleton
@@ -800,3 +1211,50 @@ def get_tefas_provider() -> TEFASProvider:
     if _provider is None:
         _provider = TEFASProvider()
     return _provider
+
+
+class AsyncTEFASProvider(AsyncBaseProvider, TEFASProvider):
+    """Asyncio version of TEFASProvider's get_fund_detail and get_history."""
+
+    async def get_fund_detail(self, fund_code: str) -> dict[str, Any]:
+        """Async version of TEFASProvider.get_fund_detail."""
+        fund_code = fund_code.upper()
+
+        cache_key = f"tefas:detail:{fund_code}"
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        return await self._single_flight(
+            cache_key, lambda: self._run(self._fund_detail_steps(fund_code))
+        )
+
+    async def get_history(
+        self,
+        fund_code: str,
+        period: str = "1mo",
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> pd.DataFrame:
+        """Async version of TEFASProvider.get_history."""
+        fund_code = fund_code.upper()
+        start_dt, end_dt = self._date_range(period, start, end)
+
+        from_matrix = self._history_from_matrix(fund_code, start_dt, end_dt, update=False)
+        if from_matrix is not None:
+            return from_matrix
+
+        cache_key = f"tefas:history:{fund_code}:{start_dt.date()}:{end_dt.date()}"
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        return await self._single_flight(
+            cache_key,
+            lambda: self._run(self._history_steps(cache_key, fund_code, start_dt, end_dt)),
+        )
+
+
+def get_async_tefas_provider() -> AsyncTEFASProvider:
+    """Get the TEFAS async provider for the running event loop."""
+    return async_provider(AsyncTEFASProvider)
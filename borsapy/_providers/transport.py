@@ -0,0 +1,565 @@
+"""httpx transports shared by all providers."""
+
+import asyncio
+import atexit
+import importlib.util
+import os
+import random
+import ssl
+import threading
+import time
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
+
+import httpx
+
+from borsapy.exceptions import CircuitOpenError
+from borsapy.metrics import get_metrics
+
+# httpx speaks HTTP/2 only with the optional h2 package
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Allows ``rate`` requests per second on average with bursts of up to
+    ``burst`` requests.
+    """
+
+    def __init__(self, rate: float, burst: int | None = None):
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """Take a token if one is available; otherwise return the seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        while wait := self.try_acquire():
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait (without blocking the event loop) for a token, then take it."""
+        while wait := self.try_acquire():
+            await asyncio.sleep(wait)
+
+
+# Per-host limits for requests made in the current context (see rate_limited())
+_host_limits: ContextVar[dict[str, TokenBucket] | None] = ContextVar(
+    "borsapy_host_limits", default=None
+)
+
+
+@contextmanager
+def rate_limited(limits: dict[str, TokenBucket]) -> Iterator[None]:
+    """
+    Apply per-host token buckets to provider requests made inside the block.
+
+    Only requests that reach the network are limited; cache hits are free.
+    Tasks created inside the block inherit the limits.
+
+    Args:
+        limits: Host name -> bucket, e.g. {"piyasa.paratic.com": TokenBucket(10)}.
+    """
+    token = _host_limits.set(limits)
+    try:
+        yield
+    finally:
+        _host_limits.reset(token)
+
+
+@dataclass(frozen=True)
+class HostPolicy:
+    """
+    Request policy for one upstream host, shared by every provider using it.
+
+    Attributes:
+        rate: Max requests per second to the host (None for no limit).
+        burst: Requests allowed back to back before ``rate`` applies.
+        max_retries: Retries for 429/5xx responses, timeouts and dropped connections.
+            Only idempotent methods (``retry_methods``) are retried, unless the
+            request opts in with ``extensions=RETRY``.
+        backoff: Base delay in seconds; attempt n waits up to ``backoff * 2**n``
+            (full jitter), or the server's Retry-After when it sends one.
+        max_backoff: Upper bound for a single retry delay.
+        retry_statuses: Response statuses that are retried.
+        retry_methods: HTTP methods that are safe to retry.
+        json_paths: URL path prefixes that only serve JSON. An HTML response on
+            these is a WAF/error page and is retried like a 503.
+        failure_threshold: Consecutive failed requests (counted once each,
+            after their retries) that open the circuit (0 disables the breaker).
+        reset_timeout: Seconds the circuit stays open before one trial request.
+        max_connections: Connections open to the host at once, shared by all providers.
+        max_keepalive: Idle connections kept open for reuse. Keep it at
+            max_connections for concurrent callers, or connections churn.
+        keepalive_expiry: Seconds an idle connection is kept.
+        http2: Offer HTTP/2 (needs the ``h2`` package; hosts without it answer
+            over HTTP/1.1).
+    """
+
+    rate: float | None = None
+    burst: int | None = None
+    max_retries: int = 2
+    backoff: float = 0.5
+    max_backoff: float = 10.0
+    retry_statuses: frozenset[int] = field(
+        default_factory=lambda: frozenset({429, 500, 502, 503, 504})
+    )
+    retry_methods: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    json_paths: tuple[str, ...] = ()
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    max_connections: int = 10
+    max_keepalive: int = 10
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+
+
+# BORSAPY_HTTP2=1 offers HTTP/2 to every host by default
+DEFAULT_HOST_POLICY = HostPolicy(http2=os.environ.get("BORSAPY_HTTP2", "") not in ("", "0"))
+
+# Per-host defaults. TEFAS's WAF blocks bursts with an HTML page, doviz.com
+# answers bursts with 429.
+HOST_POLICIES: dict[str, HostPolicy] = {
+    host: replace(DEFAULT_HOST_POLICY, **overrides)
+    for host, overrides in {
+        "www.tefas.gov.tr": {
+            "rate": 3, "burst": 3, "max_retries": 3, "backoff": 1.0, "json_paths": ("/api/",)
+        },
+        "api.doviz.com": {"rate": 5, "burst": 5, "max_retries": 3},
+        "www.doviz.com": {"rate": 5, "burst": 5},
+        "www.isyatirim.com.tr": {"rate": 5, "burst": 5},
+        "www.kap.org.tr": {"rate": 3, "burst": 3},
+        "kap.org.tr": {"rate": 3, "burst": 3},
+        "piyasa.paratic.com": {"rate": 20, "burst": 20, "max_connections": 20, "max_keepalive": 20},
+    }.items()
+}
+
+# Transport errors worth retrying (the server may be fine on the next attempt)
+_RETRY_ERRORS = (httpx.TimeoutException, httpx.RemoteProtocolError)
+
+# Request extensions marking a non-idempotent request (e.g. a POST query) as
+# safe to retry: client.post(..., extensions=RETRY)
+RETRY = {"borsapy_retry": True}
+
+
+class _HostState:
+    """Shared rate limiter and circuit breaker for one host."""
+
+    def __init__(self, host: str, policy: HostPolicy):
+        self.host = host
+        self.policy = policy
+        self.bucket = TokenBucket(policy.rate, policy.burst) if policy.rate else None
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._open_until = 0.0
+        self._probing = False
+
+    def check_circuit(self) -> bool:
+        """
+        Raise CircuitOpenError while the circuit is open; let one trial through after.
+
+        Returns:
+            True if this attempt is the half-open trial. Its caller must end
+            it with record(), or release_probe() if it never completes.
+        """
+        threshold = self.policy.failure_threshold
+        with self._lock:
+            if not threshold or self._failures < threshold:
+                return False
+            remaining = self._open_until - time.monotonic()
+            if remaining > 0:
+                raise CircuitOpenError(self.host, remaining)
+            if self._probing:
+                raise CircuitOpenError(self.host, self.policy.reset_timeout)
+            self._probing = True
+            return True
+
+    def release_probe(self) -> None:
+        """End a trial that was cancelled or interrupted, without recording an outcome."""
+        with self._lock:
+            self._probing = False
+
+    def record(self, ok: bool) -> None:
+        """Record the outcome of one request (after its retries)."""
+        with self._lock:
+            self._probing = False
+            if ok:
+                self._failures = 0
+                return
+            self._failures += 1
+            if self.policy.failure_threshold and self._failures >= self.policy.failure_threshold:
+                self._open_until = time.monotonic() + self.policy.reset_timeout
+
+    def can_retry(self, request: httpx.Request) -> bool:
+        """Whether the request may be sent again (idempotent, or opted in)."""
+        return request.method in self.policy.retry_methods or bool(
+            request.extensions.get("borsapy_retry")
+        )
+
+    def is_failure(self, request: httpx.Request, response: httpx.Response) -> bool:
+        """Whether a response should be retried (and counted by the breaker)."""
+        if response.status_code in self.policy.retry_statuses:
+            return True
+        if self.policy.json_paths and request.url.path.startswith(self.policy.json_paths):
+            return "text/html" in response.headers.get("content-type", "")
+        return False
+
+    def retry_delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """Seconds to wait before retry number ``attempt`` (0-based)."""
+        policy = self.policy
+        if response is not None:
+            retry_after = response.headers.get("retry-after", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), policy.max_backoff)
+        return random.uniform(0, min(policy.max_backoff, policy.backoff * 2**attempt))
+
+
+_host_states: dict[str, _HostState] = {}
+_host_states_lock = threading.Lock()
+
+
+def _host_state(host: str) -> _HostState:
+    state = _host_states.get(host)
+    if state is None:
+        with _host_states_lock:
+            state = _host_states.get(host)
+            if state is None:
+                policy = HOST_POLICIES.get(host, DEFAULT_HOST_POLICY)
+                state = _host_states[host] = _HostState(host, policy)
+    return state
+
+
+def get_host_policy(host: str) -> HostPolicy:
+    """Get the request policy in effect for ``host``."""
+    return _host_state(host).policy
+
+
+def configure_host(host: str, **overrides) -> HostPolicy:
+    """
+    Change the request policy for one host.
+
+    Resets the host's rate limiter and circuit breaker.
+
+    Args:
+        host: Host name, e.g. "www.tefas.gov.tr".
+        **overrides: HostPolicy fields to change.
+
+    Returns:
+        The new policy.
+
+    Examples:
+        >>> configure_host("www.tefas.gov.tr", rate=1, max_retries=5)
+        >>> configure_host("api.doviz.com", failure_threshold=0)  # No breaker
+    """
+    with _host_states_lock:
+        policy = replace(HOST_POLICIES.get(host, DEFAULT_HOST_POLICY), **overrides)
+        HOST_POLICIES[host] = policy
+        _host_states[host] = _HostState(host, policy)
+    with _pools_lock:
+        # New requests open a pool with the new limits
+        pool = _pools.pop(host, None)
+        async_pools = [
+            (loop, pools.pop(host)) for loop, pools in _async_pools.items() if host in pools
+        ]
+    if pool is not None:
+        pool.close()
+    for loop, async_pool in async_pools:
+        _close_async_pool(loop, async_pool)
+    return policy
+
+
+# Connection pools per host, shared by every provider's client so keep-alive
+# connections (and their TLS sessions) are reused across providers
+_pools: dict[str, httpx.HTTPTransport] = {}
+_async_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, httpx.AsyncHTTPTransport]]" = (
+    weakref.WeakKeyDictionary()
+)
+_pools_lock = threading.Lock()
+_ssl_context: ssl.SSLContext | None = None
+
+
+def _pool_options(host: str) -> dict:
+    """HTTPTransport arguments for ``host``, with one SSL context for all pools."""
+    global _ssl_context
+    if _ssl_context is None:
+        # Loading the CA bundle once saves ~20ms per pool
+        _ssl_context = httpx.create_ssl_context()
+    policy = get_host_policy(host)
+    return {
+        "verify": _ssl_context,
+        "http2": policy.http2 and HTTP2_AVAILABLE,
+        "limits": httpx.Limits(
+            max_connections=policy.max_connections,
+            max_keepalive_connections=policy.max_keepalive,
+            keepalive_expiry=policy.keepalive_expiry,
+        ),
+    }
+
+
+def get_pool(host: str) -> httpx.HTTPTransport:
+    """Get the shared connection pool for ``host``."""
+    pool = _pools.get(host)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(host)
+            if pool is None:
+                pool = _pools[host] = httpx.HTTPTransport(**_pool_options(host))
+    return pool
+
+
+def get_async_pool(host: str) -> httpx.AsyncHTTPTransport:
+    """Get the shared async connection pool for ``host`` on the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _pools_lock:
+        pools = _async_pools.setdefault(loop, {})
+        pool = pools.get(host)
+        if pool is None:
+            pool = pools[host] = httpx.AsyncHTTPTransport(**_pool_options(host))
+    return pool
+
+
+def close_pools() -> None:
+    """Close all shared sync connection pools (new requests open new ones)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+def _close_async_pool(loop: asyncio.AbstractEventLoop, pool: httpx.AsyncHTTPTransport) -> None:
+    """Close an async pool on the event loop that owns it."""
+    if loop.is_closed():
+        return
+    try:
+        loop.call_soon_threadsafe(lambda: loop.create_task(pool.aclose()))
+    except RuntimeError:
+        # The loop closed in the meantime; its connections went with it
+        pass
+
+
+atexit.register(close_pools)
+
+
+# Record/replay store consulted before the network (see replay.use_fixtures())
+_fixtures = None
+
+
+def set_fixture_store(store):
+    """Install a replay.FixtureStore (or None) for all providers; returns the previous one."""
+    global _fixtures
+    previous, _fixtures = _fixtures, store
+    return previous
+
+
+class PooledTransport(httpx.BaseTransport):
+    """Sends each request through the shared pool for its host (see get_pool())."""
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        pool = get_pool(request.url.host)
+        if _fixtures is not None:
+            return _fixtures.handle_request(request, pool)
+        return pool.handle_request(request)
+
+    def close(self) -> None:
+        # Pools are shared with other clients; see close_pools()
+        pass
+
+
+class AsyncPooledTransport(httpx.AsyncBaseTransport):
+    """Async version of PooledTransport."""
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        pool = get_async_pool(request.url.host)
+        if _fixtures is not None:
+            return await _fixtures.handle_async_request(request, pool)
+        return await pool.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class InstrumentedTransport(httpx.BaseTransport):
+    """
+    Transport wrapper that applies the host's policy (see HostPolicy) and
+    records request count, bytes and latency per provider.
+
+    Every attempt waits for the host's shared token bucket and any limits
+    set with rate_limited(). Retryable failures of idempotent (or opted-in)
+    requests are retried with backoff; the last failing response is returned
+    (or error raised) as-is so providers handle it as before. The circuit
+    breaker counts each request once, after its retries.
+
+    Providers mostly call ``self._client.get/post`` directly, so this is done
+    here rather than in BaseProvider._get/_post. The response body is read
+    inside the transport so latency covers the full download.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, provider: str):
+        self._transport = transport
+        self._provider = provider
+        self._metrics = get_metrics()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        state = _host_state(request.url.host)
+        retries = state.policy.max_retries if state.can_retry(request) else 0
+        probe = state.check_circuit()
+        recorded = False
+        attempt = 0
+        try:
+            while True:
+                self._acquire(state, request)
+                try:
+                    response = self._send(request)
+                except _RETRY_ERRORS:
+                    if attempt >= retries:
+                        recorded = True
+                        state.record(ok=False)
+                        raise
+                    time.sleep(state.retry_delay(attempt))
+                    attempt += 1
+                    continue
+                except Exception:
+                    recorded = True
+                    state.record(ok=False)
+                    raise
+
+                failed = state.is_failure(request, response)
+                if not failed or attempt >= retries:
+                    recorded = True
+                    state.record(ok=not failed)
+                    return response
+                response.close()
+                time.sleep(state.retry_delay(attempt, response))
+                attempt += 1
+        finally:
+            # Interrupted (e.g. KeyboardInterrupt): don't leave the circuit half-open
+            if probe and not recorded:
+                state.release_probe()
+
+    @staticmethod
+    def _acquire(state: _HostState, request: httpx.Request) -> None:
+        if state.bucket is not None:
+            state.bucket.acquire()
+        limits = _host_limits.get()
+        if limits:
+            bucket = limits.get(request.url.host)
+            if bucket is not None:
+                bucket.acquire()
+
+    def _send(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        try:
+            response = self._transport.handle_request(request)
+            content = response.read()
+        except Exception:
+            self._metrics.record_request(
+                self._provider, (time.perf_counter() - start) * 1000, error=True
+            )
+            raise
+
+        self._metrics.record_request(
+            self._provider,
+            (time.perf_counter() - start) * 1000,
+            nbytes=len(content),
+            status_code=response.status_code,
+        )
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncInstrumentedTransport(httpx.AsyncBaseTransport):
+    """Async version of InstrumentedTransport, used by AsyncBaseProvider."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, provider: str):
+        self._transport = transport
+        self._provider = provider
+        self._metrics = get_metrics()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        state = _host_state(request.url.host)
+        retries = state.policy.max_retries if state.can_retry(request) else 0
+        probe = state.check_circuit()
+        recorded = False
+        attempt = 0
+        try:
+            while True:
+                await self._acquire(state, request)
+                try:
+                    response = await self._send(request)
+                except _RETRY_ERRORS:
+                    if attempt >= retries:
+                        recorded = True
+                        state.record(ok=False)
+                        raise
+                    await asyncio.sleep(state.retry_delay(attempt))
+                    attempt += 1
+                    continue
+                except Exception:
+                    recorded = True
+                    state.record(ok=False)
+                    raise
+
+                failed = state.is_failure(request, response)
+                if not failed or attempt >= retries:
+                    recorded = True
+                    state.record(ok=not failed)
+                    return response
+                await response.aclose()
+                await asyncio.sleep(state.retry_delay(attempt, response))
+                attempt += 1
+        finally:
+            # Cancelled (asyncio.CancelledError): don't leave the circuit half-open
+            if probe and not recorded:
+                state.release_probe()
+
+    @staticmethod
+    async def _acquire(state: _HostState, request: httpx.Request) -> None:
+        if state.bucket is not None:
+            await state.bucket.acquire_async()
+        limits = _host_limits.get()
+        if limits:
+            bucket = limits.get(request.url.host)
+            if bucket is not None:
+                await bucket.acquire_async()
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        try:
+            response = await self._transport.handle_async_request(request)
+            content = await response.aread()
+        except Exception:
+            self._metrics.record_request(
+                self._provider, (time.perf_counter() - start) * 1000, error=True
+            )
+            raise
+
+        self._metrics.record_request(
+            self._provider,
+            (time.perf_counter() - start) * 1000,
+            nbytes=len(content),
+            status_code=response.status_code,
+        )
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
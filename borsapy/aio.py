@@ -0,0 +1,338 @@
+"""
+Asyncio counterparts of Ticker, Fund, FX and Crypto.
+
+The async classes share the cache with the sync API, so a value fetched by
+either is served to both. Inside your own event loop, await them directly:
+
+    >>> import asyncio
+    >>> from borsapy.aio import AsyncTicker
+    >>> async def main():
+    ...     quotes = await asyncio.gather(*(AsyncTicker(s).info() for s in ["THYAO", "GARAN"]))
+    >>> asyncio.run(main())
+
+From sync code, run() and gather() execute coroutines on one event loop per
+process (started in a daemon thread on first use), so fanning out hundreds of
+requests costs one thread instead of a thread pool:
+
+    >>> import borsapy as bp
+    >>> quotes = bp.aio.gather(*(bp.AsyncTicker(s).info() for s in symbols))
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Coroutine
+from datetime import datetime
+from typing import Any, TypeVar
+
+import pandas as pd
+
+from borsapy._providers.btcturk import get_async_btcturk_provider
+from borsapy._providers.dovizcom import get_async_dovizcom_provider
+from borsapy._providers.paratic import get_async_paratic_provider
+from borsapy._providers.tefas import get_async_tefas_provider
+
+T = TypeVar("T")
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the process-wide event loop used by run() and gather(), starting it if needed."""
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="borsapy-aio", daemon=True
+            ).start()
+            _loop = loop
+        return _loop
+
+
+def run(coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+    """
+    Run a coroutine on the shared event loop and wait for its result.
+
+    Args:
+        coro: Coroutine to run, e.g. ``AsyncFX("USD").current()``.
+        timeout: Seconds to wait before raising TimeoutError.
+
+    Raises:
+        RuntimeError: If called from a coroutine on the shared loop (await instead).
+    """
+    loop = get_event_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("run() cannot be called from the borsapy event loop; await instead")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
+
+
+def gather(*aws: Awaitable[Any], return_exceptions: bool = True) -> list[Any]:
+    """
+    Run awaitables concurrently on the shared event loop and return their results.
+
+    Args:
+        *aws: Coroutines, e.g. ``AsyncTicker(s).info() for s in symbols``.
+        return_exceptions: Return failures as exception objects in the result
+            list instead of raising the first one.
+
+    Returns:
+        Results in the order the awaitables were given.
+    """
+
+    async def _gather() -> list[Any]:
+        return list(await asyncio.gather(*aws, return_exceptions=return_exceptions))
+
+    return run(_gather())
+
+
+def _parse_date(date: str | datetime) -> datetime:
+    """Parse a date string to datetime."""
+    if isinstance(date, datetime):
+        return date
+    for fmt in ["%Y-%m-%d", "%Y/%m/%d", "%d-%m-%Y", "%d/%m/%Y"]:
+        try:
+            return datetime.strptime(date, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"Could not parse date: {date}")
+
+
+class AsyncTicker:
+    """
+    Async version of Ticker's price data (info and history).
+
+    Examples:
+        >>> stock = AsyncTicker("THYAO")
+        >>> await stock.info()
+        {'symbol': 'THYAO', 'last': 268.5, ...}
+        >>> await stock.history(period="1y")
+    """
+
+    def __init__(self, symbol: str):
+        """
+        Initialize an AsyncTicker object.
+
+        Args:
+            symbol: Stock symbol (e.g., "THYAO", "GARAN", "ASELS").
+                    The ".IS" or ".E" suffix is optional and will be removed.
+        """
+        self._symbol = symbol.upper().replace(".IS", "").replace(".E", "")
+
+    @property
+    def symbol(self) -> str:
+        """Return the ticker symbol."""
+        return self._symbol
+
+    async def info(self) -> dict[str, Any]:
+        """
+        Get the current quote.
+
+        Returns the price fields of Ticker.info (last, open, high, low, close,
+        volume, amount, change, change_percent, update_time). Use Ticker.info
+        for company details and valuation fields.
+        """
+        return await get_async_paratic_provider().get_quote(self._symbol)
+
+    async def history(
+        self,
+        period: str = "1mo",
+        interval: str = "1d",
+        start: datetime | str | None = None,
+        end: datetime | str | None = None,
+    ) -> pd.DataFrame:
+        """
+        Get historical OHLCV data.
+
+        Args:
+            period: 1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max.
+                    Ignored if start is provided.
+            interval: 1m, 5m, 15m, 30m, 1h, 1d, 1wk, 1mo.
+            start: Start date (string or datetime).
+            end: End date (string or datetime). Defaults to today.
+
+        Returns:
+            DataFrame with columns: Open, High, Low, Close, Volume.
+        """
+        return await get_async_paratic_provider().get_history(
+            symbol=self._symbol,
+            period=period,
+            interval=interval,
+            start=_parse_date(start) if start else None,
+            end=_parse_date(end) if end else None,
+        )
+
+    def __repr__(self) -> str:
+        return f"AsyncTicker('{self._symbol}')"
+
+
+class AsyncFund:
+    """
+    Async version of Fund's info and history.
+
+    Examples:
+        >>> fund = AsyncFund("AAK")
+        >>> await fund.info()
+        >>> await fund.history(period="1y")
+    """
+
+    def __init__(self, fund_code: str):
+        """
+        Initialize an AsyncFund object.
+
+        Args:
+            fund_code: TEFAS fund code (e.g., "AAK", "TTE", "YAF")
+        """
+        self._fund_code = fund_code.upper()
+
+    @property
+    def fund_code(self) -> str:
+        """Return the fund code."""
+        return self._fund_code
+
+    @property
+    def symbol(self) -> str:
+        """Return the fund code (alias)."""
+        return self._fund_code
+
+    async def info(self) -> dict[str, Any]:
+        """Get detailed fund information (same fields as Fund.info)."""
+        return await get_async_tefas_provider().get_fund_detail(self._fund_code)
+
+    async def history(
+        self,
+        period: str = "1mo",
+        start: datetime | str | None = None,
+        end: datetime | str | None = None,
+    ) -> pd.DataFrame:
+        """
+        Get historical price data.
+
+        Args:
+            period: 1d, 5d, 1mo, 3mo, 6mo, 1y, 3y, 5y, max.
+                    Ignored if start is provided.
+            start: Start date (string or datetime).
+            end: End date (string or datetime). Defaults to now.
+
+        Returns:
+            DataFrame with columns: Price, FundSize, Investors.
+        """
+        return await get_async_tefas_provider().get_history(
+            fund_code=self._fund_code,
+            period=period,
+            start=_parse_date(start) if start else None,
+            end=_parse_date(end) if end else None,
+        )
+
+    def __repr__(self) -> str:
+        return f"AsyncFund('{self._fund_code}')"
+
+
+class AsyncFX:
+    """
+    Async version of FX's current and history.
+
+    Examples:
+        >>> usd = AsyncFX("USD")
+        >>> await usd.current()
+        >>> await usd.history(period="1mo")
+    """
+
+    def __init__(self, asset: str):
+        """
+        Initialize an AsyncFX object.
+
+        Args:
+            asset: Asset code (USD, EUR, gram-altin, BRENT, etc.)
+        """
+        self._asset = asset
+
+    @property
+    def asset(self) -> str:
+        """Return the asset code."""
+        return self._asset
+
+    @property
+    def symbol(self) -> str:
+        """Return the asset code (alias for asset)."""
+        return self._asset
+
+    async def current(self) -> dict[str, Any]:
+        """Get current price information (same fields as FX.current)."""
+        return await get_async_dovizcom_provider().get_current(self._asset)
+
+    async def info(self) -> dict[str, Any]:
+        """Alias for current() (yfinance compatibility)."""
+        return await self.current()
+
+    async def history(
+        self,
+        period: str = "1mo",
+        start: datetime | str | None = None,
+        end: datetime | str | None = None,
+    ) -> pd.DataFrame:
+        """
+        Get historical OHLC data.
+
+        Args:
+            period: 1d, 5d, 1mo, 3mo, 6mo, 1y. Ignored if start is provided.
+            start: Start date (string or datetime).
+            end: End date (string or datetime). Defaults to today.
+
+        Returns:
+            DataFrame with columns: Open, High, Low, Close.
+        """
+        return await get_async_dovizcom_provider().get_history(
+            asset=self._asset,
+            period=period,
+            start=_parse_date(start) if start else None,
+            end=_parse_date(end) if end else None,
+        )
+
+    def __repr__(self) -> str:
+        return f"AsyncFX('{self._asset}')"
+
+
+class AsyncCrypto:
+    """
+    Async version of Crypto's current ticker.
+
+    Examples:
+        >>> btc = AsyncCrypto("BTCTRY")
+        >>> await btc.current()
+    """
+
+    def __init__(self, pair: str):
+        """
+        Initialize an AsyncCrypto object.
+
+        Args:
+            pair: Trading pair (e.g., "BTCTRY", "ETHTRY", "BTCUSDT").
+        """
+        self._pair = pair.upper()
+
+    @property
+    def pair(self) -> str:
+        """Return the trading pair."""
+        return self._pair
+
+    @property
+    def symbol(self) -> str:
+        """Return the trading pair (alias)."""
+        return self._pair
+
+    async def current(self) -> dict[str, Any]:
+        """Get current ticker information (same fields as Crypto.current)."""
+        return await get_async_btcturk_provider().get_ticker(self._pair)
+
+    async def info(self) -> dict[str, Any]:
+        """Alias for current() (yfinance compatibility)."""
+        return await self.current()
+
+    def __repr__(self) -> str:
+        return f"AsyncCrypto('{self._pair}')"
@@ -1,12 +1,79 @@
-"""TTL-based in-memory cache for borsapy."""
+"""TTL-based in-memory cache for borsapy, with an optional on-disk tier."""
 
+import io
+import os
+import pickle
+import sqlite3
+import sys
+import threading
 import time
+import weakref
+import zlib
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from threading import Lock
+from pathlib import Path
+from threading import Event, Lock, Thread
 from typing import Any, Generic, TypeVar
 
+from borsapy.metrics import get_metrics
+
 T = TypeVar("T")
 
+# Rough per-node cost of a parsed BeautifulSoup tree (tag object, attrs dict, strings)
+_SOUP_NODE_BYTES = 600
+
+# Containers larger than this are sized from a sample of their items
+_SIZE_SAMPLE = 100
+
+_metrics = get_metrics()
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """
+    Estimate the memory footprint of a cached value in bytes.
+
+    DataFrames and Series report their own deep memory usage. BeautifulSoup
+    trees are sized by node count. Containers are walked recursively (large
+    ones from a sample), everything else falls back to ``sys.getsizeof``.
+    """
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage):
+        try:
+            usage = memory_usage(deep=True)
+            return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+        except Exception:
+            pass
+
+    if hasattr(value, "descendants") and hasattr(value, "find_all"):
+        try:
+            return sum(1 for _ in value.descendants) * _SOUP_NODE_BYTES
+        except Exception:
+            return _SOUP_NODE_BYTES
+
+    size = sys.getsizeof(value)
+    if _depth >= 3:
+        return size
+
+    if isinstance(value, dict):
+        items = list(value.items())
+        sample = items[:_SIZE_SAMPLE]
+        if sample:
+            sampled = sum(
+                estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1) for k, v in sample
+            )
+            size += sampled * len(items) // len(sample)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        items = list(value)
+        sample = items[:_SIZE_SAMPLE]
+        if sample:
+            sampled = sum(estimate_size(v, _depth + 1) for v in sample)
+            size += sampled * len(items) // len(sample)
+    elif hasattr(value, "__dict__") and not isinstance(value, type):
+        # Plain objects/dataclasses wrapping DataFrames (e.g. history stores)
+        size += sum(estimate_size(v, _depth + 1) for v in vars(value).values())
+
+    return size
+
 
 @dataclass
 class CacheEntry(Generic[T]):
@@ -14,52 +81,496 @@ class CacheEntry(Generic[T]):
 
     value: T
     expires_at: float
+    size: int = 0
+    stale_until: float = 0.0  # May be served as stale until then (0 = no grace)
+
+    @property
+    def retain_until(self) -> float:
+        """Time after which the entry is useless and can be dropped."""
+        return max(self.expires_at, self.stale_until)
+
+
+class DiskCache:
+    """
+    SQLite-backed persistent cache tier.
+
+    DataFrames are stored as zstd-compressed Parquet when pyarrow is available
+    (zlib-compressed pickle otherwise); other values are stored as compressed
+    pickles. Expiry times are absolute wall-clock timestamps, so TTLs behave the
+    same across restarts. The database runs in WAL mode with a busy timeout,
+    which lets several processes share one cache directory.
+
+    Only point this at a directory you trust: values are unpickled on read.
+    """
+
+    FILENAME = "borsapy-cache.sqlite3"
+
+    def __init__(self, path: str | os.PathLike, min_ttl: int = 3600):
+        """
+        Open (or create) the on-disk cache.
+
+        Args:
+            path: Cache directory. Created if it doesn't exist.
+            min_ttl: Entries with a shorter TTL (e.g. real-time quotes) are
+                     kept in memory only.
+        """
+        self.path = Path(path).expanduser()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.path / self.FILENAME
+        self.min_ttl = min_ttl
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY,"
+                " expires_at REAL NOT NULL,"
+                " format TEXT NOT NULL,"
+                " payload BLOB NOT NULL,"
+                " stale_until REAL NOT NULL DEFAULT 0)"
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(entries)")}
+            if "stale_until" not in columns:
+                # Databases written before the grace window was persisted
+                conn.execute(
+                    "ALTER TABLE entries ADD COLUMN stale_until REAL NOT NULL DEFAULT 0"
+                )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_expires ON entries (expires_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection (sqlite3 connections aren't shareable)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str, stale: bool = False) -> tuple[Any, float, float] | None:
+        """
+        Return ``(value, expires_at, stale_until)`` for a live entry, or None.
+
+        With ``stale=True``, expired entries still inside their grace window
+        are returned too.
+        """
+        try:
+            row = self._connect().execute(
+                "SELECT expires_at, stale_until, format, payload FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+
+        expires_at, stale_until, fmt, payload = row
+        now = time.time()
+        if now > max(expires_at, stale_until):
+            self.delete(key)
+            return None
+        if now > expires_at and not stale:
+            return None
+        try:
+            return _deserialize(fmt, payload), expires_at, stale_until
+        except Exception:
+            # Written by an incompatible version or truncated; treat as a miss
+            self.delete(key)
+            return None
+
+    def set(self, key: str, value: Any, expires_at: float, stale_until: float = 0.0) -> bool:
+        """Store a value. Returns False if it couldn't be serialized."""
+        try:
+            fmt, payload = _serialize(value)
+        except Exception:
+            return False
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, expires_at, stale_until, format, payload)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (key, expires_at, stale_until, fmt, sqlite3.Binary(payload)),
+                )
+        except sqlite3.Error:
+            return False
+        return True
+
+    def delete(self, key: str) -> bool:
+        """Delete a key. Returns True if it existed."""
+        try:
+            with self._connect() as conn:
+                return conn.execute("DELETE FROM entries WHERE key = ?", (key,)).rowcount > 0
+        except sqlite3.Error:
+            return False
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM entries")
+        except sqlite3.Error:
+            pass
+
+    def cleanup(self) -> int:
+        """Delete expired entries. Returns number of entries removed."""
+        try:
+            with self._connect() as conn:
+                now = time.time()
+                return conn.execute(
+                    "DELETE FROM entries WHERE expires_at < ? AND stale_until < ?", (now, now)
+                ).rowcount
+        except sqlite3.Error:
+            return 0
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def _serialize(value: Any) -> tuple[str, bytes]:
+    """Encode a value for the disk tier as ``(format, payload)``."""
+    if hasattr(value, "to_parquet") and hasattr(value, "columns"):
+        try:
+            buffer = io.BytesIO()
+            value.to_parquet(buffer, compression="zstd")
+            return "parquet", buffer.getvalue()
+        except Exception:
+            # pyarrow missing, or object columns Parquet can't represent
+            pass
+    return "pickle", zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _deserialize(fmt: str, payload: bytes) -> Any:
+    """Decode a payload written by _serialize()."""
+    if fmt == "parquet":
+        import pandas as pd
+
+        return pd.read_parquet(io.BytesIO(payload))
+    return pickle.loads(zlib.decompress(payload))
 
 
 @dataclass
 class Cache:
-    """Thread-safe TTL-based in-memory cache."""
+    """
+    Thread-safe TTL-based in-memory cache.
 
-    _store: dict[str, CacheEntry] = field(default_factory=dict)
+    The cache is unbounded by default. Setting ``max_entries`` and/or
+    ``max_bytes`` enables bounded mode, in which least recently used entries
+    are evicted to stay within the limits. ``prefix_budgets`` caps the bytes
+    held by keys sharing a prefix (e.g. ``{"paratic:history": 64 * 1024**2}``),
+    and ``sweep_interval`` starts a daemon thread that drops expired entries.
+
+    When ``disk`` is set, entries with a long enough TTL are also written to
+    the on-disk tier, and memory misses are served from it.
+
+    Entries set with ``stale_seconds`` stay available through get_stale() for
+    that long after they expire (stale-while-revalidate); get() never returns
+    an expired value.
+
+    One lock guards the store, held only for dictionary operations: values
+    are sized, and disk I/O runs, outside it.
+    """
+
+    max_entries: int | None = None
+    max_bytes: int | None = None
+    prefix_budgets: dict[str, int] = field(default_factory=dict)
+    sweep_interval: float | None = None
+    disk: DiskCache | None = None
+    _store: OrderedDict[str, CacheEntry] = field(default_factory=OrderedDict)
     _lock: Lock = field(default_factory=Lock)
+    _total_bytes: int = 0
+    _prefix_bytes: dict[str, int] = field(default_factory=dict)
+    _sweeper: Thread | None = None
+    _sweeper_stop: Event | None = None
+
+    def __post_init__(self) -> None:
+        self._prefix_bytes = {prefix: 0 for prefix in self.prefix_budgets}
+        if self.sweep_interval:
+            self.start_sweeper(self.sweep_interval)
+
+    @property
+    def bounded(self) -> bool:
+        """Whether any size limit is configured."""
+        return bool(self.max_entries or self.max_bytes or self.prefix_budgets)
 
-    def get(self, key: str) -> Any | None:
-        """Get a value from cache if it exists and hasn't expired."""
+    @property
+    def total_bytes(self) -> int:
+        """Approximate bytes held by cached values (tracked in bounded mode only)."""
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def get(self, key: str, track: bool = True) -> Any | None:
+        """
+        Get a value from cache if it exists and hasn't expired.
+
+        Args:
+            key: Cache key.
+            track: Count the lookup in borsapy.stats(). Internal re-checks
+                pass False so one logical lookup isn't counted twice.
+        """
+        expired = False
         with self._lock:
             entry = self._store.get(key)
-            if entry is None:
-                return None
-            if time.time() > entry.expires_at:
-                del self._store[key]
-                return None
+            if entry is not None:
+                now = time.time()
+                if now <= entry.expires_at:
+                    self._store.move_to_end(key)
+                else:
+                    expired = True
+                    if now > entry.retain_until:
+                        self._remove(key)
+        if entry is not None and not expired:
+            if track:
+                _metrics.record_cache(key, "hits")
             return entry.value
+        hit = self._get_disk(key, track, expired=expired)
+        return hit[0] if hit is not None else None
+
+    def _get_disk(
+        self, key: str, track: bool = True, expired: bool = False, stale: bool = False
+    ) -> tuple[Any, bool] | None:
+        """
+        Memory miss: fall back to disk and promote a hit with its remaining TTL
+        and grace window.
+
+        Records the lookup's one outcome: a hit, or a miss ("expiries" when
+        memory held only an expired entry).
+
+        Returns:
+            ``(value, is_stale)``, or None. Stale entries are only returned
+            with ``stale=True``.
+        """
+        hit = self.disk.get(key, stale=stale) if self.disk is not None else None
+        if hit is None:
+            if track:
+                _metrics.record_cache(key, "expiries" if expired else "misses")
+            return None
+        if track:
+            _metrics.record_cache(key, "hits")
+        value, expires_at, stale_until = hit
+        self._set_memory(key, value, expires_at, stale_until)
+        return value, time.time() > expires_at
 
-    def set(self, key: str, value: Any, ttl_seconds: int) -> None:
-        """Set a value in cache with TTL in seconds."""
+    def get_stale(self, key: str) -> tuple[Any, bool] | None:
+        """
+        Get a value, allowing expired entries that are still in their grace window.
+
+        Returns:
+            ``(value, is_stale)``, or None if the key is missing or past its
+            grace window.
+        """
+        expired = False
         with self._lock:
-            self._store[key] = CacheEntry(value=value, expires_at=time.time() + ttl_seconds)
+            entry = self._store.get(key)
+            if entry is not None:
+                now = time.time()
+                if now <= entry.retain_until:
+                    self._store.move_to_end(key)
+                    stale = now > entry.expires_at
+                else:
+                    expired = True
+                    self._remove(key)
+        if entry is not None and not expired:
+            _metrics.record_cache(key, "hits")
+            return entry.value, stale
+
+        return self._get_disk(key, expired=expired, stale=True)
+
+    def set(self, key: str, value: Any, ttl_seconds: int, stale_seconds: int = 0) -> None:
+        """
+        Set a value in cache with TTL in seconds.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+            ttl_seconds: Seconds the value is fresh.
+            stale_seconds: Extra seconds after expiry during which get_stale()
+                still serves it (the maximum staleness a caller can see).
+        """
+        expires_at = time.time() + ttl_seconds
+        stale_until = expires_at + stale_seconds if stale_seconds else 0.0
+        self._set_memory(key, value, expires_at, stale_until)
+        if self.disk is not None and ttl_seconds >= self.disk.min_ttl:
+            self.disk.set(key, value, expires_at, stale_until)
+
+    def _set_memory(
+        self, key: str, value: Any, expires_at: float, stale_until: float = 0.0
+    ) -> None:
+        """Store a value in the in-memory tier only."""
+        # Sizing a large DataFrame is not free, so only do it when limits apply,
+        # and never while holding the lock
+        size = estimate_size(value) if self.bounded else 0
+        entry = CacheEntry(value=value, expires_at=expires_at, size=size, stale_until=stale_until)
+        with self._lock:
+            if key in self._store:
+                self._remove(key)
+            if self.max_bytes and size > self.max_bytes:
+                # Never let a single oversized value flush the whole cache
+                return
+            self._store[key] = entry
+            self._account(key, size)
+            evicted = self._evict(key)
+        for evicted_key in evicted:
+            _metrics.record_cache(evicted_key, "evictions")
 
     def delete(self, key: str) -> bool:
         """Delete a key from cache. Returns True if key existed."""
         with self._lock:
-            if key in self._store:
-                del self._store[key]
-                return True
-            return False
+            existed = key in self._store
+            if existed:
+                self._remove(key)
+        if self.disk is not None:
+            existed = self.disk.delete(key) or existed
+        return existed
 
     def clear(self) -> None:
-        """Clear all entries from cache."""
+        """Clear all entries from cache, including the on-disk tier."""
         with self._lock:
             self._store.clear()
+            self._total_bytes = 0
+            self._prefix_bytes = {prefix: 0 for prefix in self.prefix_budgets}
+        if self.disk is not None:
+            self.disk.clear()
 
     def cleanup(self) -> int:
         """Remove expired entries. Returns number of entries removed."""
         with self._lock:
             now = time.time()
-            expired_keys = [k for k, v in self._store.items() if now > v.expires_at]
+            expired_keys = [k for k, v in self._store.items() if now > v.retain_until]
             for key in expired_keys:
-                del self._store[key]
-            return len(expired_keys)
+                self._remove(key)
+        removed = len(expired_keys)
+        if self.disk is not None:
+            removed += self.disk.cleanup()
+        return removed
+
+    def configure(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        prefix_budgets: dict[str, int] | None = None,
+        sweep_interval: float | None = None,
+    ) -> None:
+        """
+        Change the cache limits in place and evict down to them.
+
+        Entries cached before bounded mode was enabled are re-sized here.
+
+        Args:
+            max_entries: Maximum number of entries (None for no limit).
+            max_bytes: Approximate byte budget for all values (None for no limit).
+            prefix_budgets: Byte budgets per key prefix.
+            sweep_interval: Seconds between background expiry sweeps (None stops it).
+        """
+        with self._lock:
+            was_bounded = self.bounded
+            self.max_entries = max_entries
+            self.max_bytes = max_bytes
+            self.prefix_budgets = dict(prefix_budgets or {})
+            if self.bounded and not was_bounded:
+                for entry in self._store.values():
+                    entry.size = estimate_size(entry.value)
+            self._total_bytes = 0
+            self._prefix_bytes = {prefix: 0 for prefix in self.prefix_budgets}
+            for key, entry in self._store.items():
+                self._account(key, entry.size)
+            evicted = self._evict(None)
+        for key in evicted:
+            _metrics.record_cache(key, "evictions")
+
+        self.stop_sweeper()
+        if sweep_interval:
+            self.start_sweeper(sweep_interval)
+
+    def start_sweeper(self, interval: float) -> None:
+        """Start a daemon thread that calls cleanup() every ``interval`` seconds."""
+        self.stop_sweeper()
+        self.sweep_interval = interval
+        self._sweeper_stop = Event()
+        self._sweeper = Thread(
+            target=_sweep_loop,
+            args=(weakref.ref(self), interval, self._sweeper_stop),
+            name="borsapy-cache-sweeper",
+            daemon=True,
+        )
+        self._sweeper.start()
+
+    def stop_sweeper(self) -> None:
+        """Stop the background sweeper thread if it is running."""
+        if self._sweeper_stop is not None:
+            self._sweeper_stop.set()
+        self._sweeper = None
+        self._sweeper_stop = None
+        self.sweep_interval = None
+
+    def _matching_prefixes(self, key: str) -> list[str]:
+        return [prefix for prefix in self.prefix_budgets if key.startswith(prefix)]
+
+    def _account(self, key: str, size: int) -> None:
+        """Add an entry's size to the totals. Caller must hold the lock."""
+        if not size:
+            return
+        self._total_bytes += size
+        for prefix in self._matching_prefixes(key):
+            self._prefix_bytes[prefix] += size
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry and release its size. Caller must hold the lock."""
+        entry = self._store.pop(key)
+        if not entry.size:
+            return
+        self._total_bytes -= entry.size
+        for prefix in self._matching_prefixes(key):
+            self._prefix_bytes[prefix] -= entry.size
+
+    def _evict(self, protected: str | None) -> list[str]:
+        """
+        Evict LRU entries until all limits hold. Caller must hold the lock.
+
+        Returns:
+            The evicted keys (counted in stats by the caller, after the lock).
+        """
+        if not self.bounded:
+            return []
+        evicted = []
+
+        # Per-prefix budgets first, so one noisy provider only evicts its own entries
+        for prefix, budget in self.prefix_budgets.items():
+            if self._prefix_bytes[prefix] <= budget:
+                continue
+            for key in [k for k in self._store if k.startswith(prefix) and k != protected]:
+                self._remove(key)
+                evicted.append(key)
+                if self._prefix_bytes[prefix] <= budget:
+                    break
+
+        while self._store and (
+            (self.max_entries and len(self._store) > self.max_entries)
+            or (self.max_bytes and self._total_bytes > self.max_bytes)
+        ):
+            oldest = next(iter(self._store))
+            if oldest == protected:
+                if len(self._store) == 1:
+                    break
+                self._store.move_to_end(oldest)
+                continue
+            self._remove(oldest)
+            evicted.append(oldest)
+        return evicted
+
+
+def _sweep_loop(cache_ref: "weakref.ref[Cache]", interval: float, stop: Event) -> None:
+    """Background expiry sweep; exits when stopped or the cache is collected."""
+    while not stop.wait(interval):
+        cache = cache_ref()
+        if cache is None:
+            return
+        cache.cleanup()
+        del cache
 
 
 # TTL values in seconds
@@ -68,6 +579,8 @@ class TTL:
 
     REALTIME_PRICE = 60  # 1 minute
     OHLCV_HISTORY = 3600  # 1 hour
+    HISTORY_STORE = 86400 * 30  # 30 days (append-only stores; the tail refreshes per OHLCV_HISTORY)
+    REVALIDATED = 86400 * 30  # 30 days (conditional GET bodies; revalidated per the caller's TTL)
     COMPANY_INFO = 3600  # 1 hour
     FINANCIAL_STATEMENTS = 86400  # 24 hours
     FX_RATES = 300  # 5 minutes
@@ -77,10 +590,140 @@ class TTL:
     VIOP = 300  # 5 minutes (delayed data)
 
 
+class StaleTTL:
+    """
+    Grace windows (seconds past TTL) during which an expired value may still be
+    served while a background refresh runs. This caps how old a value can get.
+    """
+
+    REALTIME_PRICE = 240  # Quotes at most 5 minutes old
+    FX_RATES = 600  # Rates at most 15 minutes old
+    FUND_DATA = 3600  # Fund universe snapshots at most 2 hours old
+
+
+# Recommended limits for bounded mode, applied by configure_cache(). The global
+# cache is unbounded, with no sweeper, unless configure_cache() is called or
+# BORSAPY_CACHE_MAX_ENTRIES / BORSAPY_CACHE_MAX_MB / BORSAPY_CACHE_SWEEP_INTERVAL
+# are set. Set BORSAPY_CACHE_DIR (or call configure_disk_cache()) to enable the
+# persistent tier.
+DEFAULT_MAX_ENTRIES = 5000
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512 MB
+DEFAULT_PREFIX_BUDGETS = {
+    "paratic:history": 128 * 1024 * 1024,
+    "tefas:history": 128 * 1024 * 1024,
+    "tefas:matrix": 256 * 1024 * 1024,
+}
+DEFAULT_SWEEP_INTERVAL = 60.0
+
+# Only entries living at least this long are persisted (skips real-time quotes)
+DEFAULT_DISK_MIN_TTL = TTL.OHLCV_HISTORY
+
+
+def _env_number(name: str, default: float | None) -> float | None:
+    """Read a numeric environment variable; 0 or empty disables the limit."""
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        return default
+    return value or None
+
+
+def _create_global_cache() -> Cache:
+    max_entries = _env_number("BORSAPY_CACHE_MAX_ENTRIES", None)
+    max_mb = _env_number("BORSAPY_CACHE_MAX_MB", None)
+    bounded = bool(max_entries or max_mb)
+    cache_dir = os.environ.get("BORSAPY_CACHE_DIR")
+    min_ttl = _env_number("BORSAPY_CACHE_DISK_MIN_TTL", DEFAULT_DISK_MIN_TTL)
+    disk = None
+    if cache_dir:
+        try:
+            disk = DiskCache(cache_dir, min_ttl=int(min_ttl or 0))
+        except (OSError, sqlite3.Error):
+            # An unusable cache directory must not break imports
+            disk = None
+    return Cache(
+        max_entries=int(max_entries) if max_entries else None,
+        max_bytes=int(max_mb * 1024 * 1024) if max_mb else None,
+        prefix_budgets=dict(DEFAULT_PREFIX_BUDGETS) if bounded else {},
+        sweep_interval=_env_number(
+            "BORSAPY_CACHE_SWEEP_INTERVAL", DEFAULT_SWEEP_INTERVAL if bounded else None
+        ),
+        disk=disk,
+    )
+
+
 # Global cache instance
-_cache = Cache()
+_cache = _create_global_cache()
 
 
 def get_cache() -> Cache:
     """Get the global cache instance."""
     return _cache
+
+
+def configure_cache(
+    max_entries: int | None = DEFAULT_MAX_ENTRIES,
+    max_bytes: int | None = DEFAULT_MAX_BYTES,
+    prefix_budgets: dict[str, int] | None = None,
+    sweep_interval: float | None = DEFAULT_SWEEP_INTERVAL,
+) -> Cache:
+    """
+    Reconfigure the global cache shared by all providers.
+
+    The global cache starts unbounded. Calling this with no arguments enables
+    bounded mode with the recommended limits (DEFAULT_MAX_ENTRIES,
+    DEFAULT_MAX_BYTES, DEFAULT_PREFIX_BUDGETS) and a background sweeper;
+    ``configure_cache(None, None, {}, None)`` makes it unbounded again.
+
+    Args:
+        max_entries: Maximum number of entries (None for no limit).
+        max_bytes: Approximate byte budget (None for no limit).
+        prefix_budgets: Byte budgets per key prefix. Defaults to
+            DEFAULT_PREFIX_BUDGETS; pass {} to disable.
+        sweep_interval: Seconds between background expiry sweeps (None disables).
+
+    Returns:
+        The global cache instance.
+
+    Examples:
+        >>> from borsapy.cache import configure_cache
+        >>> configure_cache(max_bytes=256 * 1024**2,
+        ...                 prefix_budgets={"paratic:history": 64 * 1024**2})
+    """
+    _cache.configure(
+        max_entries=max_entries,
+        max_bytes=max_bytes,
+        prefix_budgets=DEFAULT_PREFIX_BUDGETS if prefix_budgets is None else prefix_budgets,
+        sweep_interval=sweep_interval,
+    )
+    return _cache
+
+
+def configure_disk_cache(
+    path: str | os.PathLike | None,
+    min_ttl: int = DEFAULT_DISK_MIN_TTL,
+) -> Cache:
+    """
+    Enable, move or disable the on-disk tier of the global cache.
+
+    Several processes (e.g. Streamlit workers) can safely share one directory.
+
+    Args:
+        path: Cache directory, or None to disable the disk tier.
+        min_ttl: Entries with a shorter TTL are kept in memory only.
+
+    Returns:
+        The global cache instance.
+
+    Examples:
+        >>> from borsapy.cache import configure_disk_cache
+        >>> configure_disk_cache("~/.cache/borsapy")
+    """
+    old = _cache.disk
+    _cache.disk = DiskCache(path, min_ttl=min_ttl) if path is not None else None
+    if old is not None:
+        old.close()
+    return _cache
@@ -44,6 +44,15 @@ class RateLimitError(BorsapyError):
     pass
 
 
+class CircuitOpenError(APIError):
+    """Raised without sending a request while a host's circuit breaker is open."""
+
+    def __init__(self, host: str, retry_after: float):
+        self.host = host
+        self.retry_after = retry_after
+        super().__init__(f"{host} is unavailable (circuit open, retry in {retry_after:.1f}s)")
+
+
 class InvalidPeriodError(BorsapyError):
     """Raised when an invalid period is specified."""
 
@@ -1,5 +1,6 @@
 """Fund class for mutual fund data - yfinance-like API."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
@@ -8,6 +9,9 @@ import pandas as pd
 
 from borsapy._providers.tefas import get_tefas_provider
 
+# Fund count from which fund_risk_metrics reads the bulk matrix instead of per-fund histories
+MATRIX_MIN_FUNDS = 25
+
 
 class Fund:
     """
@@ -311,14 +315,7 @@ class Fund:
         annualized_volatility = daily_volatility * np.sqrt(annualization_factor) * 100
 
         # Get risk-free rate
-        if risk_free_rate is None:
-            try:
-                from borsapy.bond import risk_free_rate as get_rf_rate
-                rf = get_rf_rate() * 100  # Returns decimal like 0.28, convert to %
-            except Exception:
-                rf = 30.0  # Fallback: approximate Turkish 10Y yield
-        else:
-            rf = risk_free_rate * 100  # Convert decimal to percentage
+        rf = _risk_free_percent(risk_free_rate)
 
         # Sharpe Ratio
         if annualized_volatility > 0:
@@ -469,3 +466,212 @@ def compare_funds(fund_codes: list[str]) -> dict[str, Any]:
     """
     provider = get_tefas_provider()
     return provider.compare_funds(fund_codes)
+
+
+def fund_history_matrix(
+    fund_type: str = "YAT",
+    period: str = "1y",
+    start: datetime | str | None = None,
+    end: datetime | str | None = None,
+    field: str | None = "Price",
+) -> pd.DataFrame:
+    """
+    Get daily history of all funds of a type as one dates x funds table.
+
+    The whole universe is fetched in bulk (a few requests per month of
+    history, not one per fund) and kept up to date incrementally. Once it is
+    loaded, Fund.history and Fund.risk_metrics for funds in it need no
+    network requests. Enable the disk cache to keep it across sessions.
+
+    Args:
+        fund_type: "YAT" (investment funds) or "EMK" (pension funds).
+        period: 1mo, 3mo, 6mo, 1y, 3y, 5y, max. Ignored if start is provided.
+        start: Start date (string or datetime).
+        end: End date (string or datetime). Defaults to now.
+        field: "Price", "FundSize" or "Investors" for a Date x fund_code
+            table, or None for all three as MultiIndex (field, fund_code)
+            columns.
+
+    Returns:
+        DataFrame indexed by Date; NaN where a fund has no data that day.
+
+    Examples:
+        >>> import borsapy as bp
+        >>> prices = bp.fund_history_matrix(period="1y")
+        >>> prices[["AAK", "TTE"]].pct_change().corr()
+
+        >>> from borsapy.cache import configure_disk_cache
+        >>> configure_disk_cache("~/.cache/borsapy")  # Later runs fetch only new days
+    """
+    start_dt = _parse_date(start) if start else None
+    end_dt = _parse_date(end) if end else None
+
+    matrix = get_tefas_provider().get_history_matrix(
+        fund_type=fund_type, period=period, start=start_dt, end=end_dt
+    )
+    if field is None:
+        return matrix
+    return matrix[field]
+
+
+def fund_risk_metrics(
+    codes: list[str] | None = None,
+    period: str = "1y",
+    risk_free_rate: float | None = None,
+    fund_type: str = "YAT",
+) -> pd.DataFrame:
+    """
+    Calculate risk metrics for many funds at once.
+
+    Same metrics as Fund.risk_metrics, computed column-wise over one aligned
+    price table instead of fund by fund, with the risk-free rate fetched
+    once. Prices come from the fund history matrix (fund_history_matrix)
+    when ranking the whole universe or many funds, otherwise from each
+    fund's history fetched concurrently.
+
+    Args:
+        codes: TEFAS fund codes, or None for every fund of ``fund_type``.
+        period: Period for calculation ("1y", "3y", "5y"). Default is "1y".
+        risk_free_rate: Annual risk-free rate as decimal (e.g., 0.28 for 28%).
+                       If None, uses current 10Y bond yield.
+        fund_type: Fund type for codes=None and the bulk matrix ("YAT" or "EMK").
+
+    Returns:
+        DataFrame indexed by fund_code with columns annualized_return,
+        annualized_volatility, sharpe_ratio, sortino_ratio, max_drawdown,
+        risk_free_rate and trading_days (see Fund.risk_metrics). Funds whose
+        history could not be fetched are listed in ``df.attrs["errors"]``.
+
+    Examples:
+        >>> import borsapy as bp
+        >>> metrics = bp.fund_risk_metrics(period="1y")  # All investment funds
+        >>> metrics.sort_values("sharpe_ratio", ascending=False).head(10)
+
+        >>> bp.fund_risk_metrics(["AAK", "TTE", "YAF"], period="3y")
+    """
+    prices, errors = _fund_prices(codes, period, fund_type)
+    metrics = _risk_metrics_frame(prices, _risk_free_percent(risk_free_rate))
+    metrics.attrs["errors"] = errors
+    return metrics
+
+
+def _fund_prices(
+    codes: list[str] | None, period: str, fund_type: str
+) -> tuple[pd.DataFrame, dict[str, str]]:
+    """Date x fund_code Price table for fund_risk_metrics, plus per-fund errors."""
+    provider = get_tefas_provider()
+    errors: dict[str, str] = {}
+
+    if codes is None or len(codes) >= MATRIX_MIN_FUNDS:
+        matrix = provider.get_history_matrix(fund_type=fund_type, period=period)["Price"]
+        if codes is None:
+            return matrix, errors
+        codes = list(dict.fromkeys(code.upper() for code in codes))
+        columns = {code: matrix[code] for code in codes if code in matrix.columns}
+        missing = [code for code in codes if code not in columns]
+    else:
+        codes = list(dict.fromkeys(code.upper() for code in codes))
+        columns, missing = {}, codes
+
+    # Funds not in the matrix (or all of a short list): fetch histories concurrently
+    def fetch(code: str) -> pd.Series | Exception:
+        try:
+            return provider.get_history(code, period=period)["Price"]
+        except Exception as e:
+            return e
+
+    if missing:
+        workers = max(1, min(8, len(missing)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="borsapy-funds") as pool:
+            for code, result in zip(missing, pool.map(fetch, missing), strict=True):
+                if isinstance(result, Exception):
+                    errors[code] = str(result)
+                else:
+                    columns[code] = result
+
+    prices = pd.DataFrame({code: columns[code] for code in codes if code in columns})
+    return prices.sort_index(), errors
+
+
+def _risk_free_percent(risk_free_rate: float | None) -> float:
+    """Annual risk-free rate in percent (current 10Y yield if None)."""
+    if risk_free_rate is not None:
+        return risk_free_rate * 100  # Convert decimal to percentage
+    try:
+        from borsapy.bond import risk_free_rate as get_rf_rate
+        return get_rf_rate() * 100  # Returns decimal like 0.28, convert to %
+    except Exception:
+        return 30.0  # Fallback: approximate Turkish 10Y yield
+
+
+def _risk_metrics_frame(prices: pd.DataFrame, rf: float) -> pd.DataFrame:
+    """
+    Fund.risk_metrics for every column of a Date x fund Price table.
+
+    Each column gives the same result as its own NaN-free series would: a
+    daily return is measured from the fund's previous price, so days a fund
+    has no price for (before launch, gaps) are skipped, not counted as flat.
+    """
+    annualization_factor = 252
+    prices = prices.astype("float64")
+
+    # Daily returns against the previous available price
+    daily_returns = prices / prices.ffill().shift(1) - 1
+    trading_days = daily_returns.count()
+
+    # Annualized return
+    first = prices.bfill().iloc[0] if len(prices) else pd.Series(np.nan, index=prices.columns)
+    last = prices.ffill().iloc[-1] if len(prices) else pd.Series(np.nan, index=prices.columns)
+    total_return = last / first - 1
+    years = trading_days / annualization_factor
+    with np.errstate(divide="ignore", invalid="ignore"):
+        annualized_return = ((1 + total_return) ** (1 / years) - 1) * 100
+
+    # Annualized volatility
+    annualized_volatility = daily_returns.std() * np.sqrt(annualization_factor) * 100
+
+    # Sharpe Ratio
+    sharpe = ((annualized_return - rf) / annualized_volatility).where(annualized_volatility > 0)
+
+    # Sortino Ratio (uses downside deviation); no negative returns gives inf
+    negative_returns = daily_returns.where(daily_returns < 0)
+    downside_deviation = negative_returns.std() * np.sqrt(annualization_factor) * 100
+    sortino = ((annualized_return - rf) / downside_deviation).where(downside_deviation > 0)
+    sortino = sortino.mask(negative_returns.count() == 0, np.inf)
+
+    # Maximum Drawdown
+    cumulative = (1 + daily_returns).cumprod()
+    running_max = cumulative.cummax()
+    max_drawdown = ((cumulative - running_max) / running_max).min() * 100
+
+    metrics = pd.DataFrame(
+        {
+            "annualized_return": annualized_return.round(2),
+            "annualized_volatility": annualized_volatility.round(2),
+            "sharpe_ratio": sharpe.round(2),
+            "sortino_ratio": sortino.round(2),
+            "max_drawdown": max_drawdown.round(2),
+            "risk_free_rate": round(rf, 2),
+            "trading_days": trading_days.astype("int64"),
+        },
+        index=prices.columns,
+    )
+    metrics.index.name = "fund_code"
+
+    # Too little history (same cut-off as Fund.risk_metrics)
+    short = prices.count() < 20
+    metrics.loc[short, metrics.columns.drop("trading_days")] = np.nan
+    metrics.loc[short, "trading_days"] = 0
+    return metrics
+
+
+def _parse_date(date: str | datetime) -> datetime:
+    """Parse a date string to datetime."""
+    if isinstance(date, datetime):
+        return date
+    for fmt in ["%Y-%m-%d", "%Y/%m/%d", "%d-%m-%Y", "%d/%m/%Y"]:
+        try:
+            return datetime.strptime(date, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"Could not parse date: {date}")
@@ -0,0 +1,325 @@
+"""BIST-wide fundamentals panel: statements, TTM figures and valuation ratios."""
+
+import logging
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from borsapy._providers.isyatirim import get_isyatirim_provider
+from borsapy._providers.isyatirim_screener import get_screener_provider
+from borsapy._providers.kap import get_kap_provider
+from borsapy.cache import TTL
+
+logger = logging.getLogger(__name__)
+
+# Panel items behind the ratios: İş Yatırım item codes (XI_29 layout) or,
+# when a response carries no codes, their Turkish labels. "sum" adds all
+# matching lines (e.g. short and long term financial debt), "first" keeps the
+# first one (the balance sheet line rather than a cash flow line).
+ITEMS = {
+    "revenue": (("3C",), ("Satış Gelirleri",), "first"),
+    "gross_profit": (("3D",), ("BRÜT KAR (ZARAR)", "Brüt Kar (Zarar)"), "first"),
+    "net_income": (("3Z",), ("Ana Ortaklık Payları",), "first"),
+    "total_assets": (("1BL",), ("TOPLAM VARLIKLAR",), "first"),
+    "equity": (("2O",), ("Ana Ortaklığa Ait Özkaynaklar",), "first"),
+    "cash": (("1AA",), ("Nakit ve Nakit Benzerleri",), "first"),
+    "financial_debt": (("2AA", "2BA"), ("Finansal Borçlar",), "sum"),
+}
+
+# Flow items (summed over the last four quarters); the rest are point-in-time
+FLOW_ITEMS = ("revenue", "gross_profit", "net_income")
+
+# KAP expected-disclosure terms -> fiscal quarter of the financial report
+REPORT_TERMS = {"3 Aylık": 1, "6 Aylık": 2, "9 Aylık": 3, "Yıllık": 4}
+
+# How far back to look for reporting windows that opened
+CALENDAR_LOOKBACK_DAYS = 120
+
+# Without the KAP calendar, companies older than this are fetched again
+FALLBACK_MAX_AGE = 86400 * 7
+
+
+class Fundamentals:
+    """
+    Statements of all BIST companies in one columnar panel, with TTM figures
+    and valuation ratios computed for the whole universe at once.
+
+    The panel is persistent (it is kept in the cache, and on disk when the
+    disk cache is enabled). refresh() fetches only companies that are new to
+    the panel or whose next financial report is due according to the KAP
+    expected-disclosure calendar (one request for all companies), so after
+    the first load a refresh costs a handful of requests during reporting
+    season and one otherwise.
+
+    Args:
+        symbols: Stock symbols, or None for every company on KAP.
+        recheck: Seconds between re-fetches of a company whose report window
+            is open but whose new period hasn't appeared yet.
+
+    Examples:
+        >>> import borsapy as bp
+        >>> f = bp.Fundamentals()
+        >>> f.refresh()  # First run loads every company; later runs are incremental
+        >>> f.ratios().sort_values("pe").head(10)
+        >>> f.ttm()  # Revenue, gross profit and net income over the last 4 quarters
+        >>> f.panel  # symbol x item x period long table
+    """
+
+    def __init__(self, symbols: list[str] | None = None, recheck: float = TTL.FINANCIAL_STATEMENTS):
+        self._symbols = (
+            [s.upper().replace(".IS", "").replace(".E", "") for s in symbols]
+            if symbols is not None
+            else None
+        )
+        self.recheck = recheck
+        self._panel: pd.DataFrame | None = None
+
+    @property
+    def symbols(self) -> list[str]:
+        """Symbols in the universe (the KAP company list if none were given)."""
+        if self._symbols is not None:
+            return list(self._symbols)
+        return get_kap_provider().get_companies()["ticker"].astype(str).tolist()
+
+    @property
+    def panel(self) -> pd.DataFrame:
+        """
+        Statements of every company as one long table.
+
+        Returns:
+            DataFrame with columns symbol, frequency, line, code, item, period
+            and value (see bp.download_financials). Loads the panel on first
+            access; call refresh() to pick up newly published periods.
+        """
+        if self._panel is None:
+            self._panel = get_isyatirim_provider().get_financials_panel(self.symbols)
+        return self._panel
+
+    def refresh(self, force: bool = False) -> list[str]:
+        """
+        Bring the panel up to date.
+
+        Args:
+            force: Fetch every company again.
+
+        Returns:
+            Symbols that were fetched. Companies that could not be fetched
+            are listed in ``panel.attrs["errors"]``.
+        """
+        provider = get_isyatirim_provider()
+        symbols = self.symbols
+        started = time.time()
+        # Loads the panel, fetching only companies it doesn't have yet
+        current = provider.get_financials_panel(symbols)
+        due = symbols if force else self._due(symbols, current)
+        self._panel = provider.get_financials_panel(symbols, refresh=due) if due else current
+        fetched_at = self._panel.attrs["fetched_at"]
+        return [s for s in symbols if fetched_at.get(s, 0.0) >= started]
+
+    def _due(self, symbols: list[str], panel: pd.DataFrame) -> list[str]:
+        """Companies with a newer period due than the one in the panel."""
+        fetched_at = pd.Series(panel.attrs["fetched_at"], dtype="float64")
+        now = datetime.now()
+        try:
+            calendar = get_kap_provider().get_expected_disclosures(
+                self._symbols, now - timedelta(days=CALENDAR_LOOKBACK_DAYS), now
+            )
+        except Exception as e:
+            logger.warning("KAP calendar unavailable, refreshing by age: %s", e)
+            return fetched_at.index[fetched_at < time.time() - FALLBACK_MAX_AGE].tolist()
+
+        reports = calendar[calendar["Subject"].astype(str).str.contains("Finansal Rapor")]
+        quarter = reports["Period"].map(REPORT_TERMS)
+        opened = pd.to_datetime(reports["StartDate"], dayfirst=True, errors="coerce")
+        year = pd.to_numeric(reports["Year"], errors="coerce")
+        reports = pd.DataFrame(
+            {
+                "symbol": reports["Symbol"].astype(str),
+                "key": year * 4 + quarter - 1,
+                "opened": (opened - pd.Timestamp(0)).dt.total_seconds(),
+            }
+        ).dropna()
+        reports = reports[reports["opened"] <= time.time()]
+
+        # Latest quarter held per company, as year * 4 + quarter - 1
+        latest = _quarter_keys(panel).groupby(level="symbol").max()
+        reports["held"] = reports["symbol"].map(latest).fillna(-1)
+        reports["fetched_at"] = reports["symbol"].map(fetched_at).fillna(0.0)
+
+        # A report is due if it is newer than what we hold and we haven't
+        # looked since its window opened (or within ``recheck`` while it's open)
+        due = reports[
+            (reports["key"] > reports["held"])
+            & (
+                (reports["fetched_at"] < reports["opened"])
+                | (reports["fetched_at"] < time.time() - self.recheck)
+            )
+        ]
+        wanted = set(due["symbol"])
+        return [s for s in symbols if s in wanted]
+
+    def items(self, frequency: str = "quarterly") -> pd.DataFrame:
+        """
+        The ratio inputs (see ITEMS) for every company and period.
+
+        Args:
+            frequency: "quarterly" or "annual".
+
+        Returns:
+            Long DataFrame with columns symbol, period, key (year * 4 +
+            quarter - 1), metric and value.
+        """
+        panel = self.panel
+        panel = panel[panel["frequency"] == frequency]
+        codes = panel["code"].astype(str)
+        labels = panel["item"].astype(str).str.strip().str.casefold()
+
+        parts = []
+        for metric, (item_codes, item_labels, how) in ITEMS.items():
+            mask = codes.isin(item_codes) | labels.isin([label.casefold() for label in item_labels])
+            rows = panel.loc[mask, ["symbol", "period", "line", "value"]]
+            if how == "first":
+                rows = rows[rows["line"] == rows.groupby("symbol", observed=True)["line"].transform("min")]
+            rows = rows.groupby(["symbol", "period"], observed=True, as_index=False)["value"].sum()
+            parts.append(rows.assign(metric=metric))
+
+        columns = ["symbol", "period", "key", "metric", "value"]
+        if not parts:
+            return pd.DataFrame(columns=columns)
+        result = pd.concat(parts, ignore_index=True)
+        result["symbol"] = result["symbol"].astype(str)
+        result["period"] = result["period"].astype(str)
+        result["key"] = _period_keys(result["period"])
+        return result[columns]
+
+    def ttm(self) -> pd.DataFrame:
+        """
+        Trailing twelve months of the flow items for every company.
+
+        Sums each company's last four quarters (like Ticker.ttm_income_stmt),
+        as one grouped sum over the panel. Companies missing one of those
+        quarters get NaN for that item.
+
+        Returns:
+            DataFrame indexed by symbol with columns period (latest quarter),
+            revenue, gross_profit and net_income.
+        """
+        items = self.items("quarterly")
+        latest = items.groupby("symbol")["key"].transform("max")
+        window = items[(items["key"] > latest - 4) & items["metric"].isin(FLOW_ITEMS)]
+        grouped = window.groupby(["symbol", "metric"])["value"]
+        ttm = grouped.sum().where(grouped.count() == 4).unstack("metric")
+        ttm = ttm.reindex(columns=list(FLOW_ITEMS))
+        period = items.loc[items["key"] == latest].groupby("symbol")["period"].first()
+        ttm.insert(0, "period", period.reindex(ttm.index))
+        ttm.columns.name = None
+        return ttm
+
+    def latest(self) -> pd.DataFrame:
+        """
+        Point-in-time items (balance sheet) from each company's latest quarter.
+
+        Returns:
+            DataFrame indexed by symbol with columns total_assets, equity,
+            cash and financial_debt.
+        """
+        items = self.items("quarterly")
+        items = items[~items["metric"].isin(FLOW_ITEMS)]
+        items = items[items["key"] == items.groupby("symbol")["key"].transform("max")]
+        stock_items = [m for m in ITEMS if m not in FLOW_ITEMS]
+        result = items.pivot_table(index="symbol", columns="metric", values="value", aggfunc="sum")
+        result = result.reindex(columns=stock_items)
+        result.columns.name = None
+        return result
+
+    def ratios(self) -> pd.DataFrame:
+        """
+        Valuation and profitability ratios for every company.
+
+        Market values come from one İş Yatırım screener request for all
+        stocks. Ratios with a non-positive denominator (e.g. P/E of a
+        loss-making company) are NaN.
+
+        Returns:
+            DataFrame indexed by symbol with columns period, price,
+            market_cap, revenue_ttm, net_income_ttm, equity, net_debt,
+            enterprise_value, pe, pb, ps, ev_sales, roe and net_margin.
+        """
+        ttm = self.ttm()
+        latest = self.latest()
+        df = ttm.join(latest, how="outer")
+        market = _market_values().reindex(df.index)
+
+        def ratio(numerator: pd.Series, denominator: pd.Series) -> pd.Series:
+            return numerator / denominator.where(denominator > 0)
+
+        net_debt = df["financial_debt"].fillna(0) - df["cash"].fillna(0)
+        net_debt = net_debt.where(df["financial_debt"].notna() | df["cash"].notna())
+        enterprise_value = market["market_cap"] + net_debt
+        result = pd.DataFrame(
+            {
+                "period": df["period"],
+                "price": market["price"],
+                "market_cap": market["market_cap"],
+                "revenue_ttm": df["revenue"],
+                "net_income_ttm": df["net_income"],
+                "equity": df["equity"],
+                "net_debt": net_debt,
+                "enterprise_value": enterprise_value,
+                "pe": ratio(market["market_cap"], df["net_income"]),
+                "pb": ratio(market["market_cap"], df["equity"]),
+                "ps": ratio(market["market_cap"], df["revenue"]),
+                "ev_sales": ratio(enterprise_value, df["revenue"]),
+                "roe": ratio(df["net_income"], df["equity"]),
+                "net_margin": ratio(df["net_income"], df["revenue"]),
+            },
+            index=df.index,
+        )
+        result.index.name = "symbol"
+        return result
+
+    def __repr__(self) -> str:
+        scope = f"{len(self._symbols)} symbols" if self._symbols is not None else "all BIST"
+        return f"Fundamentals({scope})"
+
+
+def _period_keys(periods: pd.Series) -> pd.Series:
+    """'2024Q3' -> 2024 * 4 + 2 (annual '2024' counts as Q4)."""
+    parts = periods.str.extract(r"^(\d{4})(?:Q(\d))?$")
+    year = pd.to_numeric(parts[0], errors="coerce")
+    quarter = pd.to_numeric(parts[1], errors="coerce").fillna(4)
+    return (year * 4 + quarter - 1).astype("float64")
+
+
+def _quarter_keys(panel: pd.DataFrame) -> pd.Series:
+    """Quarter key of each quarterly panel row, indexed by symbol."""
+    quarterly = panel[panel["frequency"] == "quarterly"]
+    symbols = pd.Index(quarterly["symbol"].astype(str), name="symbol")
+    return _period_keys(pd.Series(quarterly["period"].astype(str).to_numpy(), index=symbols))
+
+
+def _market_values() -> pd.DataFrame:
+    """Price (TL) and market cap (TL) of every stock from one screener request."""
+    columns = ["price", "market_cap"]
+    try:
+        stocks = get_screener_provider().screen(
+            criterias=[("7", "0", "1000000", "False"), ("8", "0", "100000000", "False")]
+        )
+    except Exception as e:
+        logger.warning("Market values unavailable: %s", e)
+        return pd.DataFrame(columns=columns, dtype="float64")
+
+    df = pd.DataFrame(stocks)
+    if df.empty:
+        return pd.DataFrame(columns=columns, dtype="float64")
+    result = pd.DataFrame(
+        {
+            "price": pd.to_numeric(df.get("criteria_7"), errors="coerce"),
+            # Screener reports market cap in million TL
+            "market_cap": pd.to_numeric(df.get("criteria_8"), errors="coerce") * 1_000_000,
+        }
+    )
+    result.index = pd.Index(df["symbol"].astype(str), name="symbol")
+    return result[~result.index.duplicated()].astype(np.float64)
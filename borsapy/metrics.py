@@ -0,0 +1,302 @@
+"""Runtime statistics for the borsapy cache and upstream HTTP requests."""
+
+import bisect
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger("borsapy.metrics")
+
+# Upper bounds (ms) of the request latency histogram buckets; the last is open-ended
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+CACHE_EVENTS = ("hits", "misses", "expiries", "evictions")
+_EVENT_INDEX = {event: i for i, event in enumerate(CACHE_EVENTS)}
+
+# Distinct keys a thread counts before folding them into per-prefix totals
+_SHARD_FOLD_KEYS = 4096
+
+
+def key_prefix(key: str) -> str:
+    """
+    Group a cache key by its first two segments.
+
+    Examples:
+        >>> key_prefix("paratic:history:THYAO:1mo:1d")
+        'paratic:history'
+    """
+    return ":".join(key.split(":", 2)[:2])
+
+
+class _Histogram:
+    """Fixed-bucket latency histogram."""
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms: float) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def snapshot(self) -> dict[str, Any]:
+        count = sum(self.counts)
+        labels = [f"<={b}" for b in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}"]
+        return {
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+            "mean_ms": round(self.total_ms / count, 1) if count else None,
+            "p50_ms": self._percentile(0.50),
+            "p95_ms": self._percentile(0.95),
+            "max_ms": round(self.max_ms, 1),
+        }
+
+    def _percentile(self, q: float) -> float | None:
+        """Upper bucket bound containing the q-th quantile (max for the last bucket)."""
+        count = sum(self.counts)
+        if not count:
+            return None
+        running = 0
+        for i, n in enumerate(self.counts):
+            running += n
+            if running >= q * count:
+                bound = LATENCY_BUCKETS_MS[i] if i < len(LATENCY_BUCKETS_MS) else self.max_ms
+                return round(min(bound, self.max_ms), 1)
+        return round(self.max_ms, 1)
+
+
+class _ProviderStats:
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.bytes = 0
+        self.status: dict[int, int] = {}
+        self.latency = _Histogram()
+
+
+class _CacheShard:
+    """
+    One thread's cache counters.
+
+    Counted per full key, so the read path neither takes a lock nor splits
+    the key; keys are grouped by prefix only when a snapshot is taken (or
+    when the shard holds too many distinct keys).
+    """
+
+    def __init__(self):
+        self.thread = threading.current_thread()
+        self.keys: dict[str, list[int]] = {}
+        self.prefixes: dict[str, list[int]] = {}
+
+    def fold(self) -> None:
+        """Move the per-key counters into the per-prefix totals (owner thread only)."""
+        _merge(self.prefixes, self.keys)
+        self.keys.clear()
+
+
+def _merge(totals: dict[str, list[int]], counts: dict[str, list[int]]) -> None:
+    """Add per-key (or per-prefix) counters into per-prefix ``totals``."""
+    for key, values in list(counts.items()):
+        prefix = key_prefix(key)
+        current = totals.get(prefix)
+        if current is None:
+            current = totals[prefix] = [0] * len(CACHE_EVENTS)
+        for i, n in enumerate(values):
+            current[i] += n
+
+
+class Metrics:
+    """
+    Collector for cache and HTTP statistics.
+
+    Cache events are counted in per-thread shards without a lock and summed
+    when a snapshot is taken; HTTP requests are recorded under a short lock.
+    Use the module-level ``stats()`` to read them.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._shards: list[_CacheShard] = []
+        self._retired: dict[str, list[int]] = {}  # Counters of finished threads
+        self._providers: dict[str, _ProviderStats] = {}
+
+    def record_cache(self, key: str, event: str, count: int = 1) -> None:
+        """Count a cache event (one of CACHE_EVENTS) for the key's prefix."""
+        try:
+            keys = self._local.keys
+        except AttributeError:
+            keys = self._new_shard().keys
+        counters = keys.get(key)
+        if counters is None:
+            if len(keys) >= _SHARD_FOLD_KEYS:
+                self._local.shard.fold()
+            counters = keys[key] = [0] * len(CACHE_EVENTS)
+        counters[_EVENT_INDEX[event]] += count
+
+    def _new_shard(self) -> _CacheShard:
+        shard = self._local.shard = _CacheShard()
+        self._local.keys = shard.keys
+        with self._lock:
+            self._shards.append(shard)
+        return shard
+
+    def _cache_totals(self) -> dict[str, list[int]]:
+        """Sum every shard per prefix. Caller must hold _lock."""
+        totals = {prefix: list(values) for prefix, values in self._retired.items()}
+        alive = []
+        for shard in self._shards:
+            if shard.thread.is_alive():
+                alive.append(shard)
+                _merge(totals, shard.prefixes)
+                _merge(totals, shard.keys)
+            else:
+                # The thread is gone, so nothing writes to its shard any more
+                shard.fold()
+                _merge(self._retired, shard.prefixes)
+                _merge(totals, shard.prefixes)
+        self._shards = alive
+        return totals
+
+    def record_request(
+        self,
+        provider: str,
+        latency_ms: float,
+        nbytes: int = 0,
+        status_code: int | None = None,
+        error: bool = False,
+    ) -> None:
+        """Record one upstream HTTP request made by ``provider``."""
+        with self._lock:
+            stats = self._providers.get(provider)
+            if stats is None:
+                stats = self._providers[provider] = _ProviderStats()
+            stats.requests += 1
+            stats.bytes += nbytes
+            stats.latency.add(latency_ms)
+            if error or (status_code is not None and status_code >= 400):
+                stats.errors += 1
+            if status_code is not None:
+                stats.status[status_code] = stats.status.get(status_code, 0) + 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a point-in-time copy of all statistics."""
+        from borsapy.cache import get_cache
+
+        with self._lock:
+            cache = {}
+            for prefix, values in sorted(self._cache_totals().items()):
+                counters = dict(zip(CACHE_EVENTS, values, strict=True))
+                lookups = counters["hits"] + counters["misses"] + counters["expiries"]
+                cache[prefix] = {
+                    **counters,
+                    "hit_ratio": round(counters["hits"] / lookups, 3) if lookups else None,
+                }
+            http = {
+                name: {
+                    "requests": s.requests,
+                    "errors": s.errors,
+                    "bytes": s.bytes,
+                    "status": dict(s.status),
+                    "latency": s.latency.snapshot(),
+                }
+                for name, s in sorted(self._providers.items())
+            }
+
+        global_cache = get_cache()
+        return {
+            "cache": cache,
+            "http": http,
+            "cache_size": {"entries": len(global_cache), "bytes": global_cache.total_bytes},
+        }
+
+    def reset(self) -> None:
+        """Zero all counters."""
+        with self._lock:
+            for shard in self._shards:
+                shard.keys.clear()
+                shard.prefixes.clear()
+            self._retired.clear()
+            self._providers.clear()
+
+
+_metrics = Metrics()
+_reporter_stop: threading.Event | None = None
+
+
+def get_metrics() -> Metrics:
+    """Get the global metrics collector."""
+    return _metrics
+
+
+def stats() -> dict[str, Any]:
+    """
+    Snapshot of cache and upstream request statistics.
+
+    Returns:
+        Dictionary with:
+        - cache: hits/misses/expiries/evictions and hit_ratio per key prefix
+          (e.g. "paratic:quote", "tefas:history"). Each lookup counts once:
+          as a hit, a miss, or an expiry (only an expired entry was found)
+        - http: requests, errors, bytes, status codes and a latency histogram
+          per provider class
+        - cache_size: entries and approximate bytes in the global cache
+
+    Examples:
+        >>> import borsapy as bp
+        >>> bp.Ticker("THYAO").history(period="1mo")
+        >>> bp.stats()["http"]["ParaticProvider"]["latency"]["p95_ms"]
+    """
+    return _metrics.snapshot()
+
+
+def reset_stats() -> None:
+    """Zero all statistics."""
+    _metrics.reset()
+
+
+def start_stats_reporter(
+    interval: float = 60.0,
+    callback: Callable[[dict[str, Any]], None] | None = None,
+    reset: bool = False,
+) -> None:
+    """
+    Periodically export stats() from a daemon thread.
+
+    Args:
+        interval: Seconds between reports.
+        callback: Receives each snapshot (e.g. to push to a metrics backend).
+            Defaults to logging it on the "borsapy.metrics" logger at INFO.
+        reset: Zero the counters after each report, so every snapshot covers
+            one interval.
+
+    Examples:
+        >>> import logging
+        >>> logging.basicConfig(level=logging.INFO)
+        >>> bp.start_stats_reporter(300)
+    """
+    global _reporter_stop
+    stop_stats_reporter()
+    _reporter_stop = stop = threading.Event()
+    report = callback or (lambda snapshot: logger.info("borsapy stats: %s", snapshot))
+
+    def run() -> None:
+        while not stop.wait(interval):
+            try:
+                report(stats())
+            except Exception:
+                logger.exception("borsapy stats reporter failed")
+            if reset:
+                reset_stats()
+
+    threading.Thread(target=run, name="borsapy-stats-reporter", daemon=True).start()
+
+
+def stop_stats_reporter() -> None:
+    """Stop the periodic reporter if it is running."""
+    global _reporter_stop
+    if _reporter_stop is not None:
+        _reporter_stop.set()
+        _reporter_stop = None
@@ -0,0 +1,268 @@
+"""KAP disclosure feed: incremental, locally indexed news for BIST stocks."""
+
+import bisect
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+
+import pandas as pd
+
+from borsapy._providers.kap import get_kap_provider
+
+logger = logging.getLogger(__name__)
+
+NEWS_COLUMNS = ["Date", "Title", "URL"]
+
+
+class KAPFeed:
+    """
+    Incremental feed of KAP disclosures, stored in a local indexed table.
+
+    Each poll fetches the latest disclosures across all of BIST in a single
+    request and keeps only those newer than the cursor (the highest
+    disclosure id seen), so following a whole portfolio costs one request per
+    refresh instead of one per stock. Disclosures are deduplicated by id and
+    indexed by stock code, so news() is a dictionary lookup.
+
+    A stock's history before the feed started is seeded once, with a
+    per-stock query, the first time its news is read. If a poll finds the
+    whole page newer than the cursor (more disclosures arrived than one page
+    holds), seeded stocks are re-seeded on their next read.
+
+    Args:
+        symbols: Stock codes to keep, or None for all of BIST.
+        max_age: Seconds after which news() polls before answering. Use 0 to
+            read only what poll() or the background poller stored.
+        max_items: Disclosures kept; the oldest are dropped beyond this.
+
+    Examples:
+        >>> feed = bp.KAPFeed(["THYAO", "GARAN", "ASELS"])
+        >>> feed.poll()  # New disclosures since the last poll
+        >>> feed.news("THYAO")  # Read locally
+        >>> feed.start(60, callback=print)  # Poll every minute in the background
+    """
+
+    def __init__(
+        self,
+        symbols: Iterable[str] | None = None,
+        max_age: float = 60.0,
+        max_items: int = 10000,
+    ):
+        self._symbols = {_clean(s) for s in symbols} if symbols is not None else None
+        self.max_age = max_age
+        self.max_items = max_items
+        self._items: dict[int, dict] = {}
+        self._by_symbol: dict[str, list[int]] = {}  # ascending ids
+        self._seeded: dict[str, int] = {}  # symbol -> depth of its seed query
+        self._cursor: int | None = None
+        self._polled_at = 0.0
+        self._lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+        self._stop: threading.Event | None = None
+
+    @property
+    def symbols(self) -> list[str] | None:
+        """Stock codes followed, or None for all of BIST."""
+        return sorted(self._symbols) if self._symbols is not None else None
+
+    @property
+    def cursor(self) -> int | None:
+        """Highest disclosure id seen by poll(), or None before the first poll."""
+        return self._cursor
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def poll(self) -> pd.DataFrame:
+        """
+        Fetch disclosures published since the last poll.
+
+        Returns:
+            DataFrame of the new disclosures (newest first) with columns:
+            Date, Symbols, Title, URL, indexed by disclosure id.
+
+        Raises:
+            APIError: If the KAP disclosure page can't be fetched or parsed.
+        """
+        with self._poll_lock:
+            items = get_kap_provider().get_latest_disclosures()
+            with self._lock:
+                cursor = self._cursor
+                new = [i for i in items if cursor is None or i["id"] > cursor]
+                if cursor is not None and new and len(new) == len(items):
+                    # The whole page is new, so disclosures between it and the
+                    # cursor may be missing: re-seed stocks on their next read
+                    logger.info("KAP feed fell behind (cursor %s); re-seeding", cursor)
+                    self._seeded.clear()
+                added = [
+                    item for item in new if self._wanted(item) and self._add(item, item["symbols"])
+                ]
+                top = max(item["id"] for item in items)
+                self._cursor = top if cursor is None else max(cursor, top)
+                self._polled_at = time.time()
+                self._trim()
+        return _frame(sorted(added, key=lambda item: item["id"], reverse=True), symbols=True)
+
+    def news(self, symbol: str, limit: int = 20) -> pd.DataFrame:
+        """
+        Get the latest disclosures for a stock from the local table.
+
+        Polls first when the last poll is older than max_age, and seeds the
+        stock's earlier disclosures on first use. If the feed can't be polled,
+        falls back to the per-stock query. Stocks the feed doesn't follow are
+        answered with the per-stock query alone, without storing the result or
+        changing what the feed follows.
+
+        Args:
+            symbol: Stock symbol (e.g., "THYAO").
+            limit: Maximum number of disclosures to return (default: 20).
+
+        Returns:
+            DataFrame with columns: Date, Title, URL (newest first).
+        """
+        symbol = _clean(symbol)
+        if self._symbols is not None and symbol not in self._symbols:
+            return get_kap_provider().get_disclosures(symbol, limit=limit)
+
+        fresh = True
+        if self.max_age and time.time() - self._polled_at >= self.max_age:
+            try:
+                self.poll()
+            except Exception as e:
+                logger.warning("KAP feed poll failed, querying %s directly: %s", symbol, e)
+                fresh = False
+
+        if not fresh or self._seeded.get(symbol, 0) < limit:
+            self._seed(symbol, limit)
+        with self._lock:
+            ids = self._by_symbol.get(symbol, [])[-limit:][::-1]
+            return _frame([self._items[i] for i in ids])
+
+    @property
+    def disclosures(self) -> pd.DataFrame:
+        """
+        All stored disclosures (newest first).
+
+        Returns:
+            DataFrame with columns: Date, Symbols, Title, URL, indexed by
+            disclosure id.
+        """
+        with self._lock:
+            items = [self._items[i] for i in sorted(self._items, reverse=True)]
+        return _frame(items, symbols=True)
+
+    def start(
+        self,
+        interval: float = 60.0,
+        callback: Callable[[pd.DataFrame], None] | None = None,
+    ) -> None:
+        """
+        Poll from a daemon thread every ``interval`` seconds.
+
+        Args:
+            interval: Seconds between polls.
+            callback: Called with each non-empty batch of new disclosures.
+        """
+        self.stop()
+        self._stop = stop = threading.Event()
+
+        def run() -> None:
+            while True:
+                try:
+                    new = self.poll()
+                    if callback is not None and not new.empty:
+                        callback(new)
+                except Exception:
+                    logger.exception("KAP feed poll failed")
+                if stop.wait(interval):
+                    return
+
+        threading.Thread(target=run, name="borsapy-kap-feed", daemon=True).start()
+
+    def stop(self) -> None:
+        """Stop the background poller if it is running."""
+        if self._stop is not None:
+            self._stop.set()
+            self._stop = None
+
+    def _seed(self, symbol: str, limit: int) -> None:
+        """Store a stock's latest disclosures from the per-stock query."""
+        records = get_kap_provider().get_disclosures(symbol, limit=limit)
+        with self._lock:
+            for record in records.to_dict("records"):
+                disclosure_id = int(record["URL"].rsplit("/", 1)[-1])
+                item = {
+                    "id": disclosure_id,
+                    "date": record["Date"],
+                    "title": record["Title"],
+                    "url": record["URL"],
+                    "symbols": (symbol,),
+                }
+                self._add(item, (symbol,))
+            self._seeded[symbol] = limit
+
+    def _wanted(self, item: dict) -> bool:
+        return self._symbols is None or not self._symbols.isdisjoint(item["symbols"])
+
+    def _add(self, item: dict, symbols: tuple[str, ...]) -> bool:
+        """Insert or merge a disclosure; True if it was new. Caller holds the lock."""
+        disclosure_id = item["id"]
+        existing = self._items.get(disclosure_id)
+        if existing is None:
+            self._items[disclosure_id] = item
+        else:
+            # Seen before (e.g. seeded, then polled): only index new symbols
+            symbols = tuple(s for s in symbols if s not in existing["symbols"])
+            existing["symbols"] += symbols
+        for symbol in symbols:
+            ids = self._by_symbol.setdefault(symbol, [])
+            if not ids or ids[-1] < disclosure_id:
+                ids.append(disclosure_id)
+            else:
+                bisect.insort(ids, disclosure_id)
+        return existing is None
+
+    def _trim(self) -> None:
+        """Drop the oldest disclosures beyond max_items. Caller holds the lock."""
+        excess = len(self._items) - self.max_items
+        if excess <= 0:
+            return
+        for disclosure_id in sorted(self._items)[:excess]:
+            for symbol in self._items.pop(disclosure_id)["symbols"]:
+                ids = self._by_symbol[symbol]
+                del ids[bisect.bisect_left(ids, disclosure_id)]
+                # Seed again if the stock no longer has a full page stored
+                if len(ids) < self._seeded.get(symbol, 0):
+                    del self._seeded[symbol]
+
+
+def _clean(symbol: str) -> str:
+    return symbol.upper().replace(".IS", "").replace(".E", "")
+
+
+def _frame(items: list[dict], symbols: bool = False) -> pd.DataFrame:
+    """Disclosure dicts as news columns, or with Symbols and ids for feed-wide views."""
+    data = {"Date": [item["date"] for item in items]}
+    if symbols:
+        data["Symbols"] = [", ".join(item["symbols"]) for item in items]
+    data["Title"] = [item["title"] for item in items]
+    data["URL"] = [item["url"] for item in items]
+    if not symbols:
+        return pd.DataFrame(data, columns=NEWS_COLUMNS)
+    index = pd.Index([item["id"] for item in items], name="DisclosureId", dtype="int64")
+    return pd.DataFrame(data, index=index)
+
+
+# Shared feed behind Ticker.news
+_feed: KAPFeed | None = None
+_feed_lock = threading.Lock()
+
+
+def get_kap_feed() -> KAPFeed:
+    """Get the process-wide all-BIST feed used by Ticker.news."""
+    global _feed
+    with _feed_lock:
+        if _feed is None:
+            _feed = KAPFeed()
+        return _feed
@@ -9,6 +9,7 @@ import pandas as pd
 
 from borsapy._providers.kap import get_kap_provider
 from borsapy._providers.paratic import get_paratic_provider
+from borsapy.news import get_kap_feed
 
 
 class FastInfo:
@@ -1012,8 +1013,9 @@ class Ticker:
         """
         Get recent KAP (Kamuyu Aydınlatma Platformu) disclosures for the stock.
 
-        Fetches directly from KAP - the official disclosure platform for
-        publicly traded companies in Turkey.
+        Fetches from KAP - the official disclosure platform for publicly
+        traded companies in Turkey - through the shared KAPFeed, so news for
+        many stocks is refreshed with one request (see borsapy.KAPFeed).
 
         Returns:
             DataFrame with columns:
@@ -1028,7 +1030,7 @@ class Ticker:
             0  29.12.2025 19:21:18  Haber ve Söylentilere İlişkin Açıklama  https://www.kap.org.tr/tr/Bildirim/1530826
             1  29.12.2025 16:11:36  Payların Geri Alınmasına İlişkin Bildirim  https://www.kap.org.tr/tr/Bildirim/1530656
         """
-        return self._get_kap().get_disclosures(self._symbol)
+        return get_kap_feed().news(self._symbol)
 
     def get_news_content(self, disclosure_id: int | str) -> str | None:
         """